@@ -0,0 +1,81 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Network-bound Fixtures: asyncio.run per Fixture versus a batch of AsyncFixtures.
+
+Run from the repository root::
+
+    python benchmarks/async_fixtures.py [count] [concurrency]
+
+Each Fixture awaits a short sleep (standing in for a request to a service).
+
+'''
+
+import asyncio
+import io
+import os
+import sys
+import time
+import unittest
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from torment import contexts  # noqa (after sys.path)
+from torment import fixtures  # noqa (after sys.path)
+
+MODULE_UUID = uuid.UUID('9a3e5c7b1d2f4e6a8b0c2d4e6f8a0b1c')
+
+
+class RunFixture(fixtures.Fixture):
+    def run(self) -> None:
+        asyncio.run(asyncio.sleep(self.seconds))
+
+
+class AwaitFixture(fixtures.AsyncFixture):
+    async def run(self) -> None:
+        await asyncio.sleep(self.seconds)
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    namespace = {}
+
+    for fixture_class in ( RunFixture, AwaitFixture, ):
+        fixtures.register_many(namespace, ( fixture_class, ), ( { 'seconds': 0.01, } for _ in range(count) ), module = __name__, uuid = uuid.uuid5(MODULE_UUID, fixture_class.__name__))
+
+    class RunTest(contexts.TestContext, metaclass = contexts.MetaContext):
+        fixture_classes = ( RunFixture, )
+
+    class AwaitTest(contexts.TestContext, metaclass = contexts.MetaContext):
+        fixture_classes = ( AwaitFixture, )
+
+    class BatchTest(contexts.TestContext, metaclass = contexts.MetaContext):
+        fixture_classes = ( AwaitFixture, )
+        async_concurrency = concurrency
+
+    for name, context in ( ( 'asyncio.run', RunTest, ), ( 'shared loop', AwaitTest, ), ( 'batch ({0})'.format(concurrency), BatchTest, ), ):
+        suite = unittest.defaultTestLoader.loadTestsFromTestCase(context)
+
+        start = time.perf_counter()
+        result = unittest.TextTestRunner(stream = io.StringIO()).run(suite)
+        elapsed = time.perf_counter() - start
+
+        print('{0:<12} {1:>5} fixtures: {2:8.3f}s ({3})'.format(name, count, elapsed, 'ok' if result.wasSuccessful() else 'FAILED'))
+
+
+if __name__ == '__main__':
+    main()
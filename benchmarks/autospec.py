@@ -0,0 +1,77 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Cost of patching a class per Fixture: plain, autospecced, and cached autospec.
+
+Run from the repository root::
+
+    python benchmarks/autospec.py [count]
+
+The patched class has 50 methods (as a client of a service might).  Each
+iteration patches it, calls a method on an instance, and stops the patch.
+
+'''
+
+import os
+import sys
+import timeit
+import unittest.mock
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from torment import contexts  # noqa (after sys.path)
+
+Client = type('Client', ( object, ), { 'method_{0}'.format(_): lambda self, a, b = None: None for _ in range(50) })
+
+
+class PatchContext(contexts.TestContext):
+    module = __name__
+
+
+def mock_patch(autospec: bool) -> None:
+    '''Patch as TestContext.patch used to (resolving and specifying each time).'''
+
+    _ = unittest.mock.patch(__name__ + '.Client', autospec = autospec or None)
+    _.start()
+
+    Client().method_0(1)
+
+    _.stop()
+
+
+def context_patch(autospec: bool) -> None:
+    context = PatchContext()
+    context.patch('Client', autospec = autospec)
+
+    Client().method_0(1)
+
+    context.doCleanups()
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    cases = (
+        ( 'mock.patch', lambda: mock_patch(False), ),
+        ( 'mock.patch(autospec)', lambda: mock_patch(True), ),
+        ( 'TestContext.patch', lambda: context_patch(False), ),
+        ( 'TestContext.patch(autospec)', lambda: context_patch(True), ),
+    )
+
+    for name, function in cases:
+        print('{0:<28} {1:8.1f}µs per patch'.format(name, timeit.timeit(function, number = count) / count * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Loading and running cheap Fixtures as methods versus as a batch.
+
+Run from the repository root::
+
+    python benchmarks/batch.py [count]
+
+Every Fixture checks a pure function of its parameters so the time measured is
+(almost) entirely torment's and unittest's overhead.
+
+'''
+
+import io
+import os
+import sys
+import time
+import unittest
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from torment import contexts  # noqa (after sys.path)
+from torment import fixtures  # noqa (after sys.path)
+
+MODULE_UUID = uuid.UUID('9b2d4f6a8c0e4b1d93f5a7c9e1b3d5f7')
+
+
+class SquareFixture(fixtures.Fixture):
+    def run(self) -> None:
+        self.result = self.parameters['x'] ** 2
+
+    def check(self) -> None:
+        self.context.assertEqual(self.result, self.expected)
+
+
+def context_class(name: str, batched: bool) -> type:
+    '''Context of SquareFixtures (batched if batched).'''
+
+    class SquareTest(contexts.TestContext, metaclass = contexts.MetaContext):
+        fixture_classes = ( SquareFixture, )
+        module = __name__
+        batch_fixtures = batched
+
+    SquareTest.__name__ = SquareTest.__qualname__ = name
+
+    return SquareTest
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    namespace = {}
+
+    fixtures.register_many(namespace, ( SquareFixture, ), ( { 'parameters': { 'x': _, }, 'expected': _ ** 2, } for _ in range(count) ), module = __name__, uuid = MODULE_UUID)
+
+    print('{0:<8} {1:>6} fixtures: {2:>8} {3:>8} {4:>8}'.format('', count, 'class', 'load', 'run'))
+
+    for batch_fixtures in ( False, True, ):
+        start = time.perf_counter()
+        context = context_class('BatchTest' if batch_fixtures else 'MethodTest', batch_fixtures)
+        created = time.perf_counter()
+        suite = unittest.defaultTestLoader.loadTestsFromTestCase(context)
+        loaded = time.perf_counter()
+        result = unittest.TextTestRunner(stream = io.StringIO()).run(suite)
+        ran = time.perf_counter()
+
+        assert result.wasSuccessful(), result.errors + result.failures
+
+        print('{0:<8} {1:>6} fixtures: {2:7.3f}s {3:7.3f}s {4:7.3f}s'.format('batched' if batch_fixtures else 'methods', count, created - start, loaded - created, ran - loaded))
+
+
+if __name__ == '__main__':
+    main()
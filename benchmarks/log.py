@@ -0,0 +1,100 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Overhead of ``torment.decorators.log`` with the torment logger silent.
+
+Run from the repository root::
+
+    python benchmarks/log.py
+
+Times a trivial method (passed a tuple of 1000 classes, like the fixture class
+tuples ``torment.fixtures.of`` is passed) undecorated, decorated with
+``log``, and, for comparison, decorated with the wrapper ``log`` used before
+(which found the method's name with ``inspect.getmembers`` and rendered every
+argument on every call).
+
+'''
+
+import functools
+import inspect
+import logging
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from torment import decorators  # noqa (after sys.path)
+
+NUMBER = 20000
+
+ARGUMENT = tuple(type('C{0}'.format(_), ( object, ), {}) for _ in range(1000))
+
+
+def legacy(function):
+    '''``log`` as it was (without a prefix).'''
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        name, my_args = function.__name__, args
+
+        if len(args):
+            members = dict(inspect.getmembers(args[0], predicate = lambda _: inspect.ismethod(_) and _.__name__ == function.__name__))
+            decorators.logger.debug('members.keys(): %s', members.keys())
+
+            if len(members):
+                name, my_args = args[0].__class__.__name__ + '.' + function.__name__, args[1:]
+
+        format_args = ( name, ', '.join(list(map(str, my_args)) + [ ' = '.join(map(str, item)) for item in kwargs.items() ]), )
+
+        decorators.logger.info('STARTING: %s(%s)', *format_args)
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            decorators.logger.info('STOPPING: %s(%s)', *format_args)
+
+    return wrapper
+
+
+class Plain(object):
+    def call(self, classes):
+        pass
+
+
+class Logged(object):
+    @decorators.log
+    def call(self, classes):
+        pass
+
+
+class Legacy(object):
+    @legacy
+    def call(self, classes):
+        pass
+
+
+def main() -> None:
+    logging.getLogger('torment').setLevel(logging.WARNING)
+
+    for case in ( Plain, Logged, Legacy, ):
+        instance = case()
+
+        seconds = timeit.timeit(lambda: instance.call(ARGUMENT), number = NUMBER)
+
+        print('{0:<8} {1:10.3f}µs per call'.format(case.__name__, seconds / NUMBER * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Cost of calling ``torment.decorators.mock`` decorated methods.
+
+Run from the repository root::
+
+    python benchmarks/mock.py [count]
+
+Calls a ``mock_`` method (already mocked, as every Fixture after the first
+finds it) count times with the torment logger silent, decorated with ``mock``
+and, for comparison, with the wrapper ``mock`` used before (which sanitized the
+name, concatenated its log messages, and created a ``threading.local`` on every
+call).
+
+'''
+
+import functools
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from torment import decorators  # noqa (after sys.path)
+
+
+def legacy(name: str):
+    '''``mock`` as it was.'''
+
+    def _(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            decorators.logger.info('STARTING: mock ' + name)
+
+            is_mocked = False
+
+            sanitized_name = name.replace('.', '_').strip('_')
+
+            state = self.__dict__.setdefault('_torment_legacy_mocked', threading.local())
+
+            if name in self.mocks_mask:
+                decorators.logger.info('STOPPING: mock ' + name + '—MASKED')
+            elif getattr(state, sanitized_name, False) or sanitized_name in vars(self.__class__).get('_torment_class_mocked', ()):
+                is_mocked = True
+
+                decorators.logger.info('STOPPING: mock ' + name + '—EXISTS')
+            else:
+                func(self, *args, **kwargs)
+
+                is_mocked = True
+
+                decorators.logger.info('STOPPING: mock ' + name)
+
+            setattr(self.__dict__.setdefault('_torment_legacy_mocked', threading.local()), sanitized_name, is_mocked)
+
+            return is_mocked
+
+        return wrapper
+
+    return _
+
+
+class Context(object):
+    mocks_mask = set()
+
+    @decorators.mock('package.module.symbol')
+    def mock_symbol(self) -> None:
+        pass
+
+    @legacy('package.module.symbol')
+    def mock_legacy(self) -> None:
+        pass
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    logging.getLogger('torment').setLevel(logging.WARNING)
+
+    context = Context()
+
+    for name in ( 'mock_symbol', 'mock_legacy', ):
+        method = getattr(context, name)
+
+        start = time.perf_counter()
+
+        for _ in range(count):
+            method()
+
+        elapsed = time.perf_counter() - start
+
+        print('{0:<12} {1:>8} calls: {2:7.3f}s ({3:.3f}µs per call)'.format(name, count, elapsed, elapsed / count * 1e6))
+
+
+if __name__ == '__main__':
+    main()
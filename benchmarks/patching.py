@@ -0,0 +1,123 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Per-Fixture mock overhead with test-scoped versus class-scoped patches.
+
+Run from the repository root::
+
+    python benchmarks/patching.py [count]
+
+Every Fixture mocks two symbols (with a return value) and calls them once.
+The overhead is the time per Fixture beyond that of the same Fixtures without
+``mocks``.
+
+'''
+
+import io
+import os
+import sys
+import time
+import unittest
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from torment import contexts  # noqa (after sys.path)
+from torment import decorators  # noqa (after sys.path)
+from torment import fixtures  # noqa (after sys.path)
+
+MODULE_UUID = uuid.UUID('5e7a9c1b3d5f4a6c8e0a2c4e6a8c0e2a')
+
+
+def fetch():
+    return 'fetched'
+
+
+def store():
+    return 'stored'
+
+
+class CallFixture(fixtures.Fixture):
+    def run(self) -> None:
+        self.result = ( fetch(), store(), )
+
+
+class PlainFixture(CallFixture):
+    pass
+
+
+class MockedFixture(CallFixture):
+    pass
+
+
+def context_class(name: str, fixture_class: type, patch_scope: str) -> type:
+    '''Context of fixture_class' Fixtures patching with patch_scope.'''
+
+    class PatchTest(contexts.TestContext, metaclass = contexts.MetaContext):
+        fixture_classes = ( fixture_class, )
+        module = __name__
+
+        @decorators.mock('fetch')
+        def mock_fetch(self) -> None:
+            self.patch('fetch')
+
+        @decorators.mock('store')
+        def mock_store(self) -> None:
+            self.patch('store')
+
+    PatchTest.__name__ = PatchTest.__qualname__ = name
+    PatchTest.patch_scope = patch_scope
+
+    return PatchTest
+
+
+def seconds(context: type, count: int) -> float:
+    suite = unittest.defaultTestLoader.loadTestsFromTestCase(context)
+
+    assert suite.countTestCases() == count
+
+    start = time.perf_counter()
+    result = unittest.TextTestRunner(stream = io.StringIO()).run(suite)
+    elapsed = time.perf_counter() - start
+
+    assert result.wasSuccessful(), result.errors + result.failures
+
+    return elapsed
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    namespace = {}
+
+    fixtures.register_many(namespace, ( PlainFixture, ), ( {} for _ in range(count) ), module = __name__, uuid = uuid.uuid5(MODULE_UUID, 'plain'))
+    fixtures.register_many(namespace, ( MockedFixture, ), ( {
+        'mocks': {
+            'fetch': { 'return_value': _, },
+            'store': { 'return_value': _, },
+        },
+    } for _ in range(count) ), module = __name__, uuid = uuid.uuid5(MODULE_UUID, 'mocked'))
+
+    baseline = seconds(context_class('PlainTest', PlainFixture, 'test'), count) / count
+
+    print('{0:<8} {1:>6} fixtures: {2:8.1f}µs per fixture'.format('no mocks', count, baseline * 1e6))
+
+    for patch_scope in ( 'test', 'class', ):
+        elapsed = seconds(context_class(patch_scope.title() + 'PatchTest', MockedFixture, patch_scope), count) / count
+
+        print('{0:<8} {1:>6} fixtures: {2:8.1f}µs per fixture ({3:+.1f}µs for mocks)'.format(patch_scope, count, elapsed * 1e6, ( elapsed - baseline ) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Registration cost versus stack depth and number of loaded modules.
+
+Run from the repository root::
+
+    python benchmarks/register.py
+
+Times ``torment.fixtures.register`` (with and without the explicit
+``module``/``uuid`` form) and, for comparison, the ``inspect.stack`` plus
+``inspect.getmodule`` caller discovery it used to perform.
+
+'''
+
+import inspect
+import os
+import sys
+import timeit
+import types
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+NUMBER = 200
+
+MODULE_UUID = uuid.UUID('4b1f9c4fbd2e4c5e9a0c8a8e4f7d2c61')
+MODULE_NAME = 'benchmark_register_' + MODULE_UUID.hex
+
+SOURCE = '''
+from torment import fixtures
+
+
+def nest(depth, function):
+    if depth:
+        return nest(depth - 1, function)
+
+    return function()
+
+
+def register(namespace):
+    fixtures.register(namespace, ( fixtures.Fixture, ), {})
+
+
+def register_explicit(namespace, module, uuid):
+    fixtures.register(namespace, ( fixtures.Fixture, ), {}, module = module, uuid = uuid)
+'''
+
+
+def fixture_module() -> types.ModuleType:
+    '''Module whose file name carries a UUID (like a real fixture file).'''
+
+    module = types.ModuleType(MODULE_NAME)
+    module.__file__ = MODULE_NAME + '.py'
+
+    sys.modules[MODULE_NAME] = module
+    exec(compile(SOURCE, module.__file__, 'exec'), module.__dict__)
+
+    return module
+
+
+def legacy():
+    '''Caller discovery as register performed it before.'''
+
+    caller_frame = inspect.stack()[1]
+
+    return caller_frame[1], inspect.getmodule(caller_frame[0])
+
+
+def measure(module: types.ModuleType, depth: int, function, namespace) -> float:
+    '''Microseconds per call of function when called depth frames deep.
+
+    The namespace is emptied before each call so the (separate) cost of probing
+    for a unique class name doesn't pollute the measurement.
+
+    '''
+
+    def call():
+        namespace.clear()
+        module.nest(depth, function)
+
+    return timeit.timeit(call, number = NUMBER) / NUMBER * 1e6
+
+
+def main() -> None:
+    module = fixture_module()
+
+    namespace = {}
+
+    cases = (
+        ( '(nesting only)', lambda: None, ),
+        ( 'inspect.stack + getmodule', legacy, ),
+        ( 'register', lambda: module.register(namespace), ),
+        ( 'register(module, uuid)', lambda: module.register_explicit(namespace, MODULE_NAME, MODULE_UUID), ),
+    )
+
+    print('{0:<28} {1:>8} {2:>8} {3:>14}'.format('µs per call', 'depth 1', 'depth 200', '+5000 modules'))
+
+    for name, function in cases:
+        shallow = measure(module, 1, function, namespace)
+        deep = measure(module, 200, function, namespace)
+
+        extra = [ 'benchmark_register_extra_{0}'.format(_) for _ in range(5000) ]
+        sys.modules.update({ _: types.ModuleType(_) for _ in extra })
+
+        try:
+            loaded = measure(module, 1, function, namespace)
+        finally:
+            for _ in extra:
+                del sys.modules[_]
+
+        print('{0:<28} {1:>8.1f} {2:>8.1f} {3:>14.1f}'.format(name, shallow, deep, loaded))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Registering a data-driven module: register in a loop versus register_many.
+
+Run from the repository root::
+
+    python benchmarks/register_many.py [count]
+
+Each fixture shares a moderately sized ``expected`` structure (as data-driven
+fixtures built from a common base tend to).
+
+'''
+
+import os
+import sys
+import time
+import types
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+MODULE_UUID = uuid.UUID('0d1e4b7f6a2c4f0f9a4e2b3c5d6e7f80')
+MODULE_NAME = 'benchmark_register_many_' + MODULE_UUID.hex
+
+SOURCE = '''
+from torment import fixtures
+
+EXPECTED = { str(_): list(range(20)) for _ in range(20) }
+
+
+def properties(count):
+    return ( { 'parameters': { 'x': _, }, 'expected': EXPECTED, } for _ in range(count) )
+
+
+def register(namespace, count):
+    for props in properties(count):
+        fixtures.register(namespace, ( fixtures.Fixture, ), props)
+
+
+def register_many(namespace, count):
+    fixtures.register_many(namespace, ( fixtures.Fixture, ), properties(count))
+'''
+
+
+def fixture_module() -> types.ModuleType:
+    '''Module whose file name carries a UUID (like a real fixture file).'''
+
+    module = types.ModuleType(MODULE_NAME)
+    module.__file__ = MODULE_NAME + '.py'
+
+    sys.modules[MODULE_NAME] = module
+    exec(compile(SOURCE, module.__file__, 'exec'), module.__dict__)
+
+    return module
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    module = fixture_module()
+
+    for name in ( 'register', 'register_many', ):
+        namespace = {}
+
+        start = time.perf_counter()
+        getattr(module, name)(namespace, count)
+        elapsed = time.perf_counter() - start
+
+        print('{0:<14} {1:>6} fixtures: {2:8.3f}s'.format(name, len(namespace), elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Collecting a large parametric family: register_many versus register_product.
+
+Run from the repository root::
+
+    python benchmarks/register_product.py [count]
+
+Times registering the family, building a context for it, and collecting its
+test cases with ``unittest``, plus the memory still allocated afterwards.
+
+'''
+
+import os
+import sys
+import time
+import tracemalloc
+import types
+import unittest
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+MODULE_UUID = uuid.UUID('9a5e3f1c2b7d4c8e8f6a0b1c2d3e4f50')
+MODULE_NAME = 'benchmark_register_product_' + MODULE_UUID.hex
+
+SOURCE = '''
+import functools
+import math
+
+from torment import contexts
+from torment import fixtures
+from torment import helpers
+
+
+class ProductFixture(fixtures.Fixture):
+    def run(self):
+        pass
+
+
+def axes(count):
+    width = int(math.sqrt(count))
+
+    return [
+        { 'parameters': tuple({ 'x': _, } for _ in range(width)), },
+        { 'expected': tuple(range(count // width)), },
+    ]
+
+
+def register_many(namespace, count):
+    class Fixture(ProductFixture):
+        pass
+
+    fixtures.register_many(namespace, ( Fixture, ), ( functools.reduce(helpers.merge, combination, { 'parameters': {}, }) for combination in helpers.evert(axes(count)) ))
+
+    return Fixture
+
+
+def register_product(namespace, count):
+    class Fixture(ProductFixture):
+        pass
+
+    fixtures.register_product(namespace, ( Fixture, ), { 'parameters': {}, }, axes(count))
+
+    return Fixture
+
+
+def context(fixture_class):
+    class ProductTest(contexts.TestContext, metaclass = contexts.MetaContext):
+        fixture_classes = ( fixture_class, )
+
+    return ProductTest
+'''
+
+
+def fixture_module() -> types.ModuleType:
+    '''Module whose file name carries a UUID (like a real fixture file).'''
+
+    module = types.ModuleType(MODULE_NAME)
+    module.__file__ = MODULE_NAME + '.py'
+
+    sys.modules[MODULE_NAME] = module
+    exec(compile(SOURCE, module.__file__, 'exec'), module.__dict__)
+
+    return module
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    module = fixture_module()
+
+    for name in ( 'register_many', 'register_product', ):
+        namespace = {}
+
+        tracemalloc.start()
+        start = time.perf_counter()
+
+        fixture_class = getattr(module, name)(namespace, count)
+        registered = time.perf_counter()
+
+        context = module.context(fixture_class)
+        generated = time.perf_counter()
+
+        suite = unittest.defaultTestLoader.loadTestsFromTestCase(context)
+        collected = time.perf_counter()
+
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print('{0:<16} {1:>7} cases: register {2:7.3f}s context {3:7.3f}s collect {4:7.3f}s {5:8.1f} MiB'.format(name, suite.countTestCases(), registered - start, generated - registered, collected - generated, current / 2 ** 20))
+
+        del suite, context, fixture_class, namespace
+
+
+if __name__ == '__main__':
+    main()
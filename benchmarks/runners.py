@@ -0,0 +1,108 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Fixtures run serially versus with ParallelTestRunner and ThreadedTestRunner.
+
+Run from the repository root::
+
+    python benchmarks/runners.py [count] [workers]
+
+CPU-bound Fixtures spin for a fixed amount of work in ``run`` and I/O-bound
+Fixtures sleep (standing in for waiting on a containerized service).
+
+'''
+
+import io
+import os
+import sys
+import tempfile
+import time
+import unittest
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from torment import runners  # noqa (after sys.path)
+
+MODULE_UUID = uuid.UUID('2f8a6c4e1d3b4a5c9e7f0a1b2c3d4e5f')
+MODULE_NAME = 'benchmark_runners_' + MODULE_UUID.hex
+
+SOURCE = '''
+import os
+import time
+
+from torment import contexts
+from torment import fixtures
+
+
+class SpinFixture(fixtures.Fixture):
+    def run(self):
+        self.total = sum(_ * _ for _ in range(self.work))
+
+    def check(self):
+        self.context.assertGreater(self.total, 0)
+
+
+class SleepFixture(fixtures.Fixture):
+    def run(self):
+        time.sleep(self.seconds)
+
+
+for _ in range(int(os.environ.get('BENCHMARK_COUNT', '64'))):
+    fixtures.register(globals(), ( SpinFixture, ), { 'work': 200000, })
+    fixtures.register(globals(), ( SleepFixture, ), { 'seconds': 0.02, })
+
+
+class SpinTest(contexts.TestContext, metaclass = contexts.MetaContext):
+    fixture_classes = ( SpinFixture, )
+
+
+class SleepTest(contexts.TestContext, metaclass = contexts.MetaContext):
+    fixture_classes = ( SleepFixture, )
+'''
+
+
+def main() -> None:
+    count = sys.argv[1] if len(sys.argv) > 1 else '64'
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+
+    os.environ['BENCHMARK_COUNT'] = count
+
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, MODULE_NAME + '.py'), 'w') as module_file:
+            module_file.write(SOURCE)
+
+        sys.path.insert(0, directory)
+
+        module = __import__(MODULE_NAME)
+
+        cases = (
+            ( module.SpinTest, 'serial', unittest.TextTestRunner(stream = io.StringIO()), ),
+            ( module.SpinTest, 'processes ({0})'.format(workers), runners.ParallelTestRunner(stream = io.StringIO(), workers = workers), ),
+            ( module.SleepTest, 'serial', unittest.TextTestRunner(stream = io.StringIO()), ),
+            ( module.SleepTest, 'threads (16)', runners.ThreadedTestRunner(stream = io.StringIO(), workers = 16), ),
+        )
+
+        for context, name, runner in cases:
+            suite = unittest.defaultTestLoader.loadTestsFromTestCase(context)
+
+            start = time.perf_counter()
+            result = runner.run(suite)
+            elapsed = time.perf_counter() - start
+
+            print('{0:<10} {1:<14} {2:>4} fixtures: {3:8.3f}s ({4})'.format(context.__name__, name, result.testsRun, elapsed, 'ok' if result.wasSuccessful() else 'FAILED'))
+
+
+if __name__ == '__main__':
+    main()
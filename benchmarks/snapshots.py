@@ -0,0 +1,98 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Memory and time of data-driven fixtures built from a plain versus a frozen base.
+
+Run from the repository root::
+
+    python benchmarks/snapshots.py [count]
+
+Each fixture extends a large shared base (as data-driven fixture files do) and
+is then instantiated once.
+
+'''
+
+import os
+import sys
+import time
+import tracemalloc
+import types
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+MODULE_UUID = uuid.UUID('6c2d8e1a9b4f4e7d8c0a1b2c3d4e5f60')
+MODULE_NAME = 'benchmark_snapshots_' + MODULE_UUID.hex
+
+SOURCE = '''
+from torment import fixtures
+from torment import helpers
+from torment import snapshots
+
+BASE = {
+    'parameters': { 'rows': [ { 'id': _, 'tags': [ 'a', 'b', ], } for _ in range(50) ], },
+    'expected': { str(_): list(range(20)) for _ in range(20) },
+}
+
+FROZEN = snapshots.freeze(BASE)
+
+
+def register(namespace, base, count):
+    fixtures.register_many(namespace, ( fixtures.Fixture, ), ( helpers.merge(base, { 'parameters': { 'n': _, }, }) for _ in range(count) ))
+
+
+def plain(namespace, count):
+    register(namespace, BASE, count)
+
+
+def frozen(namespace, count):
+    register(namespace, FROZEN, count)
+'''
+
+
+def fixture_module() -> types.ModuleType:
+    '''Module whose file name carries a UUID (like a real fixture file).'''
+
+    module = types.ModuleType(MODULE_NAME)
+    module.__file__ = MODULE_NAME + '.py'
+
+    sys.modules[MODULE_NAME] = module
+    exec(compile(SOURCE, module.__file__, 'exec'), module.__dict__)
+
+    return module
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+
+    module = fixture_module()
+
+    for name in ( 'plain', 'frozen', ):
+        namespace = {}
+
+        tracemalloc.start()
+        start = time.perf_counter()
+
+        getattr(module, name)(namespace, count)
+        instances = [ cls(None) for cls in namespace.values() ]
+
+        elapsed = time.perf_counter() - start
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print('{0:<8} {1:>6} fixtures: {2:8.3f}s {3:10.1f} MiB'.format(name, len(instances), elapsed, current / 2 ** 20))
+
+
+if __name__ == '__main__':
+    main()
@@ -44,8 +44,7 @@ PARAMS['classifiers'] = [
     'Natural Language :: English',
     'Operating System :: OS Independent',
     'Programming Language :: Python :: 3',
-    'Programming Language :: Python :: 3.4',
-    'Programming Language :: Python :: 3.5',
+    'Programming Language :: Python :: 3.8',
     'Programming Language :: Python :: 3 :: Only',
     'Topic :: Software Development :: Libraries',
     'Topic :: Software Development :: Libraries :: Python Modules',
@@ -62,6 +61,8 @@ PARAMS['keywords'] = [
 
 PARAMS['packages'] = find_packages(exclude = ( 'test_*', ))
 
+PARAMS['python_requires'] = '>=3.8'
+
 PARAMS['install_requires'] = [
     'mypy-lang',
 ]
@@ -12,12 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import gc
+import inspect
+import io
 import logging
+import threading
 import typing  # noqa (use mypy typing)
 import unittest
 import unittest.mock
+import uuid
+
+from typing import Any
+from typing import Tuple
 
 from torment import contexts
+from torment import decorators
+from torment import fixtures
 
 logger = logging.getLogger(__name__)
 
@@ -26,10 +37,19 @@ def PATCH():
     return 'not patched'
 
 
+def patched():
+    return 'not patched'
+
+
+class Patched(object):
+    def method(self, a):
+        return a
+
+
 class MetaContextGenerateCasesUnitTest(unittest.TestCase):
     def setUp(self) -> None:
-        _ = unittest.mock.patch('torment.contexts.fixtures.of')
-        self.mocked_fixtures_of = _.start()
+        _ = unittest.mock.patch('torment.contexts.fixtures.classes_of')
+        self.mocked_fixtures_classes_of = _.start()
         self.addCleanup(_.stop)
 
         self.directory = [
@@ -59,6 +79,7 @@ class MetaContextGenerateCasesUnitTest(unittest.TestCase):
             '__subclasshook__',
             '__weakref__',
             'docker_compose_services',
+            'mockers',
             'mocks',
             'mocks_mask',
         ]
@@ -75,7 +96,7 @@ class MetaContextGenerateCasesUnitTest(unittest.TestCase):
     def test_zero_fixture_classes(self) -> None:
         '''torment.contexts.MetaContext: len(fixture_classes) == 0'''
 
-        self.mocked_fixtures_of.return_value = []
+        self.mocked_fixtures_classes_of.return_value = []
 
         class zero_fixture_classes(object, metaclass = contexts.MetaContext):
             fixture_classes = ()
@@ -88,27 +109,298 @@ class MetaContextGenerateCasesUnitTest(unittest.TestCase):
         '''torment.contexts.MetaContext: len(fixture_classes) > 0'''
 
         class dummy_fixture_a(object):
-            @property
-            def name(self) -> str:
-                return 'test_method'
+            def __init__(self, context) -> None:
+                raise AssertionError('fixture created with its context class')
 
-            @property
-            def description(self) -> str:
-                return 'test_method'
-
-        self.mocked_fixtures_of.return_value = [ dummy_fixture_a(), ]
+        self.mocked_fixtures_classes_of.return_value = [ dummy_fixture_a, ]
 
         class many_fixture_classes(object, metaclass = contexts.MetaContext):
             fixture_classes = ( dummy_fixture_a, )
 
         self.directory.extend([
             'fixture_classes',
-            'test_method',
+            'test_dummy_fixture_a',
         ])
 
         self.assertCountEqual(dir(many_fixture_classes), self.directory)
 
 
+class MetaContextDeferredUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.created = created = []  # type: typing.List[Any]
+
+        class DeferredFixture(fixtures.Fixture):
+            def __init__(self, context: contexts.TestContext) -> None:
+                super().__init__(context)
+
+                created.append(context)
+
+            @property
+            def description(self) -> str:
+                return 'deferred'
+
+            def run(self) -> None:
+                pass
+
+        class Fixture(DeferredFixture):
+            pass
+
+        self.fixture_class = Fixture
+
+        class DeferredTest(contexts.TestContext, metaclass = contexts.MetaContext):
+            fixture_classes = ( DeferredFixture, )
+
+        self.context_class = DeferredTest
+
+    def test_deferred_creation(self) -> None:
+        '''torment.contexts.MetaContext: creates no Fixtures'''
+
+        self.assertEqual(unittest.defaultTestLoader.getTestCaseNames(self.context_class), [ 'test_Fixture', ])
+        self.assertEqual(self.created, [])
+
+    def test_collected(self) -> None:
+        '''torment.contexts.MetaContext: Fixture test methods are functions (as test loaders expect)'''
+
+        method = getattr(self.context_class, 'test_Fixture')
+
+        self.assertTrue(inspect.isfunction(method))
+        self.assertEqual(method.__qualname__, self.context_class.__qualname__ + '.test_Fixture')
+        self.assertEqual(method.__module__, self.context_class.__module__)
+
+        self.assertEqual(unittest.defaultTestLoader.loadTestsFromTestCase(self.context_class).countTestCases(), 1)
+        self.assertEqual(self.created, [])
+
+    def test_deferred_run(self) -> None:
+        '''torment.contexts.MetaContext: Fixture created once when described and run'''
+
+        context = self.context_class('test_Fixture')
+
+        self.assertEqual(context.shortDescription(), self.fixture_class.__name__ + '—' + context.module)
+        self.assertEqual(self.created, [])
+
+        result = unittest.TestResult()
+        context.run(result)
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(self.created, [ context, ])
+
+        self.assertEqual(context.shortDescription(), 'deferred')
+        self.assertEqual(self.created, [ context, ])
+
+    def test_failed_creation(self) -> None:
+        '''torment.contexts.MetaContext: Fixture creation fails'''
+
+        class FailingFixture(fixtures.Fixture):
+            def initialize(self) -> None:
+                raise RuntimeError('initialize')
+
+        ns = {}  # type: typing.Dict[str, Any]
+
+        fixtures.register(ns, ( FailingFixture, ), {}, module = __name__, uuid = uuid.uuid4())
+
+        class FailingTest(contexts.TestContext, metaclass = contexts.MetaContext):
+            fixture_classes = ( FailingFixture, )
+
+        for verbosity in ( 1, 2, ):
+            result = unittest.TextTestRunner(stream = io.StringIO(), verbosity = verbosity).run(unittest.defaultTestLoader.loadTestsFromTestCase(FailingTest))
+
+            self.assertEqual(result.testsRun, 1)
+            self.assertEqual(len(result.errors), 1)
+            self.assertIn(list(ns.values())[0].uuid.hex, str(result.errors[0][0]))
+
+
+class MetaContextProductUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.runs = runs = []  # type: typing.List[Any]
+
+        class ProductFixture(fixtures.Fixture):
+            @property
+            def description(self) -> str:
+                return 'x = {0.x}'.format(self)
+
+            def run(self) -> None:
+                runs.append(( self.x, self.context, ))
+
+        self.product = fixtures.register_product({}, ( ProductFixture, ), {}, [ { 'x': ( 1, 2, ), }, ], module = __name__, uuid = uuid.uuid4())
+
+        class ProductTest(contexts.TestContext, metaclass = contexts.MetaContext):
+            fixture_classes = ( ProductFixture, )
+
+        self.context_class = ProductTest
+
+        self.addCleanup(gc.collect)
+        self.addCleanup(vars(self).pop, 'product', None)
+        self.addCleanup(vars(self).pop, 'context_class', None)
+
+    def test_product_cases(self) -> None:
+        '''torment.contexts.MetaContext: fixture_classes with a FixtureProduct'''
+
+        names = unittest.defaultTestLoader.getTestCaseNames(self.context_class)
+
+        self.assertEqual(names, [ self.product.name(0), self.product.name(1), ])
+        self.assertTrue(all(inspect.isfunction(getattr(self.context_class, _)) for _ in names))
+        self.assertEqual(unittest.defaultTestLoader.loadTestsFromTestCase(self.context_class).countTestCases(), 2)
+
+        self.assertEqual(len(self.product.namespace), 1)
+
+    def test_product_case_run(self) -> None:
+        '''torment.contexts.MetaContext: FixtureProduct case runs its Fixture'''
+
+        context = self.context_class(self.product.name(1))
+
+        self.assertEqual(context.shortDescription(), self.product.uuid_of(1).hex + '—' + context.module)
+
+        result = unittest.TestResult()
+        context.run(result)
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(self.runs, [ ( 2, context, ), ])
+
+        self.assertEqual(context.shortDescription(), 'x = 2')
+
+
+class MetaContextShardUnitTest(unittest.TestCase):
+    def test_shard(self) -> None:
+        '''torment.contexts.MetaContext: shard = '1/2' '''
+
+        class ShardFixture(fixtures.Fixture):
+            pass
+
+        ns = {}  # type: typing.Dict[str, Any]
+
+        fixtures.register_many(ns, ( ShardFixture, ), [ {} ] * 20, module = __name__, uuid = uuid.uuid4())
+        product = fixtures.register_product({}, ( ShardFixture, ), {}, [ { 'a': tuple(range(20)), }, ], module = __name__, uuid = uuid.uuid4())
+
+        class ShardTest(contexts.TestContext, metaclass = contexts.MetaContext):
+            fixture_classes = ( ShardFixture, )
+            shard = '1/2'
+
+        self.addCleanup(gc.collect)
+
+        expected = [ 'test_' + _.__name__ for _ in ns.values() if fixtures.shard_of(_.uuid, 2) == 1 ]
+        expected.extend(product.name(_) for _ in product.indices(shard = '1/2'))
+
+        self.assertCountEqual(unittest.defaultTestLoader.getTestCaseNames(ShardTest), expected)
+
+
+class MetaContextAsyncUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.running = running = { 'now': 0, 'peak': 0, }  # type: typing.Dict[str, int]
+        self.loops = loops = set()  # type: typing.Set[Any]
+
+        class SleepFixture(fixtures.AsyncFixture):
+            async def run(self) -> None:
+                loops.add(asyncio.get_running_loop())
+
+                running['now'] += 1
+                running['peak'] = max(running['peak'], running['now'])
+
+                await asyncio.sleep(0.01)
+
+                running['now'] -= 1
+
+            def check(self) -> None:
+                self.context.assertNotEqual(self.outcome, 'fail')
+
+        self.ns = {}  # type: typing.Dict[str, Any]
+
+        fixtures.register_many(self.ns, ( SleepFixture, ), [ { 'outcome': _, } for _ in ( 'pass', 'pass', 'fail', 'pass', 'pass', ) ], module = __name__, uuid = uuid.uuid4())
+        fixtures.register(self.ns, ( SleepFixture, ), { 'outcome': 'pass', 'mocks': { 'symbol': {}, }, }, module = __name__, uuid = uuid.uuid4())
+
+        self.fixture_class = SleepFixture
+
+    def run_context(self, context_class: type) -> unittest.TestResult:
+        return unittest.TextTestRunner(stream = io.StringIO()).run(unittest.defaultTestLoader.loadTestsFromTestCase(context_class))
+
+    def test_async_fixtures(self) -> None:
+        '''torment.contexts.MetaContext: AsyncFixtures without async_concurrency'''
+
+        class AsyncTest(contexts.TestContext, metaclass = contexts.MetaContext):
+            fixture_classes = ( self.fixture_class, )
+
+            def mock_symbol(self) -> None:
+                pass
+
+        self.assertEqual(len(unittest.defaultTestLoader.getTestCaseNames(AsyncTest)), 6)
+
+        result = self.run_context(AsyncTest)
+
+        self.assertEqual(result.testsRun, 6)
+        self.assertEqual(len(result.failures), 1)
+        self.assertEqual(self.running['peak'], 1)
+        self.assertEqual(len(self.loops), 1)
+
+    def test_async_batch(self) -> None:
+        '''torment.contexts.MetaContext: AsyncFixtures with async_concurrency = 2'''
+
+        class AsyncTest(contexts.TestContext, metaclass = contexts.MetaContext):
+            fixture_classes = ( self.fixture_class, )
+            async_concurrency = 2
+
+            def mock_symbol(self) -> None:
+                pass
+
+        names = unittest.defaultTestLoader.getTestCaseNames(AsyncTest)
+
+        self.assertEqual(len(names), 2)
+        self.assertIn('test_async_fixtures', names)
+        self.assertTrue(inspect.isfunction(AsyncTest.test_async_fixtures))
+        self.assertEqual(AsyncTest('test_async_fixtures').shortDescription(), 'AsyncFixtures of AsyncTest (concurrently)')
+
+        result = self.run_context(AsyncTest)
+
+        self.assertEqual(result.testsRun, 2)
+        self.assertEqual(len(result.failures), 1)
+        self.assertIn('fixture=', str(result.failures[0][0]))
+        self.assertEqual(self.running['peak'], 2)
+        self.assertEqual(len(self.loops), 1)
+
+
+class MetaContextBatchUnitTest(unittest.TestCase):
+    def test_batch_fixtures(self) -> None:
+        '''torment.contexts.MetaContext: batch_fixtures = True'''
+
+        calls, seen = [], []  # type: Tuple[typing.List[Any], typing.List[Any]]
+
+        class BatchFixture(fixtures.Fixture):
+            def run(self) -> None:
+                seen.append(( self.context, patched(), ))
+
+            def check(self) -> None:
+                self.context.assertNotEqual(patched(), 1)
+
+        ns = {}  # type: typing.Dict[str, Any]
+
+        fixtures.register_many(ns, ( BatchFixture, ), [ { 'mocks': { 'patched': { 'return_value': _, }, }, } for _ in range(3) ], module = __name__, uuid = uuid.uuid4())
+
+        class BatchTest(contexts.TestContext, metaclass = contexts.MetaContext):
+            fixture_classes = ( BatchFixture, )
+            module = __name__
+            batch_fixtures = True
+
+            @decorators.mock('patched')
+            def mock_patched(self) -> None:
+                calls.append(self)
+
+                self.patch('patched')
+
+        self.assertEqual(unittest.defaultTestLoader.getTestCaseNames(BatchTest), [ 'test_fixtures', ])
+        self.assertTrue(inspect.isfunction(BatchTest.test_fixtures))
+        self.assertEqual(BatchTest('test_fixtures').shortDescription(), 'Fixtures of BatchTest (batched)')
+
+        result = unittest.TextTestRunner(stream = io.StringIO()).run(unittest.defaultTestLoader.loadTestsFromTestCase(BatchTest))
+
+        self.assertEqual(result.testsRun, 1)
+        self.assertEqual(len(result.failures), 1)
+        self.assertEqual(sum(_.uuid.hex in str(result.failures[0][0]) for _ in ns.values()), 1)
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(len(set(id(_[0]) for _ in seen)), 1)
+        self.assertCountEqual([ _[1] for _ in seen ], [ 0, 1, 2, ])
+
+        self.assertEqual(patched(), 'not patched')
+
+
 class TestContextPropertyUnitTest(unittest.TestCase):
     def setUp(self) -> None:
         self.c = contexts.TestContext()
@@ -130,20 +422,239 @@ class TestContextPropertyUnitTest(unittest.TestCase):
 
         self.assertEqual(self.c.module, 'torment.fixtures')
 
+    def test_testcontext_is_mocked(self) -> None:
+        '''torment.contexts.TestContext()._is_mocked_foo_bar → decorators.is_mocked(…, 'foo.bar')'''
 
-class TestContextPatchUnitTest(unittest.TestCase):
-    def test_testcontext_patch(self) -> None:
-        '''torment.contexts.TestContext().patch('PATCH')'''
+        class MockContext(contexts.TestContext):
+            @decorators.mock('foo.bar')
+            def mock_foo_bar(self) -> None:
+                pass
+
+        c = MockContext()
+
+        self.assertFalse(c._is_mocked_foo_bar)
+
+        c.mock_foo_bar()
 
+        self.assertTrue(c._is_mocked_foo_bar)
+
+        with self.assertRaises(AttributeError):
+            c.missing
+
+
+class TestContextPatchUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
         logger.debug('self.__module__: %s', self.__module__)
 
         _ = unittest.mock.patch.object(contexts.TestContext, 'module', self.__module__)
         _.start()
         self.addCleanup(_.stop)
 
+    def test_testcontext_patch(self) -> None:
+        '''torment.contexts.TestContext().patch('PATCH')'''
+
         c = contexts.TestContext()
+        self.addCleanup(c.doCleanups)
 
         c.patch('PATCH')
 
         self.assertTrue(hasattr(c, 'mocked_PATCH'))
         self.assertIsInstance(c.mocked_PATCH, unittest.mock.MagicMock)
+
+    def test_testcontext_patch_other_thread(self) -> None:
+        '''torment.contexts.TestContext().patch('PATCH') while patched by another thread → waits'''
+
+        c, d = contexts.TestContext(), contexts.TestContext()
+        self.addCleanup(c.doCleanups)
+        self.addCleanup(d.doCleanups)
+
+        patched, finished = threading.Event(), threading.Event()
+        self.addCleanup(finished.set)
+
+        def patching() -> None:
+            c.patch('PATCH')
+            patched.set()
+
+            finished.wait(5)
+            c.doCleanups()
+
+        thread = threading.Thread(target = patching)
+        thread.start()
+
+        self.assertTrue(patched.wait(5))
+
+        waiting = threading.Thread(target = d.patch, args = ( 'PATCH', ))
+        waiting.start()
+        waiting.join(0.1)
+
+        self.assertTrue(waiting.is_alive())
+        self.assertFalse(hasattr(d, 'mocked_PATCH'))
+
+        finished.set()
+        thread.join(5)
+
+        waiting.join(5)
+
+        self.assertFalse(waiting.is_alive())
+        self.assertIs(PATCH, d.mocked_PATCH)
+
+        d.doCleanups()
+
+        self.assertEqual(PATCH(), 'not patched')
+
+
+class TestContextAutospecUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        _ = unittest.mock.patch.object(contexts.TestContext, 'module', self.__module__)
+        _.start()
+        self.addCleanup(_.stop)
+
+    def test_testcontext_patch_autospec(self) -> None:
+        '''torment.contexts.TestContext().patch('patched', autospec = True) reuses its template'''
+
+        c = contexts.TestContext()
+        c.patch('patched', autospec = True)
+
+        c.mocked_patched.return_value = 'a'
+
+        self.assertEqual(patched(), 'a')
+
+        with self.assertRaises(TypeError):
+            patched('unexpected')
+
+        first = c.mocked_patched
+        c.doCleanups()
+
+        self.assertEqual(patched(), 'not patched')
+
+        d = contexts.TestContext()
+        self.addCleanup(d.doCleanups)
+
+        d.patch('patched', autospec = True)
+
+        self.assertIs(d.mocked_patched, first)
+        self.assertFalse(d.mocked_patched.called)
+        self.assertIsNot(patched(), 'a')
+
+    def test_testcontext_patch_autospec_class(self) -> None:
+        '''torment.contexts.TestContext().patch('Patched', autospec = True) keeps its instance spec'''
+
+        for _ in range(2):
+            c = contexts.TestContext()
+            c.patch('Patched', autospec = True)
+
+            Patched().method(1)
+
+            c.mocked_Patched.return_value.method.assert_called_once_with(1)
+
+            with self.assertRaises(TypeError):
+                Patched().method()
+
+            c.doCleanups()
+
+        self.assertEqual(Patched().method(1), 1)
+
+
+class ResolveUnitTest(unittest.TestCase):
+    def test_resolve_module(self) -> None:
+        '''torment.contexts._resolve('wsgiref.util.guess_scheme') → ( wsgiref.util, 'guess_scheme', )'''
+
+        holder, symbol = contexts._resolve('wsgiref.util.guess_scheme')
+
+        self.assertEqual(holder.__name__, 'wsgiref.util')
+        self.assertEqual(symbol, 'guess_scheme')
+
+        self.assertIs(contexts._resolve('wsgiref.util.guess_scheme')[0], holder)
+
+    def test_resolve_class(self) -> None:
+        '''torment.contexts._resolve('….Patched.method') → ( Patched, 'method', )'''
+
+        target = __name__ + '.Patched.method'
+
+        self.assertEqual(contexts._resolve(target), ( Patched, 'method', ))
+        self.assertNotIn(target, contexts._TARGETS)
+
+    def test_resolve_missing(self) -> None:
+        '''torment.contexts._resolve('torment.missing.symbol') → ImportError'''
+
+        with self.assertRaises(ImportError):
+            contexts._resolve('torment.missing.symbol')
+
+
+class TestContextClassPatchUnitTest(unittest.TestCase):
+    def test_testcontext_class_patch(self) -> None:
+        '''torment.contexts.TestContext().patch('patched') with patch_scope = 'class' '''
+
+        calls, seen = [], []  # type: Tuple[typing.List[Any], typing.List[Any]]
+
+        class PatchFixture(fixtures.Fixture):
+            def run(self) -> None:
+                seen.append(( self.context.mocked_patched, patched(), str(self.context.mocked_patched), ))
+
+        ns = {}  # type: typing.Dict[str, Any]
+
+        fixtures.register_many(ns, ( PatchFixture, ), [ { 'mocks': { 'patched': { 'return_value': _, }, }, } for _ in range(3) ], module = __name__, uuid = uuid.uuid4())
+
+        class ClassPatchTest(contexts.TestContext, metaclass = contexts.MetaContext):
+            fixture_classes = ( PatchFixture, )
+            module = __name__
+            patch_scope = 'class'
+
+            @decorators.mock('patched')
+            def mock_patched(self) -> None:
+                calls.append(self)
+
+                self.patch('patched')
+
+        result = unittest.TextTestRunner(stream = io.StringIO()).run(unittest.defaultTestLoader.loadTestsFromTestCase(ClassPatchTest))
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(set(id(_[0]) for _ in seen)), 1)
+        self.assertCountEqual([ _[1] for _ in seen ], [ 0, 1, 2, ])
+        self.assertTrue(all(isinstance(_[2], str) for _ in seen))
+
+        self.assertEqual(patched(), 'not patched')
+        self.assertFalse(hasattr(ClassPatchTest, 'mocked_patched'))
+
+    def test_testcontext_class_patch_concurrent(self) -> None:
+        '''torment.contexts.TestContext().patch('patched') with patch_scope = 'class' from two threads at once'''
+
+        class ClassPatchTest(contexts.TestContext):
+            module = __name__
+            patch_scope = 'class'
+
+        contexts_ = [ ClassPatchTest(), ClassPatchTest(), ]
+        self.addCleanup(ClassPatchTest.doClassCleanups)
+
+        barrier, errors = threading.Barrier(2, timeout = 5), []  # type: Tuple[threading.Barrier, typing.List[Exception]]
+
+        resolve = contexts._resolve
+
+        def _resolve(target: str) -> Tuple[Any, str]:
+            barrier.wait()
+
+            return resolve(target)
+
+        def patching(context: contexts.TestContext) -> None:
+            try:
+                context.patch('patched')
+            except Exception as error:
+                errors.append(error)
+
+        with unittest.mock.patch.object(contexts, '_resolve', _resolve):
+            threads = [ threading.Thread(target = patching, args = ( _, )) for _ in contexts_ ]
+
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join(5)
+
+        self.assertEqual(errors, [])
+        self.assertIs(contexts_[0].mocked_patched, contexts_[1].mocked_patched)
+        self.assertIs(patched, contexts_[0].mocked_patched)
+
+        ClassPatchTest.doClassCleanups()
+
+        self.assertEqual(patched(), 'not patched')
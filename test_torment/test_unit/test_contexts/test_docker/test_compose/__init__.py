@@ -14,7 +14,12 @@
 
 import logging
 import os
+import resource
+import stat
+import tempfile
+import time
 import unittest
+import unittest.mock
 
 from torment import contexts
 from torment import decorators
@@ -87,3 +92,56 @@ class CallWrapperUnitTest(contexts.TestContext, metaclass = contexts.MetaContext
     @decorators.mock('_call')
     def mock_call(self) -> None:
         self.patch('_call')
+
+
+FAKE_DOCKER_COMPOSE = '''#!/bin/sh
+echo "Creating $5"
+printf 'Starting' >&2
+sleep 1
+printf ' %s\\n' "$5" >&2
+seq 1 10000
+printf 'done'
+exit 3
+'''
+
+
+class CallUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        filename = os.path.join(directory.name, 'docker-compose')
+
+        with open(filename, 'w') as fh:
+            fh.write(FAKE_DOCKER_COMPOSE)
+
+        os.chmod(filename, stat.S_IRWXU)
+
+        patcher = unittest.mock.patch.dict(os.environ, { 'PATH': directory.name + os.pathsep + os.environ.get('PATH', ''), })
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_call_up(self) -> None:
+        '''torment.contexts.docker.compose.up([ 'service', ]) with a slow docker-compose'''
+
+        start_cpu, start = resource.getrusage(resource.RUSAGE_SELF), time.perf_counter()
+
+        with self.assertLogs(compose.logger, level = logging.DEBUG) as mocked_logger:
+            status = compose.up([ 'service', ])
+
+        end_cpu, end = resource.getrusage(resource.RUSAGE_SELF), time.perf_counter()
+
+        self.assertEqual(status, 3)
+
+        command = 'docker-compose up --no-color -d --no-deps service: '
+
+        stdout = [ _.getMessage() for _ in mocked_logger.records if _.levelno == logging.DEBUG ]
+        stderr = [ _.getMessage() for _ in mocked_logger.records if _.levelno == logging.ERROR ]
+
+        self.assertEqual(stdout, [ command + 'Creating service', ] + [ command + str(_) for _ in range(1, 10001) ] + [ command + 'done', ])
+        self.assertEqual(stderr, [ command + 'Starting service', ])
+
+        cpu = ( end_cpu.ru_utime + end_cpu.ru_stime ) - ( start_cpu.ru_utime + start_cpu.ru_stime )
+
+        self.assertGreaterEqual(end - start, 1)
+        self.assertLess(cpu, 0.5)
@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
 import os
+import threading
 import typing  # noqa (use mypy typing)
 import unittest
 
@@ -73,6 +75,87 @@ class DecoratorUnitTest(contexts.TestContext, metaclass = contexts.MetaContext):
     )
 
 
+class LogDecoratorTest(unittest.TestCase):
+    def test_bounded_arguments(self) -> None:
+        '''torment.decorators.log: large arguments are abbreviated'''
+
+        class foo(object):
+            @decorators.log
+            def bar(self, items, flag = False):
+                pass
+
+        with self.assertLogs(decorators.logger, level = logging.INFO) as mocked_logger:
+            foo().bar(list(range(10000)), flag = True)
+
+        self.assertEqual(mocked_logger.output[0], 'INFO:torment.decorators:STARTING: foo.bar([0, 1, 2, 3, 4, 5, ...], flag = True)')
+
+    def test_silent_exception(self) -> None:
+        '''torment.decorators.log: exceptions are logged with INFO disabled'''
+
+        @decorators.log
+        def failure(argument):
+            raise RuntimeError()
+
+        with self.assertLogs(decorators.logger, level = logging.ERROR) as mocked_logger:
+            with self.assertRaises(RuntimeError):
+                failure('argument')
+
+        self.assertEqual(len(mocked_logger.output), 1)
+        self.assertTrue(mocked_logger.output[0].startswith('ERROR:torment.decorators:EXCEPTION: failure(\'argument\')'))
+
+    def test_generator(self) -> None:
+        '''torment.decorators.log: generator function'''
+
+        @decorators.log
+        def items():
+            logger.info('ITEM')
+            yield 1
+
+            raise RuntimeError()
+
+        with self.assertLogs(level = logging.INFO) as mocked_logger:
+            iterator = items()
+
+            self.assertEqual(mocked_logger.output, [])
+
+            with self.assertRaises(RuntimeError):
+                list(iterator)
+
+        self.assertEqual([ _.splitlines()[0].split(':', 2)[2] for _ in mocked_logger.output ], [ 'STARTING: items()', 'ITEM', 'EXCEPTION: items()', 'STOPPING: items()', ])
+
+    def test_generator_closed(self) -> None:
+        '''torment.decorators.log: generator closed early'''
+
+        @decorators.log
+        def items():
+            yield from range(10)
+
+        with self.assertLogs(decorators.logger, level = logging.INFO) as mocked_logger:
+            iterator = items()
+
+            self.assertEqual(next(iterator), 0)
+
+            iterator.close()
+
+        self.assertEqual(mocked_logger.output, [ 'INFO:torment.decorators:STARTING: items()', 'INFO:torment.decorators:STOPPING: items()', ])
+
+    def test_coroutine(self) -> None:
+        '''torment.decorators.log: coroutine function'''
+
+        @decorators.log
+        async def sleep():
+            await asyncio.sleep(0)
+
+            logger.info('AWAITED')
+
+            return 'slept'
+
+        with self.assertLogs(level = logging.INFO) as mocked_logger:
+            self.assertEqual(asyncio.run(sleep()), 'slept')
+
+        self.assertEqual([ _.split(':', 2)[2] for _ in mocked_logger.output if 'asyncio' not in _ ], [ 'STARTING: sleep()', 'AWAITED', 'STOPPING: sleep()', ])
+
+
 class MockDecoratorTest(unittest.TestCase):
     def setUp(self) -> None:
         class context(object):
@@ -87,14 +170,14 @@ class MockDecoratorTest(unittest.TestCase):
 
         self.assertFalse(decorators.mock('foo')(lambda self: None)(self.c))
 
-        self.assertFalse(self.c._is_mocked_foo)
+        self.assertFalse(decorators.is_mocked(self.c, 'foo'))
 
     def test_single_call(self) -> None:
         '''torment.decorators.mock(foo): not called'''
 
         self.assertTrue(decorators.mock('foo')(lambda self: None)(self.c))
 
-        self.assertTrue(self.c._is_mocked_foo)
+        self.assertTrue(decorators.is_mocked(self.c, 'foo'))
 
     def test_many_call(self) -> None:
         '''torment.decorators.mock(foo): previously called'''
@@ -105,4 +188,33 @@ class MockDecoratorTest(unittest.TestCase):
 
         logger.debug('dir(self.c): %s', dir(self.c))
 
-        self.assertTrue(self.c._is_mocked_foo)
+        self.assertTrue(decorators.is_mocked(self.c, 'foo'))
+
+    def test_dotted_name(self) -> None:
+        '''torment.decorators.mock(foo.bar): previously called'''
+
+        calls = []
+
+        mock_foo_bar = decorators.mock('foo.bar')(lambda self: calls.append(self))
+
+        self.assertTrue(mock_foo_bar(self.c))
+        self.assertTrue(mock_foo_bar(self.c))
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(decorators.is_mocked(self.c, 'foo.bar'))
+        self.assertFalse(decorators.is_mocked(self.c, 'foo'))
+
+    def test_per_thread_call(self) -> None:
+        '''torment.decorators.mock(foo): called in another thread'''
+
+        calls = []
+
+        mock_foo = decorators.mock('foo')(lambda self: calls.append(threading.get_ident()))
+
+        thread = threading.Thread(target = mock_foo, args = ( self.c, ))
+        thread.start()
+        thread.join()
+
+        self.assertFalse(decorators.is_mocked(self.c, 'foo'))
+        self.assertTrue(mock_foo(self.c))
+        self.assertEqual(len(calls), 2)
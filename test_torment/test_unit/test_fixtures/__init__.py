@@ -12,15 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import copy
-import inspect
+import gc
 import logging
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import types
 import typing  # noqa (use mypy typing)
 import unittest
 import uuid
+import weakref
+
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Tuple
 
 from torment import fixtures
 from torment import contexts
+from torment import snapshots
 
 logger = logging.getLogger(__name__)
 
@@ -48,9 +62,26 @@ class FixturesPropertyUnitTest(unittest.TestCase):
     def test_fixture_category(self) -> None:
         '''torment.fixtures.Fixture(context).category == 'fixtures' '''
 
-        self.f.__module__ = unittest.mock.MagicMock(__name__ = 'test_torment.test_unit.test_fixtures.fixture_a44bc6dda6654b1395a8c2cbd55d964d')
+        class F(fixtures.Fixture):
+            pass
+
+        F.__module__ = unittest.mock.MagicMock(__name__ = 'test_torment.test_unit.test_fixtures.fixture_a44bc6dda6654b1395a8c2cbd55d964d')
+
+        self.assertEqual(F(self.c).category, 'fixtures')
+
+    def test_fixture_category_cached(self) -> None:
+        '''torment.fixtures.Fixture(context).category is computed once per class'''
+
+        class F(fixtures.Fixture):
+            pass
+
+        F.__module__ = unittest.mock.MagicMock(__name__ = 'test_torment.test_unit.test_fixtures.fixture_a44bc6dda6654b1395a8c2cbd55d964d')
+
+        self.assertEqual(F(self.c).category, 'fixtures')
 
-        self.assertEqual(self.f.category, 'fixtures')
+        F.__module__.__name__ = 'test_torment.test_unit.test_contexts.fixture_a44bc6dda6654b1395a8c2cbd55d964d'
+
+        self.assertEqual(F(self.c).category, 'fixtures')
 
     def test_fixture_description(self) -> None:
         '''torment.fixtures.Fixture(context).description == '94d7c58f6ee44683936c21cb84d1e458—torment.fixtures' '''
@@ -63,9 +94,9 @@ class FixturesPropertyUnitTest(unittest.TestCase):
     def test_fixture_name(self) -> None:
         '''torment.fixtures.Fixture(context).name == 'test_94d7c58f6ee44683936c21cb84d1e458' '''
 
-        self.f.__class__.__name__ = '94d7c58f6ee44683936c21cb84d1e458'
+        F = type('94d7c58f6ee44683936c21cb84d1e458', ( fixtures.Fixture, ), {})
 
-        self.assertEqual(self.f.name, 'test_94d7c58f6ee44683936c21cb84d1e458')
+        self.assertEqual(F(self.c).name, 'test_94d7c58f6ee44683936c21cb84d1e458')
 
 
 class ErrorFixturesPropertyUnitTest(unittest.TestCase):
@@ -110,12 +141,41 @@ class ErrorFixturesRunTest(unittest.TestCase):
         self.assertIsInstance(e.exception, RuntimeError)
         self.assertEqual(e.exception.args, ( 'failure', ))
 
+    def test_error_fixture_run_async(self) -> None:
+        '''torment.fixtures.ErrorFixture(context).run() with an AsyncFixture'''
+
+        class fixture(fixtures.AsyncFixture):
+            async def run(self):
+                await asyncio.sleep(0)
+
+                if self.fails:
+                    raise RuntimeError('failure')
+
+        class error_fixture(fixtures.ErrorFixture, fixture):
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                self.error = RuntimeError('failure')
+
+        c = unittest.TestCase()
+
+        e = error_fixture(c)
+        e.fails = True
+        e._execute()
+
+        self.assertIsInstance(e.exception, RuntimeError)
+
+        e = error_fixture(c)
+        e.fails = False
+
+        with self.assertRaises(AssertionError):
+            e._execute()
+
 
 class OfUnitTest(unittest.TestCase):
     def test_of_zero(self) -> None:
         '''torment.fixtures.of(()) == []'''
 
-        self.assertEqual(len(fixtures.of(())), 0)
+        self.assertEqual(len(list(fixtures.of(()))), 0)
 
     def test_of_many_without_subclasses(self) -> None:
         '''torment.fixtures.of(( FixtureA, )) == []'''
@@ -124,7 +184,7 @@ class OfUnitTest(unittest.TestCase):
             def __init__(self, context) -> None:
                 pass
 
-        self.assertEqual(len(fixtures.of(( FixtureA, ))), 0)
+        self.assertEqual(len(list(fixtures.of(( FixtureA, )))), 0)
 
     def test_of_many_with_subclasses(self) -> None:
         '''torment.fixtures.of(( FixtureA, )) == [ fixture_a, ]'''
@@ -136,29 +196,120 @@ class OfUnitTest(unittest.TestCase):
         class FixtureB(FixtureA):
             pass
 
-        result = fixtures.of(( FixtureA, ))
+        result = list(fixtures.of(( FixtureA, )))
 
         self.assertEqual(len(result), 1)
         self.assertIsInstance(result[0], FixtureB)
 
+    def test_of_fixtures(self) -> None:
+        '''torment.fixtures.of(( FixtureA, FixtureB, )) == [ fixture_c, fixture_d, ]'''
+
+        class FixtureA(fixtures.Fixture):
+            pass
+
+        class FixtureB(FixtureA):
+            pass
+
+        class FixtureC(FixtureB):
+            pass
+
+        class FixtureD(FixtureA):
+            pass
+
+        class FixtureE(FixtureB, FixtureD):
+            pass
+
+        self.assertEqual([ type(_) for _ in fixtures.of(( FixtureA, FixtureB, )) ], [ FixtureC, FixtureE, ])
+
+
+class LeavesUnitTest(unittest.TestCase):
+    def test_leaves_of_leaf(self) -> None:
+        '''torment.fixtures.leaves(FixtureA) == [ FixtureA, ]'''
+
+        class FixtureA(fixtures.Fixture):
+            pass
+
+        self.assertEqual(list(fixtures.leaves(FixtureA)), [ FixtureA, ])
+
+    def test_leaves_incremental(self) -> None:
+        '''torment.fixtures.leaves(FixtureA) follows subclassing'''
+
+        class FixtureA(fixtures.Fixture):
+            pass
+
+        class FixtureB(FixtureA):
+            pass
+
+        class FixtureC(FixtureA):
+            pass
+
+        self.assertEqual(list(fixtures.leaves(FixtureA)), [ FixtureB, FixtureC, ])
+
+        class FixtureD(FixtureB):
+            pass
+
+        self.assertEqual(list(fixtures.leaves(FixtureA)), [ FixtureC, FixtureD, ])
+        self.assertEqual(list(fixtures.leaves(FixtureB)), [ FixtureD, ])
+
+    def test_leaves_collected(self) -> None:
+        '''torment.fixtures.leaves(FixtureA) forgets collected subclasses'''
+
+        class FixtureA(fixtures.Fixture):
+            pass
+
+        class FixtureB(FixtureA):
+            pass
+
+        self.assertEqual(list(fixtures.leaves(FixtureA)), [ FixtureB, ])
+
+        del FixtureB
+        gc.collect()
+
+        self.assertEqual(list(fixtures.leaves(FixtureA)), [ FixtureA, ])
+
+    def test_leaves_multiple_inheritance(self) -> None:
+        '''torment.fixtures.leaves(FixtureA) with a subclass of FixtureB and FixtureC'''
+
+        class FixtureA(fixtures.Fixture):
+            pass
+
+        class FixtureB(FixtureA):
+            pass
+
+        class FixtureC(FixtureA):
+            pass
+
+        class FixtureD(FixtureB, FixtureC):
+            pass
+
+        class FixtureE(FixtureC):
+            pass
+
+        self.assertEqual(list(fixtures.leaves(FixtureA)), [ FixtureD, FixtureE, ])
+        self.assertEqual(list(fixtures.leaves(FixtureB)), [ FixtureD, ])
+
+        del FixtureD
+        gc.collect()
+
+        self.assertEqual(list(fixtures.leaves(FixtureA)), [ FixtureB, FixtureE, ])
+        self.assertEqual(list(fixtures.leaves(FixtureC)), [ FixtureE, ])
+
 
 class RegisterUnitTest(unittest.TestCase):
     def setUp(self) -> None:
-        _ = unittest.mock.patch('torment.fixtures.inspect')
-        mocked_inspect = _.start()
+        _ = unittest.mock.patch('torment.fixtures._caller')
+        self.mocked_caller = _.start()
         self.addCleanup(_.stop)
 
-        mocked_inspect.configure_mock(**{ 'isclass': inspect.isclass, 'isfunction': inspect.isfunction, })
-
-        mocked_inspect.stack.return_value = ( None, ( None, 'test_unit/test_d43830e2e9624dd19c438b15250c5818.py', ), )
+        self.mocked_caller.return_value = ( 'test_unit/test_d43830e2e9624dd19c438b15250c5818.py', 'stack', )
 
         class ContextStub(object):
             pass
 
         self.context = ContextStub()
-        self.context.module = mocked_inspect.getmodule.return_value = 'stack'
+        self.context.module = 'stack'
 
-        self.ns = {}  # type: Dict[str, Any]
+        self.ns = {}  # type: typing.Dict[str, Any]
         self.class_name = 'f_d43830e2e9624dd19c438b15250c5818'
 
     def test_zero_properties(self) -> None:
@@ -170,6 +321,29 @@ class RegisterUnitTest(unittest.TestCase):
 
         self.assertEqual(_.uuid, uuid.UUID('d43830e2e9624dd19c438b15250c5818'))
 
+    def test_explicit_module_and_uuid(self) -> None:
+        '''torment.fixtures.register({}, (), {}, module = 'stack', uuid = uuid)'''
+
+        fixtures.register(self.ns, ( fixtures.Fixture, ), {}, module = 'stack', uuid = 'e5b3ba9cb7b04e1e8ec4fa2a7c8ba5ed')
+
+        self.assertFalse(self.mocked_caller.called)
+
+        _ = self.ns['f_e5b3ba9cb7b04e1e8ec4fa2a7c8ba5ed'](self.context)
+
+        self.assertEqual(_.uuid, uuid.UUID('e5b3ba9cb7b04e1e8ec4fa2a7c8ba5ed'))
+        self.assertEqual(_.__module__, 'stack')
+
+    def test_explicit_module(self) -> None:
+        '''torment.fixtures.register({}, (), {}, module = 'test_unit.test_e5b3ba9cb7b04e1e8ec4fa2a7c8ba5ed')'''
+
+        fixtures.register(self.ns, ( fixtures.Fixture, ), {}, module = 'test_unit.test_e5b3ba9cb7b04e1e8ec4fa2a7c8ba5ed')
+
+        self.assertFalse(self.mocked_caller.called)
+
+        _ = self.ns['f_e5b3ba9cb7b04e1e8ec4fa2a7c8ba5ed'](self.context)
+
+        self.assertEqual(_.uuid, uuid.UUID('e5b3ba9cb7b04e1e8ec4fa2a7c8ba5ed'))
+
     def test_one_literal_properties(self) -> None:
         '''torment.fixtures.register({}, (), { 'a': 'a', })'''
 
@@ -234,25 +408,235 @@ class RegisterUnitTest(unittest.TestCase):
 
         self.assertIsInstance(_.error, RuntimeError)
 
+    def test_error_property_arguments(self) -> None:
+        '''torment.fixtures.register({}, (), { 'error': { 'class': …, 'args': …, 'kwargs': …, }, })'''
+
+        class Error(Exception):
+            def __init__(self, a, b = None) -> None:
+                super().__init__(a, b)
+
+        fixtures.register(self.ns, ( fixtures.Fixture, ), { 'error': { 'class': Error, 'args': ( 'a', ), 'kwargs': { 'b': 'b', }, }, })
+
+        _ = self.ns[self.class_name](self.context)
+
+        self.assertIsInstance(_.error, Error)
+        self.assertEqual(_.error.args, ( 'a', 'b', ))
+
+    def test_non_identifier_properties(self) -> None:
+        '''torment.fixtures.register({}, (), { 'a-b': 'a-b', 'class': 'class', })'''
+
+        fixtures.register(self.ns, ( fixtures.Fixture, ), { 'a-b': 'a-b', 'class': 'class', })
+
+        _ = self.ns[self.class_name](self.context)
+
+        self.assertEqual(getattr(_, 'a-b'), 'a-b')
+        self.assertEqual(getattr(_, 'class'), 'class')
+
+    def test_subclassed_init(self) -> None:
+        '''torment.fixtures.register({}, (), { 'a': 'a', 'description': 'needle', }) subclassed'''
+
+        fixtures.register(self.ns, ( fixtures.Fixture, ), { 'a': 'a', 'description': 'needle', })
+
+        class A(self.ns[self.class_name]):
+            pass
+
+        _ = A(self.context)
+
+        self.assertEqual(_.a, 'a')
+        self.assertEqual(_.context, self.context)
+
+        self.assertEqual(_.description, 'd43830e2e9624dd19c438b15250c5818—stack—needle')
+        self.assertIsNone(_.setup())
+
+    def test_subclassed_registered(self) -> None:
+        '''torment.fixtures.register({}, ( registered, ), { 'description': 'inner', }) subclassed'''
+
+        fixtures.register(self.ns, ( fixtures.Fixture, ), { 'description': 'outer', })
+        outer = self.ns.pop(self.class_name)
+
+        fixtures.register(self.ns, ( outer, ), { 'description': 'inner', })
+
+        class A(self.ns[self.class_name]):
+            pass
+
+        _ = A(self.context)
+
+        self.assertEqual(_.description, 'd43830e2e9624dd19c438b15250c5818—stack—outer—inner')
+        self.assertIsNone(_.setup())
+
+    def test_snapshot_properties(self) -> None:
+        '''torment.fixtures.register({}, (), { 'a': snapshots.freeze({ 'b': [], }), })'''
+
+        fixtures.register(self.ns, ( fixtures.Fixture, ), { 'a': snapshots.freeze({ 'b': [], }), })
+
+        first = self.ns[self.class_name](self.context)
+        second = self.ns[self.class_name](self.context)
+
+        first.a['b'].append(1)
+
+        self.assertEqual(first.a, { 'b': [ 1, ], })
+        self.assertEqual(second.a, { 'b': [], })
+
+    def test_lazy_function_properties(self) -> None:
+        '''torment.fixtures.register({}, (), { 'a': self → [], }, lazy = True)'''
+
+        calls = []
+
+        def a(self) -> List[None]:
+            calls.append(self)
+            return []
+
+        fixtures.register(self.ns, ( fixtures.Fixture, ), { 'a': a, 'b': lambda self: self.a, }, lazy = True)
+
+        _ = self.ns[self.class_name](self.context)
+
+        self.assertEqual(calls, [])
+
+        self.assertIs(_.b, _.a)
+        self.assertEqual(calls, [ _, ])
+
+    def test_lazy_mutable_function_properties(self) -> None:
+        '''torment.fixtures.register({}, (), { 'a': [], 'b': mutable(self → self.a), }, lazy = True)'''
+
+        fixtures.register(self.ns, ( fixtures.Fixture, ), { 'a': [], 'b': fixtures.mutable(lambda self: self.a), }, lazy = True)
+
+        _ = self.ns[self.class_name](self.context)
+
+        self.assertEqual(_.b, _.a)
+        self.assertIsNot(_.b, _.a)
+
+    def test_lazy_fixture_class_properties(self) -> None:
+        '''torment.fixtures.register({}, (), { 'a': fixture_class, }, lazy = True)'''
+
+        created = []
+
+        class A(fixtures.Fixture):
+            def __init__(self, context) -> None:
+                super().__init__(context)
+                created.append(self)
+
+        fixtures.register(self.ns, ( fixtures.Fixture, ), { 'a': A, }, lazy = True)
+
+        _ = self.ns[self.class_name](self.context)
+
+        self.assertEqual(created, [])
+
+        self.assertIsInstance(_.a, A)
+        self.assertEqual(_.a.context, self.context)
+        self.assertEqual(len(created), 1)
+
+    def test_lazy_circular_properties(self) -> None:
+        '''torment.fixtures.register({}, (), { 'a': self → self.b, 'b': self → self.a, }, lazy = True)'''
+
+        fixtures.register(self.ns, ( fixtures.Fixture, ), { 'a': lambda self: self.b, 'b': lambda self: self.a, }, lazy = True)
+
+        _ = self.ns[self.class_name](self.context)
+
+        with self.assertRaises(RuntimeError):
+            _.a
+
     def test_mocks_mock_property(self) -> None:
         '''torment.fixtures.register({}, (), { 'mocks': { 'symbol': …, }, }).setup()'''
 
-        _ = unittest.mock.patch('torment.fixtures._find_mocker')
-        mocked_fixtures_find_mocker = _.start()
-        self.addCleanup(_.stop)
-        mocked_fixtures_find_mocker.return_value = lambda: True
+        class ContextStub(contexts.TestContext):
+            mocked_symbol = unittest.mock.MagicMock(name = 'ContextStub.mocked_symbol')
 
-        _ = unittest.mock.patch('torment.fixtures._prepare_mock')
-        mocked_fixtures_prepare_mock = _.start()
-        self.addCleanup(_.stop)
+            def mock_symbol(self) -> bool:
+                return True
 
-        fixtures.register(self.ns, ( fixtures.Fixture, ), { 'mocks': { 'symbol': {}, }, })
+        fixtures.register(self.ns, ( fixtures.Fixture, ), { 'mocks': { 'symbol': { 'return_value': 'a', }, }, })
 
-        _ = self.ns[self.class_name](self.context)
+        _ = self.ns[self.class_name](ContextStub())
         _.setup()
 
-        mocked_fixtures_find_mocker.assert_called_once_with('symbol', self.context)
-        mocked_fixtures_prepare_mock.assert_called_once_with(self.context, 'symbol')
+        self.assertEqual(_.context.mocked_symbol(), 'a')
+
+    def test_mocks_mock_property_unmocked(self) -> None:
+        '''torment.fixtures.register({}, (), { 'mocks': { 'symbol': …, }, }).setup() without mock_symbol'''
+
+        class ContextStub(contexts.TestContext):
+            mocked_symbol = unittest.mock.MagicMock(name = 'ContextStub.mocked_symbol')
+
+            def mock_symbol(self) -> bool:
+                return False
+
+        fixtures.register(self.ns, ( fixtures.Fixture, ), { 'mocks': { 'symbol': { 'return_value': 'a', }, }, })
+
+        _ = self.ns[self.class_name](ContextStub())
+        _.setup()
+
+        self.assertNotEqual(_.context.mocked_symbol(), 'a')
+
+
+class RegisterManyUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        _ = unittest.mock.patch('torment.fixtures._caller')
+        self.mocked_caller = _.start()
+        self.addCleanup(_.stop)
+
+        self.mocked_caller.return_value = ( 'test_unit/test_d43830e2e9624dd19c438b15250c5818.py', 'stack', )
+
+        class ContextStub(object):
+            pass
+
+        self.context = ContextStub()
+        self.context.module = 'stack'
+
+        self.ns = {}  # type: typing.Dict[str, Any]
+        self.uuid = uuid.UUID('d43830e2e9624dd19c438b15250c5818')
+        self.class_name = 'f_d43830e2e9624dd19c438b15250c5818'
+
+    def test_zero_properties(self) -> None:
+        '''torment.fixtures.register_many({}, (), [])'''
+
+        fixtures.register_many(self.ns, ( fixtures.Fixture, ), [])
+
+        self.assertEqual(self.ns, {})
+
+    def test_many_properties(self) -> None:
+        '''torment.fixtures.register_many({}, (), [ { 'a': 0, }, { 'a': 1, }, { 'a': 2, }, ])'''
+
+        fixtures.register_many(self.ns, ( fixtures.Fixture, ), ( { 'a': _, } for _ in range(3) ))
+
+        self.assertEqual(self.mocked_caller.call_count, 1)
+
+        names = [ self.class_name, self.class_name + '_1', self.class_name + '_2', ]
+
+        self.assertCountEqual(self.ns.keys(), names)
+
+        for index, name in enumerate(names):
+            _ = self.ns[name](self.context)
+
+            self.assertEqual(_.a, index)
+            self.assertEqual(_.uuid, uuid.uuid5(self.uuid, str(index)))
+
+    def test_many_properties_existing_names(self) -> None:
+        '''torment.fixtures.register_many({ 'f_{uuid}': …, }, (), [ {}, {}, ])'''
+
+        fixtures.register(self.ns, ( fixtures.Fixture, ), {})
+        fixtures.register_many(self.ns, ( fixtures.Fixture, ), [ {}, {}, ])
+
+        self.assertCountEqual(self.ns.keys(), [ self.class_name, self.class_name + '_1', self.class_name + '_2', ])
+        self.assertEqual(self.ns[self.class_name + '_2'].uuid, uuid.uuid5(self.uuid, '2'))
+
+    def test_many_properties_copied(self) -> None:
+        '''torment.fixtures.register_many({}, (), [ { 'a': shared, }, { 'a': shared, }, ])'''
+
+        shared = []
+
+        fixtures.register_many(self.ns, ( fixtures.Fixture, ), [ { 'a': shared, }, { 'a': shared, }, ])
+
+        shared.append(None)
+
+        first = self.ns[self.class_name](self.context)
+        second = self.ns[self.class_name + '_1'](self.context)
+
+        self.assertEqual(first.a, [])
+        self.assertEqual(second.a, [])
+
+        first.a.append(None)
+
+        self.assertEqual(second.a, [])
 
 
 class PrepareMockUnitTest(unittest.TestCase):
@@ -363,6 +747,409 @@ class FindMockerUnitTest(unittest.TestCase):
         self.assertEqual(method.__name__, 'noop')
 
 
+class RegisterProductUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        class ProductFixture(fixtures.Fixture):
+            pass
+
+        self.fixture_class = ProductFixture
+
+        self.context = contexts.TestContext()
+
+        self.ns = {}  # type: typing.Dict[str, Any]
+        self.uuid = uuid.UUID('d43830e2e9624dd19c438b15250c5818')
+        self.class_name = 'f_' + self.uuid.hex
+
+        self.product = fixtures.register_product(self.ns, ( ProductFixture, ), { 'parameters': { 'a': 0, }, }, [
+            { 'parameters': ( { 'b': 1, }, { 'b': 2, }, ), },
+            { 'expected': ( 'x', 'y', 'z', ), },
+        ], module = __name__, uuid = self.uuid)
+
+        self.addCleanup(gc.collect)
+        self.addCleanup(vars(self).pop, 'product', None)
+        self.addCleanup(vars(self).pop, 'ns', None)
+
+    def test_product_lazy(self) -> None:
+        '''torment.fixtures.register_product({}, (), {}, axes) creates no classes'''
+
+        self.assertEqual(len(self.product), 6)
+        self.assertEqual(list(self.ns.keys()), [ self.class_name, ])
+        self.assertIs(self.ns[self.class_name], self.product)
+        self.assertEqual(self.fixture_class.__subclasses__(), [])
+
+    def test_product_getitem(self) -> None:
+        '''torment.fixtures.register_product({}, (), {}, axes)[4]'''
+
+        cls = self.product[4]
+        _ = cls(self.context)
+
+        self.assertIs(self.product[4], cls)
+        self.assertEqual(cls.__name__, self.class_name + '__4')
+        self.assertEqual(self.product.name(4), 'test_' + cls.__name__)
+        self.assertEqual(_.uuid, uuid.uuid5(self.uuid, '4'))
+        self.assertEqual(_.parameters, { 'a': 0, 'b': 2, })
+        self.assertEqual(_.expected, 'y')
+
+        self.assertEqual(len(self.ns), 2)
+
+    def test_product_getitem_out_of_range(self) -> None:
+        '''torment.fixtures.register_product({}, (), {}, axes)[6] → IndexError'''
+
+        with self.assertRaises(IndexError):
+            self.product[6]
+
+    def test_products(self) -> None:
+        '''torment.fixtures.products(( ProductFixture, )) == [ product, ]'''
+
+        self.assertEqual(fixtures.products(( self.fixture_class, )), [ self.product, ])
+        self.assertEqual(fixtures.products(( fixtures.ErrorFixture, )), [])
+
+    def test_products_forgotten(self) -> None:
+        '''torment.fixtures.products(( ProductFixture, )) == [] once its namespace is gone'''
+
+        fixture_class = self.fixture_class
+
+        del self.ns, self.product
+        gc.collect()
+
+        self.assertEqual(fixtures.products(( fixture_class, )), [])
+
+    def test_of_excludes_products(self) -> None:
+        '''torment.fixtures.of(( fixtures.Fixture, )) excludes FixtureProducts'''
+
+        class Base(fixtures.Fixture):
+            pass
+
+        class Middle(Base):
+            pass
+
+        class Leaf(self.fixture_class):
+            pass
+
+        fixtures.register_product({}, ( Middle, ), {}, [], module = __name__, uuid = self.uuid)
+
+        self.product[0]
+
+        self.assertEqual([ type(_) for _ in fixtures.of(( Base, self.fixture_class, )) ], [ Leaf, ])
+
+
+class ShardUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.uuids = [ uuid.UUID(int = _ * 0x9e3779b97f4a7c15f39cc0605cedc835 % 2 ** 128) for _ in range(1, 1001) ]
+
+    def test_shard_of_range(self) -> None:
+        '''1 ≤ torment.fixtures.shard_of(uuid, 16) ≤ 16'''
+
+        shards = [ fixtures.shard_of(_, 16) for _ in self.uuids ]
+
+        self.assertEqual(set(shards), set(range(1, 17)))
+
+    def test_shard_of_stable(self) -> None:
+        '''torment.fixtures.shard_of(uuid, n) only moves uuids to shard n + 1'''
+
+        for _ in self.uuids:
+            before, after = fixtures.shard_of(_, 7), fixtures.shard_of(_, 8)
+
+            self.assertIn(after, ( before, 8, ))
+
+    def test_classes_of_shards(self) -> None:
+        '''torment.fixtures.classes_of(( FixtureA, ), shard = 'k/3') partitions'''
+
+        class FixtureA(fixtures.Fixture):
+            pass
+
+        ns = {}  # type: typing.Dict[str, Any]
+
+        fixtures.register_many(ns, ( FixtureA, ), [ {} ] * 30, module = __name__, uuid = self.uuids[0])
+
+        shards = [ set(fixtures.classes_of(( FixtureA, ), shard = '{0}/3'.format(_))) for _ in range(1, 4) ]
+
+        self.assertEqual(set().union(*shards), set(ns.values()))
+        self.assertEqual(sum(len(_) for _ in shards), 30)
+
+        for shard in shards:
+            for cls in shard:
+                self.assertEqual(fixtures.shard_of(cls.uuid, 3), shards.index(shard) + 1)
+
+    def test_classes_of_environment(self) -> None:
+        '''torment.fixtures.classes_of(( FixtureA, )) with TORMENT_SHARD=2/2'''
+
+        class FixtureA(fixtures.Fixture):
+            pass
+
+        ns = {}  # type: typing.Dict[str, Any]
+
+        fixtures.register_many(ns, ( FixtureA, ), [ {} ] * 10, module = __name__, uuid = self.uuids[0])
+
+        with unittest.mock.patch.dict(os.environ, { 'TORMENT_SHARD': '2/2', }):
+            result = set(fixtures.classes_of(( FixtureA, )))
+
+        self.assertEqual(result, set(fixtures.classes_of(( FixtureA, ), shard = ( 2, 2, ))))
+        self.assertEqual(result, { _ for _ in ns.values() if fixtures.shard_of(_.uuid, 2) == 2 })
+
+    def test_invalid_shard(self) -> None:
+        '''torment.fixtures.classes_of((), shard = '0/2') → ValueError'''
+
+        for shard in ( '0/2', '3/2', '1', 'a/b', ( 1, ), ):
+            with self.assertRaises(ValueError):
+                list(fixtures.classes_of((), shard = shard))
+
+    def test_product_indices(self) -> None:
+        '''torment.fixtures.register_product(…).indices(shard = '1/2')'''
+
+        class FixtureA(fixtures.Fixture):
+            pass
+
+        product = fixtures.register_product({}, ( FixtureA, ), {}, [ { 'a': tuple(range(20)), }, ], module = __name__, uuid = self.uuids[0])
+
+        first, second = list(product.indices(shard = '1/2')), list(product.indices(shard = '2/2'))
+
+        self.assertEqual(sorted(first + second), list(range(20)))
+        self.assertTrue(all(fixtures.shard_of(product.uuid_of(_), 2) == 1 for _ in first))
+
+
+class LoadUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        _ = tempfile.TemporaryDirectory()
+        self.directory = _.name
+        self.addCleanup(_.cleanup)
+
+        class A(fixtures.Fixture):
+            pass
+
+        class B(fixtures.Fixture):
+            pass
+
+        self.classes = { 'A': A, 'B': B, }
+
+        self.context = contexts.TestContext()
+
+        self.ns = {}  # type: typing.Dict[str, Any]
+
+        self.uuids = [ uuid.UUID('d43830e2e9624dd19c438b15250c5818'), uuid.UUID('a44bc6dda6654b1395a8c2cbd55d964d'), ]
+
+    def write(self, name: str, text: str) -> str:
+        path = os.path.join(self.directory, name)
+
+        with open(path, 'w') as fh:
+            fh.write(text)
+
+        return path
+
+    def test_load_json_lines(self) -> None:
+        '''torment.fixtures.load({}, 'fixtures.jsonl', classes)'''
+
+        path = self.write('fixtures.jsonl', '\n'.join([
+            '{ "uuid": "' + self.uuids[0].hex + '", "bases": [ "A" ], "a": { "b": [ 1 ] } }',
+            '',
+            '{ "uuid": "' + self.uuids[1].hex + '", "bases": [ "A", "B" ], "description": "d" }',
+        ]))
+
+        fixtures.load(self.ns, path, self.classes, module = __name__)
+
+        first = self.ns['f_' + self.uuids[0].hex](self.context)
+        second = self.ns['f_' + self.uuids[1].hex](self.context)
+
+        self.assertIsInstance(first, self.classes['A'])
+        self.assertEqual(first.a, { 'b': [ 1, ], })
+        self.assertEqual(first.uuid, self.uuids[0])
+        self.assertEqual(type(first).__module__, __name__)
+
+        self.assertIsInstance(second, self.classes['B'])
+        self.assertTrue(second.description.endswith('—d'))
+
+    def test_load_csv(self) -> None:
+        '''torment.fixtures.load({}, 'fixtures.csv', classes)'''
+
+        path = self.write('fixtures.csv', '\n'.join([
+            'uuid,bases,a,b',
+            self.uuids[0].hex + ',A B,"{""c"": 1}",text',
+            self.uuids[1].hex + ',,2,',
+        ]))
+
+        fixtures.load(self.ns, path, self.classes, base_classes = ( self.classes['A'], ), module = __name__)
+
+        first = self.ns['f_' + self.uuids[0].hex](self.context)
+        second = self.ns['f_' + self.uuids[1].hex](self.context)
+
+        self.assertIsInstance(first, self.classes['B'])
+        self.assertEqual(first.a, { 'c': 1, })
+        self.assertEqual(first.b, 'text')
+
+        self.assertIsInstance(second, self.classes['A'])
+        self.assertEqual(second.a, 2)
+        self.assertFalse(hasattr(second, 'b'))
+
+    def test_load_without_uuid(self) -> None:
+        '''torment.fixtures.load({}, 'fixtures.jsonl', classes) without uuid → ValueError'''
+
+        path = self.write('fixtures.jsonl', '{ "bases": [ "A" ] }')
+
+        with self.assertRaisesRegex(ValueError, 'fixtures.jsonl:1: fixture without uuid'):
+            fixtures.load(self.ns, path, self.classes, module = __name__)
+
+    def test_load_unknown_base(self) -> None:
+        '''torment.fixtures.load({}, 'fixtures.jsonl', classes) with unknown base → ValueError'''
+
+        path = self.write('fixtures.jsonl', '{ "uuid": "' + self.uuids[0].hex + '", "bases": [ "C" ] }')
+
+        with self.assertRaisesRegex(ValueError, 'unknown base class'):
+            fixtures.load(self.ns, path, self.classes, module = __name__)
+
+    def test_load_unsupported(self) -> None:
+        '''torment.fixtures.load({}, 'fixtures.toml', classes) → ValueError'''
+
+        path = self.write('fixtures.toml', '')
+
+        with self.assertRaises(ValueError):
+            fixtures.load(self.ns, path, self.classes, module = __name__)
+
+
+class ExecuteConcurrentlyUnitTest(unittest.TestCase):
+    def test_execute_concurrently(self) -> None:
+        '''torment.fixtures.execute_concurrently([ fixture, failing_fixture, ], 1)'''
+
+        class F(fixtures.AsyncFixture):
+            async def setup(self) -> None:
+                self.steps = [ 'setup', ]
+
+            def run(self) -> None:
+                self.steps.append('run')
+
+            async def check(self) -> None:
+                self.context.assertTrue(self.passes)
+
+        context = contexts.TestContext()
+
+        batch = [ F(context), F(context), ]
+        batch[0].passes, batch[1].passes = True, False
+
+        errors = fixtures.execute_concurrently(batch, 1)
+
+        self.assertIsNone(errors[0])
+        self.assertIsInstance(errors[1], AssertionError)
+        self.assertEqual(batch[0].steps, [ 'setup', 'run', ])
+
+    def test_execute_concurrently_invalid_limit(self) -> None:
+        '''torment.fixtures.execute_concurrently([], 0) → ValueError'''
+
+        with self.assertRaises(ValueError):
+            fixtures.execute_concurrently([], 0)
+
+    def test_event_loop_closed_with_thread(self) -> None:
+        '''torment.fixtures._event_loop() is closed when its thread finishes'''
+
+        loops = []
+
+        thread = threading.Thread(target = lambda: loops.extend([ fixtures._event_loop(), fixtures._event_loop(), ]))
+        thread.start()
+        thread.join()
+
+        self.assertIs(loops[0], loops[1])
+        self.assertTrue(loops[0].is_closed())
+        self.assertFalse(fixtures._event_loop().is_closed())
+
+
+class PickleUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.uuid = uuid.UUID('d43830e2e9624dd19c438b15250c5818')
+
+        self.module = types.ModuleType('test_torment.test_unit.test_fixtures.pickle_' + self.uuid.hex)
+        self.ns = vars(self.module)
+
+        sys.modules[self.module.__name__] = self.module
+        self.addCleanup(sys.modules.pop, self.module.__name__)
+
+        self.context = contexts.TestContext()
+
+    def test_pickle_class(self) -> None:
+        '''pickle.loads(pickle.dumps(register(…))) is the registered class'''
+
+        fixtures.register(self.ns, ( fixtures.Fixture, ), { 'a': 'a', 'description': 'needle', }, module = self.module.__name__)
+
+        cls = self.ns['f_' + self.uuid.hex]
+
+        self.assertEqual(cls.__module__, self.module.__name__)
+        self.assertEqual(cls._torment_properties, { 'a': 'a', })
+        self.assertEqual(cls._torment_description, 'needle')
+        self.assertIs(pickle.loads(pickle.dumps(cls)), cls)
+
+    def test_pickle_fixture(self) -> None:
+        '''pickle.loads(pickle.dumps(fixture)) has fixture's properties but no context'''
+
+        fixtures.register(self.ns, ( fixtures.Fixture, ), { 'a': { 'b': [ 1, ], }, }, module = self.module.__name__)
+
+        fixture = self.ns['f_' + self.uuid.hex](self.context)
+        _ = pickle.loads(pickle.dumps(fixture))
+
+        self.assertIs(type(_), type(fixture))
+        self.assertEqual(_.a, { 'b': [ 1, ], })
+        self.assertIsNone(_.context)
+        self.assertIs(fixture.context, self.context)
+
+    def test_pickle_product_class(self) -> None:
+        '''pickle.loads(pickle.dumps(register_product(…)[1])) is product[1]'''
+
+        product = fixtures.register_product(self.ns, ( fixtures.Fixture, ), {}, [ { 'a': ( 1, 2, ), }, ], module = self.module.__name__)
+
+        cls = product[1]
+
+        self.assertEqual(cls.__qualname__, 'f_' + self.uuid.hex + '.1')
+        self.assertIs(pickle.loads(pickle.dumps(cls)), cls)
+
+        data = pickle.dumps(cls)
+
+        del self.ns[cls.__name__]  # i.e. another process that hasn't created it
+
+        self.assertEqual(pickle.loads(data)(self.context).a, 2)
+
+
+class MockPlanUnitTest(unittest.TestCase):
+    def test_mock_plan_cached(self) -> None:
+        '''torment.fixtures._mock_plan(ContextStub, 'symbol') is torment.fixtures._mock_plan(ContextStub, 'symbol')'''
+
+        class ContextStub(contexts.TestContext):
+            pass
+
+        self.assertIs(fixtures._mock_plan(ContextStub, 'symbol'), fixtures._mock_plan(ContextStub, 'symbol'))
+
+    def test_mock_plan_targets(self) -> None:
+        '''torment.fixtures._mock_plan(ContextStub, 'symbol.Sub.a').targets'''
+
+        class ContextStub(contexts.TestContext):
+            pass
+
+        self.assertEqual(fixtures._mock_plan(ContextStub, 'symbol.Sub.a').targets, (
+            ( 'mocked_symbol_sub_a', (), ),
+            ( 'mocked_symbol_sub', ( 'a', ), ),
+            ( 'mocked_symbol', ( 'Sub', 'a', ), ),
+        ))
+
+    def test_mock_plan_metacontext_mockers(self) -> None:
+        '''torment.fixtures._mock_plan(MetaContext class, 'symbol.Sub').mocker == 'mock_symbol' '''
+
+        class ContextStub(contexts.TestContext, metaclass = contexts.MetaContext):
+            fixture_classes = ()
+
+            def mock_symbol(self) -> bool:
+                return True
+
+        self.assertEqual(ContextStub.mockers, frozenset([ 'mock_symbol', ]))
+        self.assertEqual(fixtures._mock_plan(ContextStub, 'symbol.Sub').mocker, 'mock_symbol')
+
+    def test_mock_plan_no_mocker_warns_once(self) -> None:
+        '''torment.fixtures._find_mocker('fakesymbol', ContextStub) warns once'''
+
+        class ContextStub(contexts.TestContext):
+            pass
+
+        with self.assertLogs('torment.fixtures', level = 'WARNING') as logs:
+            for _ in range(3):
+                fixtures._find_mocker('fakesymbol', ContextStub())
+
+        self.assertEqual(logs.output, [ 'WARNING:torment.fixtures:no mocker for fakesymbol', ])
+
+
 class ResolveFunctionsUnitTest(unittest.TestCase):
     def setUp(self) -> None:
         class StubFixture(object):
@@ -424,6 +1211,179 @@ class ResolveFunctionsUnitTest(unittest.TestCase):
         self.assertIsNone(self.f.a)
         self.assertIsNone(self.f.b)
 
+    def test_many_functions_evaluated_once(self) -> None:
+        '''torment.fixtures._resolve_functions({ 'a': self → self.b, 'b': self → self.c, 'c': self → 'c', }, fixture)'''
+
+        calls = []
+
+        def a(self) -> str:
+            calls.append('a')
+            return self.b + 'a'
+
+        def b(self) -> str:
+            calls.append('b')
+            return self.c + 'b'
+
+        def c(self) -> str:
+            calls.append('c')
+            return 'c'
+
+        fixtures._resolve_functions({ 'a': a, 'b': b, 'c': c, }, self.f)
+
+        self.assertEqual(self.f.a, 'cba')
+        self.assertEqual(self.f.b, 'cb')
+        self.assertEqual(self.f.c, 'c')
+
+        self.assertEqual(calls, [ 'a', 'b', 'c', ])
+
+    def test_many_functions_indirect(self) -> None:
+        '''torment.fixtures._resolve_functions({ 'a': self → self.method(), 'b': self → None, }, fixture)'''
+
+        def method() -> None:
+            return self.f.b
+
+        self.f.method = method
+
+        def a(self) -> None:
+            return self.method()
+
+        def b(self) -> None:
+            pass
+
+        fixtures._resolve_functions({ 'a': a, 'b': b, }, self.f)
+
+        self.assertIsNone(self.f.a)
+        self.assertIsNone(self.f.b)
+
+    def test_circular_functions(self) -> None:
+        '''torment.fixtures._resolve_functions({ 'a': self → self.b, 'b': self → self.a, 'c': self → None, }, fixture)'''
+
+        def a(self) -> None:
+            return self.b
+
+        def b(self) -> None:
+            return self.a
+
+        def c(self) -> None:
+            pass
+
+        with self.assertLogs(fixtures.logger, level = logging.WARNING) as mocked_logger:
+            fixtures._resolve_functions({ 'a': a, 'b': b, 'c': c, }, self.f)
+
+        self.assertIn('WARNING:torment.fixtures:circular Fixture properties: a → b → a', mocked_logger.output)
+
+        self.assertEqual(id(self.f.a), id(a))
+        self.assertEqual(id(self.f.b), id(b))
+        self.assertIsNone(self.f.c)
+
+        self.assertEqual(self.f._last_resolver_exception[0], 'b')
+
+    def test_function_returns_self(self) -> None:
+        '''torment.fixtures._resolve_functions({ 'a': self → self, 'b': self → [ self, ], }, fixture)'''
+
+        def a(self) -> Any:
+            return self
+
+        def b(self) -> List[Any]:
+            return [ self, ]
+
+        fixtures._resolve_functions({ 'a': a, 'b': b, }, self.f)
+
+        self.assertIs(self.f.a, self.f)
+        self.assertEqual(len(self.f.b), 1)
+        self.assertIs(self.f.b[0], self.f)
+
+    def test_function_inspects_self(self) -> None:
+        '''torment.fixtures._resolve_functions({ 'a': self → isinstance(self, …), 'b': self → type(self).__name__, }, fixture)'''
+
+        fixture_class = type(self.f)
+
+        def a(self) -> bool:
+            return isinstance(self, fixture_class) and self.__class__ is fixture_class
+
+        def b(self) -> str:
+            return type(self).__name__
+
+        fixtures._resolve_functions({ 'a': a, 'b': b, }, self.f)
+
+        self.assertTrue(self.f.a)
+        self.assertEqual(self.f.b, 'StubFixture')
+
+    def test_function_type_of_self(self) -> None:
+        '''torment.fixtures._resolve_functions({ 'a': self → type(self), }, fixture): type(self) is a stand-in'''
+
+        fixture_class = type(self.f)
+
+        def a(self) -> type:
+            return type(self)
+
+        fixtures._resolve_functions({ 'a': a, }, self.f)
+
+        self.assertIsNot(self.f.a, fixture_class)
+        self.assertEqual(( self.f.a.__module__, self.f.a.__qualname__, ), ( fixture_class.__module__, fixture_class.__qualname__, ))
+
+    def test_function_returns_closure(self) -> None:
+        '''torment.fixtures._resolve_functions({ 'a': self → (() → self.b), 'b': 1, }, fixture): the closure outlives the resolver'''
+
+        resolvers = weakref.WeakSet()  # type: typing.Set[fixtures._Resolver]
+
+        class Resolver(fixtures._Resolver):
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+
+                resolvers.add(self)
+
+        def a(self) -> Callable[[], Any]:
+            return lambda: self.b
+
+        def b(self) -> int:
+            return 1
+
+        with unittest.mock.patch.object(fixtures, '_Resolver', Resolver):
+            fixtures._resolve_functions({ 'a': a, 'b': b, }, self.f)
+
+        gc.collect()
+
+        self.assertEqual(len(resolvers), 0)
+        self.assertEqual(self.f.a(), 1)
+
+        self.f.b = 2
+
+        self.assertEqual(self.f.a(), 2)
+
+
+class CallerUnitTest(unittest.TestCase):
+    def test_caller(self) -> None:
+        '''torment.fixtures._caller() == ( __file__, module )'''
+
+        def register() -> Tuple[str, Any]:
+            return fixtures._caller()
+
+        caller_file, caller_module = register()
+
+        self.assertEqual(caller_file, __file__)
+        self.assertIs(caller_module, sys.modules[__name__])
+
+
+class AsUUIDUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.uuid = uuid.UUID('d43830e2e9624dd19c438b15250c5818')
+
+    def test_as_uuid_uuid(self) -> None:
+        '''torment.fixtures._as_uuid(uuid) == uuid'''
+
+        self.assertIs(fixtures._as_uuid(self.uuid), self.uuid)
+
+    def test_as_uuid_filename(self) -> None:
+        '''torment.fixtures._as_uuid('test_unit/test_d43830e2e9624dd19c438b15250c5818.py') == uuid'''
+
+        self.assertEqual(fixtures._as_uuid('test_unit/test_d43830e2e9624dd19c438b15250c5818.py'), self.uuid)
+
+    def test_as_uuid_modulename(self) -> None:
+        '''torment.fixtures._as_uuid('test_unit.test_d43830e2e9624dd19c438b15250c5818') == uuid'''
+
+        self.assertEqual(fixtures._as_uuid('test_unit.test_d43830e2e9624dd19c438b15250c5818'), self.uuid)
+
 
 class UniqueClassNameUnitTest(unittest.TestCase):
     def setUp(self) -> None:
@@ -443,6 +1403,14 @@ class UniqueClassNameUnitTest(unittest.TestCase):
 
         self.assertEqual(n, 'f_' + self.uuid.hex + '_1')
 
+    def test_class_names(self) -> None:
+        '''torment.fixtures._class_names({ 'f_{uuid}_1': None, }, uuid) → ( 0, 'f_{uuid}' ), ( 2, 'f_{uuid}_2' )'''
+
+        names = fixtures._class_names({ 'f_' + self.uuid.hex + '_1': None, }, self.uuid)
+
+        self.assertEqual(next(names), ( 0, 'f_' + self.uuid.hex, ))
+        self.assertEqual(next(names), ( 2, 'f_' + self.uuid.hex + '_2', ))
+
     def test_two_namespace(self) -> None:
         '''torment.fixtures._unique_class_name({ 'f_{uuid}': None, 'f_{uuid}_1': None, }, uuid) == 'f_{uuid}_2' '''
 
@@ -23,10 +23,22 @@ from torment import fixtures
 from torment import helpers
 
 
+class BriefFixture(fixtures.Fixture):
+    @property
+    def description(self) -> str:
+        return super().description + '.brief(…) == {0}'.format(self.expected)
+
+    def run(self) -> None:
+        self.result = helpers.brief(self.parameters['value'])
+
+    def check(self) -> None:
+        self.context.assertEqual(self.expected, self.result)
+
+
 class EvertFixture(fixtures.Fixture):
     @property
     def description(self) -> str:
-        return super().description + '.evert({0.parameters[iterable]}) == {0.expected}'.format(self)
+        return super().description + '.evert({0}) == {1}'.format(helpers.brief(self.parameters['iterable']), helpers.brief(self.expected))
 
     def run(self) -> None:
         self.result = list(helpers.evert(self.parameters['iterable']))
@@ -35,10 +47,26 @@ class EvertFixture(fixtures.Fixture):
         self.context.assertEqual(self.expected, self.result)
 
 
+class EvertAtFixture(fixtures.Fixture):
+    @property
+    def description(self) -> str:
+        return super().description + '.evert_at({0}, i) == list(evert({0}))[i]'.format(helpers.brief(self.parameters['iterable']))
+
+    def run(self) -> None:
+        self.count = helpers.evert_count(self.parameters['iterable'])
+        self.result = [ helpers.evert_at(self.parameters['iterable'], _) for _ in range(-self.count, self.count) ]
+
+    def check(self) -> None:
+        expected = list(helpers.evert(self.parameters['iterable']))
+
+        self.context.assertEqual(len(expected), self.count)
+        self.context.assertEqual(expected + expected, self.result)
+
+
 class ExtendFixture(fixtures.Fixture):
     @property
     def description(self) -> str:
-        return super().description + '.extend({{ {0.parameters[base]} }}, {{ {0.parameters[extension]} }}) == {{ {0.expected} }}'.format(self)
+        return super().description + '.extend({{ {0} }}, {{ {1} }}) == {{ {2} }}'.format(helpers.brief(self.parameters['base']), helpers.brief(self.parameters['extension']), helpers.brief(self.expected))
 
     def run(self) -> None:
         self.result = helpers.extend(self.parameters['base'], self.parameters['extension'])
@@ -50,7 +78,7 @@ class ExtendFixture(fixtures.Fixture):
 class MergeFixture(fixtures.Fixture):
     @property
     def description(self) -> str:
-        return super().description + '.merge({{ {0.parameters[base]} }}, {{ {0.parameters[extension]} }}) == {{ {0.expected} }}'.format(self)
+        return super().description + '.merge({{ {0} }}, {{ {1} }}) == {{ {2} }}'.format(helpers.brief(self.parameters['base']), helpers.brief(self.parameters['extension']), helpers.brief(self.expected))
 
     def run(self) -> None:
         self.result = helpers.merge(self.parameters['base'], self.parameters['extension'])
@@ -62,7 +90,7 @@ class MergeFixture(fixtures.Fixture):
 class PowersetFixture(fixtures.Fixture):
     @property
     def description(self) -> str:
-        return super().description + '.powerset({0.parameters[iterable]}) == {0.expected}'.format(self)
+        return super().description + '.powerset({0}) == {1}'.format(helpers.brief(self.parameters['iterable']), helpers.brief(self.expected))
 
     def run(self) -> None:
         self.result = list(helpers.powerset(self.parameters['iterable']))
@@ -75,7 +103,9 @@ helpers.import_directory(__name__, os.path.dirname(__file__))
 
 class HelperUnitTest(contexts.TestContext, metaclass = contexts.MetaContext):
     fixture_classes = (
+        BriefFixture,
         EvertFixture,
+        EvertAtFixture,
         ExtendFixture,
         MergeFixture,
         PowersetFixture,
@@ -0,0 +1,25 @@
+# Copyright 2015 Alex Brandt <alex.brandt@rackspace.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from torment import fixtures
+
+from test_torment.test_unit.test_helpers import BriefFixture
+
+fixtures.register(globals(), ( BriefFixture, ), {
+    'parameters': {
+        'value': { 'a': 1, },
+    },
+
+    'expected': "{'a': 1}",
+})
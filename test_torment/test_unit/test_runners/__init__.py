@@ -0,0 +1,349 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib
+import io
+import os
+import sys
+import tempfile
+import textwrap
+import threading
+import types
+import typing  # noqa (use mypy typing)
+import unittest
+
+from typing import Any
+from typing import Dict
+
+from torment import contexts
+from torment import fixtures
+from torment import runners
+
+MODULE = textwrap.dedent(
+    '''
+    import unittest
+
+    from torment import contexts
+    from torment import fixtures
+
+
+    class RunnerFixture(fixtures.Fixture):
+        def run(self):
+            globals()[self.outcome](self)
+
+        def check(self):
+            self.context.assertNotEqual(self.outcome, 'fail')
+
+
+    def succeed(self):
+        pass
+
+
+    def fail(self):
+        pass
+
+
+    def error(self):
+        raise RuntimeError('error')
+
+
+    def skip(self):
+        raise unittest.SkipTest('skip')
+
+
+    def subtest(self):
+        with self.context.subTest(i = 1):
+            self.context.fail('subtest')
+
+
+    for outcome in ( 'succeed', 'succeed', 'fail', 'error', 'skip', 'subtest', ):
+        fixtures.register(globals(), ( RunnerFixture, ), { 'outcome': outcome, }, module = __name__, uuid = fixtures._derive_uuid(fixtures._as_uuid(__name__), len(globals())))
+
+
+    class RunnerTest(contexts.TestContext, metaclass = contexts.MetaContext):
+        fixture_classes = ( RunnerFixture, )
+
+
+    class SetUpClassTest(unittest.TestCase):
+        @classmethod
+        def setUpClass(cls):
+            raise RuntimeError('setUpClass')
+
+        def test_nothing(self):
+            pass
+    ''')
+
+
+class RunnerUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        _ = tempfile.TemporaryDirectory()
+        self.addCleanup(_.cleanup)
+
+        self.module_name = 'runner_d43830e2e9624dd19c438b15250c5818'
+
+        with open(os.path.join(_.name, self.module_name + '.py'), 'w') as fh:
+            fh.write(MODULE)
+
+        sys.path.insert(0, _.name)
+        self.addCleanup(sys.path.remove, _.name)
+        self.addCleanup(sys.modules.pop, self.module_name, None)
+
+        self.module = importlib.import_module(self.module_name)
+
+    def outcomes(self, result: unittest.TestResult) -> Dict[str, Any]:
+        return {
+            'run': result.testsRun,
+            'failures': sorted(str(_[0]) for _ in result.failures),
+            'errors': sorted(str(_[0]) for _ in result.errors),
+            'skipped': sorted(str(_[0]) for _ in result.skipped),
+        }
+
+    def run_suite(self, runner_class: type, **kwargs) -> unittest.TestResult:
+        suite = unittest.defaultTestLoader.loadTestsFromModule(self.module)
+
+        return runner_class(stream = io.StringIO(), **kwargs).run(suite)
+
+
+class ParallelTestRunnerUnitTest(RunnerUnitTest):
+    def test_parallel_matches_serial(self) -> None:
+        '''torment.runners.ParallelTestRunner().run(suite) ≡ unittest.TextTestRunner().run(suite)'''
+
+        serial = self.run_suite(unittest.TextTestRunner)
+        parallel = self.run_suite(runners.ParallelTestRunner, workers = 2)
+
+        self.assertEqual(self.outcomes(serial), self.outcomes(parallel))
+        self.assertEqual(len(parallel.failures), 2)
+        self.assertEqual(len(parallel.errors), 2)
+
+    def test_parallel_chunksize(self) -> None:
+        '''torment.runners.ParallelTestRunner(chunksize = 1).run(suite) ≡ unittest.TextTestRunner().run(suite)'''
+
+        serial = self.run_suite(unittest.TextTestRunner)
+        parallel = self.run_suite(runners.ParallelTestRunner, workers = 2, chunksize = 1)
+
+        self.assertEqual(self.outcomes(serial), self.outcomes(parallel))
+
+    def test_chunks(self) -> None:
+        '''torment.runners._chunks(tests, size): consecutive test cases of a context class'''
+
+        class FirstTest(unittest.TestCase):
+            def test_a(self) -> None:
+                pass
+
+            def test_b(self) -> None:
+                pass
+
+            def test_c(self) -> None:
+                pass
+
+        class SecondTest(FirstTest):
+            pass
+
+        tests = list(unittest.defaultTestLoader.loadTestsFromTestCase(FirstTest)) + list(unittest.defaultTestLoader.loadTestsFromTestCase(SecondTest))
+
+        self.assertEqual([ [ type(_).__name__ for _ in chunk ] for chunk in runners._chunks(tests, None) ], [
+            [ 'FirstTest', 'FirstTest', 'FirstTest', ],
+            [ 'SecondTest', 'SecondTest', 'SecondTest', ],
+        ])
+
+        self.assertEqual([ len(_) for _ in runners._chunks(tests, 2) ], [ 2, 1, 2, 1, ])
+
+        self.assertIsNone(runners.ParallelTestRunner().chunksize)
+        self.assertEqual(runners.ThreadedTestRunner().chunksize, 1)
+
+    def test_parallel_tracebacks(self) -> None:
+        '''torment.runners.ParallelTestRunner().run(suite) reports worker tracebacks'''
+
+        result = self.run_suite(runners.ParallelTestRunner, workers = 2)
+
+        tracebacks = '\n'.join(_[1] for _ in result.errors + result.failures)
+
+        self.assertIn('RuntimeError: error', tracebacks)
+        self.assertIn('RuntimeError: setUpClass', tracebacks)
+        self.assertIn('AssertionError: subtest', tracebacks)
+
+    def test_parallel_timings(self) -> None:
+        '''torment.runners.ParallelTestRunner().timings'''
+
+        runner = runners.ParallelTestRunner(stream = io.StringIO(), workers = 2)
+        runner.run(unittest.defaultTestLoader.loadTestsFromTestCase(self.module.RunnerTest))
+
+        self.assertEqual(len(runner.timings), 6)
+        self.assertTrue(all(_ >= 0 for _ in runner.timings.values()))
+
+    def test_local_contexts(self) -> None:
+        '''torment.runners.ParallelTestRunner().run(suite) with a local context'''
+
+        class LocalTest(unittest.TestCase):
+            def test_local(self) -> None:
+                self.assertIn(self.module_name, sys.modules)
+
+        LocalTest.module_name = self.module_name
+
+        result = runners.ParallelTestRunner(stream = io.StringIO(), workers = 2).run(unittest.defaultTestLoader.loadTestsFromTestCase(LocalTest))
+
+        self.assertEqual(result.testsRun, 1)
+        self.assertTrue(result.wasSuccessful())
+
+
+class ThreadedTestRunnerUnitTest(RunnerUnitTest):
+    def test_threaded_matches_serial(self) -> None:
+        '''torment.runners.ThreadedTestRunner().run(suite) ≡ unittest.TextTestRunner().run(suite)'''
+
+        serial = self.run_suite(unittest.TextTestRunner)
+        threaded = self.run_suite(runners.ThreadedTestRunner, workers = 2)
+
+        self.assertEqual(self.outcomes(serial), self.outcomes(threaded))
+
+    def test_threaded_threads(self) -> None:
+        '''torment.runners.ThreadedTestRunner().run(suite) only runs concurrent Fixtures in other threads'''
+
+        threads = {}  # type: Dict[str, threading.Thread]
+
+        class ThreadFixture(fixtures.Fixture):
+            def run(self) -> None:
+                threads[self.__class__.__name__] = threading.current_thread()
+
+        class SerialFixture(ThreadFixture):
+            concurrent = False
+
+        class MockedFixture(ThreadFixture):
+            mocks = { 'symbol': {}, }
+
+        class ThreadTest(contexts.TestContext):
+            test_thread = contexts._method(contexts._Case(ThreadFixture), 'test_thread')
+            test_serial = contexts._method(contexts._Case(SerialFixture), 'test_serial')
+            test_mocked = contexts._method(contexts._Case(MockedFixture), 'test_mocked')
+
+            def test_plain(self) -> None:
+                threads['plain'] = threading.current_thread()
+
+        result = runners.ThreadedTestRunner(stream = io.StringIO(), workers = 2).run(unittest.defaultTestLoader.loadTestsFromTestCase(ThreadTest))
+
+        self.assertEqual(result.testsRun, 4)
+        self.assertTrue(result.wasSuccessful())
+
+        self.assertIsNot(threads['ThreadFixture'], threading.current_thread())
+        self.assertIs(threads['SerialFixture'], threading.current_thread())
+        self.assertIs(threads['MockedFixture'], threading.current_thread())
+        self.assertIs(threads['plain'], threading.current_thread())
+
+    def test_threaded_serial_context(self) -> None:
+        '''torment.runners.ThreadedTestRunner().run(suite) runs contexts that aren't concurrent in this thread'''
+
+        threads = []  # type: typing.List[threading.Thread]
+
+        class ThreadFixture(fixtures.Fixture):
+            def run(self) -> None:
+                threads.append(threading.current_thread())
+
+        class SerialTest(contexts.TestContext):
+            concurrent = False
+
+            test_first = contexts._method(contexts._Case(ThreadFixture), 'test_first')
+            test_second = contexts._method(contexts._Case(ThreadFixture), 'test_second')
+
+        result = runners.ThreadedTestRunner(stream = io.StringIO(), workers = 2).run(unittest.defaultTestLoader.loadTestsFromTestCase(SerialTest))
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(threads, [ threading.current_thread(), ] * 2)
+
+    def test_threaded_class_fixtures(self) -> None:
+        '''torment.runners.ThreadedTestRunner().run(suite) runs class fixtures once around concurrent and serial test cases'''
+
+        calls = []  # type: typing.List[str]
+
+        class ThreadFixture(fixtures.Fixture):
+            def run(self) -> None:
+                calls.append('concurrent' if self.concurrent else 'serial')
+
+        class SerialFixture(ThreadFixture):
+            concurrent = False
+
+        class ClassFixtureTest(contexts.TestContext):
+            test_concurrent = contexts._method(contexts._Case(ThreadFixture), 'test_concurrent')
+            test_serial = contexts._method(contexts._Case(SerialFixture), 'test_serial')
+
+            @classmethod
+            def setUpClass(cls) -> None:
+                calls.append('setUpClass')
+
+            @classmethod
+            def tearDownClass(cls) -> None:
+                calls.append('tearDownClass')
+
+        result = runners.ThreadedTestRunner(stream = io.StringIO(), workers = 2).run(unittest.defaultTestLoader.loadTestsFromTestCase(ClassFixtureTest))
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(calls, [ 'setUpClass', 'concurrent', 'serial', 'tearDownClass', ])
+
+    def test_threaded_module_fixtures(self) -> None:
+        '''torment.runners.ThreadedTestRunner().run(suite) runs module fixtures around the module's contexts'''
+
+        calls = []  # type: typing.List[str]
+
+        module = types.ModuleType('test_torment.test_unit.test_runners.module_fixtures')
+        module.setUpModule = lambda: calls.append('setUpModule')
+        module.tearDownModule = lambda: calls.append('tearDownModule')
+
+        sys.modules[module.__name__] = module
+        self.addCleanup(sys.modules.pop, module.__name__)
+
+        class ThreadFixture(fixtures.Fixture):
+            def run(self) -> None:
+                calls.append(type(self.context).__name__)
+
+        class FirstTest(contexts.TestContext):
+            test_concurrent = contexts._method(contexts._Case(ThreadFixture), 'test_concurrent')
+
+        class SecondTest(FirstTest):
+            pass
+
+        FirstTest.__module__ = SecondTest.__module__ = module.__name__
+
+        suite = unittest.TestSuite([ unittest.defaultTestLoader.loadTestsFromTestCase(_) for _ in ( FirstTest, SecondTest, ) ])
+        result = runners.ThreadedTestRunner(stream = io.StringIO(), workers = 2).run(suite)
+
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(calls, [ 'setUpModule', 'FirstTest', 'SecondTest', 'tearDownModule', ])
+
+    def test_threaded_module_fixture_failure(self) -> None:
+        '''torment.runners.ThreadedTestRunner().run(suite) skips a module's contexts if setUpModule fails'''
+
+        calls = []  # type: typing.List[str]
+
+        module = types.ModuleType('test_torment.test_unit.test_runners.module_failure')
+
+        def setUpModule() -> None:
+            raise RuntimeError('setUpModule')
+
+        module.setUpModule = setUpModule
+
+        sys.modules[module.__name__] = module
+        self.addCleanup(sys.modules.pop, module.__name__)
+
+        class ThreadFixture(fixtures.Fixture):
+            def run(self) -> None:
+                calls.append('run')
+
+        class FailingTest(contexts.TestContext):
+            test_concurrent = contexts._method(contexts._Case(ThreadFixture), 'test_concurrent')
+
+        FailingTest.__module__ = module.__name__
+
+        result = runners.ThreadedTestRunner(stream = io.StringIO(), workers = 2).run(unittest.defaultTestLoader.loadTestsFromTestCase(FailingTest))
+
+        self.assertEqual(calls, [])
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn('setUpModule (' + module.__name__ + ')', str(result.errors[0][0]))
@@ -0,0 +1,161 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import pickle
+import typing  # noqa (use mypy typing)
+import unittest
+
+from torment import snapshots
+
+
+class FreezeUnitTest(unittest.TestCase):
+    def test_freeze_dict(self) -> None:
+        '''torment.snapshots.freeze({ 'a': [ 1, ], }) → MappingSnapshot'''
+
+        frozen = snapshots.freeze({ 'a': [ 1, ], })
+
+        self.assertIsInstance(frozen, snapshots.MappingSnapshot)
+        self.assertIsInstance(frozen['a'], snapshots.SequenceSnapshot)
+
+    def test_freeze_tuple(self) -> None:
+        '''torment.snapshots.freeze(( {}, )) → ( MappingSnapshot, )'''
+
+        frozen = snapshots.freeze(( {}, ))
+
+        self.assertIsInstance(frozen, tuple)
+        self.assertIsInstance(frozen[0], snapshots.MappingSnapshot)
+
+    def test_freeze_copies_other_values(self) -> None:
+        '''torment.snapshots.freeze({ 'a': set(), })['a'] is a copy'''
+
+        value = set()
+
+        self.assertIsNot(value, snapshots.freeze({ 'a': value, })['a'])
+
+    def test_thaw(self) -> None:
+        '''torment.snapshots.thaw(freeze(x)) == x (and plain)'''
+
+        expected = { 'a': [ 1, { 'b': ( [ 2, ], ), }, ], }
+
+        thawed = snapshots.thaw(snapshots.freeze(expected))
+
+        self.assertEqual(expected, thawed)
+        self.assertIs(dict, type(thawed))
+        self.assertIs(list, type(thawed['a']))
+        self.assertIs(list, type(thawed['a'][1]['b'][0]))
+
+
+class SnapshotUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.expected = { 'a': { 'b': [ 1, 2, { 'c': 3, }, ], }, 't': ( { 'd': 4, }, ), 'n': 5, }
+        self.base = snapshots.freeze(self.expected)
+
+    def assertUnchanged(self) -> None:
+        self.assertEqual(self.expected, self.base)
+
+    def test_equal(self) -> None:
+        '''MappingSnapshot == dict and SequenceSnapshot == list'''
+
+        self.assertEqual(self.expected, self.base)
+        self.assertEqual(self.base, self.expected)
+        self.assertEqual([ 1, 2, { 'c': 3, }, ], self.base['a']['b'])
+        self.assertEqual(repr(self.expected['a']), repr(self.base['a']))
+
+    def test_abstract(self) -> None:
+        '''torment.snapshots._Snapshot is abstract (_frozen and _owned)'''
+
+        self.assertEqual(snapshots._Snapshot.__abstractmethods__, frozenset(( '_frozen', '_owned', )))
+
+        with self.assertRaises(TypeError):
+            snapshots._Snapshot._wrap({})
+
+    def test_deepcopy_shares(self) -> None:
+        '''copy.deepcopy(snapshot) shares the underlying data'''
+
+        _ = copy.deepcopy(self.base)
+
+        self.assertIs(self.base._data, _._data)
+
+    def test_modify_top(self) -> None:
+        '''copy.deepcopy(snapshot)['n'] = 6 doesn't modify the original'''
+
+        _ = copy.deepcopy(self.base)
+        _['n'] = 6
+
+        self.assertEqual(6, _['n'])
+        self.assertUnchanged()
+
+    def test_modify_nested(self) -> None:
+        '''copy.deepcopy(snapshot)['a']['b'][2]['c'] = 6 doesn't modify the original'''
+
+        _ = copy.deepcopy(self.base)
+        _['a']['b'][2]['c'] = 6
+        _['a']['b'].append(7)
+
+        self.assertEqual([ 1, 2, { 'c': 6, }, 7, ], _['a']['b'])
+        self.assertUnchanged()
+
+    def test_modify_through_tuple(self) -> None:
+        '''copy.deepcopy(snapshot)['t'][0]['d'] = 6 doesn't modify the original'''
+
+        _ = copy.deepcopy(self.base)
+        _['t'][0]['d'] = 6
+
+        self.assertEqual(6, _['t'][0]['d'])
+        self.assertUnchanged()
+
+    def test_modify_original(self) -> None:
+        '''snapshot['a']['b'][0] = 6 doesn't modify earlier copies'''
+
+        _ = copy.deepcopy(self.base)
+        self.base['a']['b'][0] = 6
+
+        self.assertEqual(1, _['a']['b'][0])
+        self.assertEqual(6, copy.deepcopy(self.base)['a']['b'][0])
+
+    def test_modify_held_child(self) -> None:
+        '''a child read before its parent is modified stays attached'''
+
+        _ = copy.deepcopy(self.base)
+
+        child = _['a']
+        _['n'] = 6
+        child['x'] = 7
+
+        self.assertEqual(7, _['a']['x'])
+        self.assertUnchanged()
+
+    def test_store_dict(self) -> None:
+        '''snapshot['e'] = dict stores a copy'''
+
+        value = { 'f': 1, }
+
+        self.base['e'] = value
+        value['f'] = 2
+
+        self.assertEqual({ 'f': 1, }, self.base['e'])
+
+    def test_sequence_slice(self) -> None:
+        '''SequenceSnapshot[1:] is a SequenceSnapshot'''
+
+        _ = self.base['a']['b'][1:]
+
+        self.assertIsInstance(_, snapshots.SequenceSnapshot)
+        self.assertEqual([ 2, { 'c': 3, }, ], _)
+
+    def test_pickle(self) -> None:
+        '''pickle.loads(pickle.dumps(snapshot)) == snapshot'''
+
+        self.assertEqual(self.expected, pickle.loads(pickle.dumps(self.base)))
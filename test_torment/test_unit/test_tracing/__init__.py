@@ -0,0 +1,217 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import json
+import threading
+import typing  # noqa (use mypy typing)
+import unittest
+import uuid
+
+from torment import contexts
+from torment import decorators
+from torment import fixtures
+from torment import tracing
+
+
+class SpanUnitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.spans = []
+
+        self.addCleanup(tracing.set_sink, tracing.set_sink(self.spans.append))
+
+    def test_no_sink(self) -> None:
+        '''torment.tracing.span: without a sink'''
+
+        tracing.set_sink(None)
+
+        with tracing.span('outer'):
+            pass
+
+        self.assertEqual(self.spans, [])
+
+    def test_active(self) -> None:
+        '''torment.tracing.active()'''
+
+        self.assertTrue(tracing.active())
+
+        tracing.set_sink(None)
+
+        self.assertFalse(tracing.active())
+
+    def test_nested_log(self) -> None:
+        '''torment.tracing.span: nested decorators.log calls'''
+
+        @decorators.log
+        def inner(argument):
+            pass
+
+        @decorators.log
+        def outer():
+            inner('x' * 1000)
+
+        outer()
+
+        self.assertEqual([ ( _.name, _.depth, _.thread, ) for _ in self.spans ], [
+            ( 'inner', 1, threading.get_ident(), ),
+            ( 'outer', 0, threading.get_ident(), ),
+        ])
+
+        self.assertLess(len(self.spans[0].arguments), 100)
+        self.assertLessEqual(self.spans[1].start, self.spans[0].start)
+        self.assertLessEqual(self.spans[0].end, self.spans[1].end)
+
+    def test_generator(self) -> None:
+        '''torment.tracing.span: decorators.log generator spans its iteration'''
+
+        @decorators.log
+        def items():
+            yield 1
+            yield 2
+
+        iterator = items()
+
+        self.assertEqual(self.spans, [])
+
+        with tracing.span('consumer'):
+            self.assertEqual(list(iterator), [ 1, 2, ])
+
+        self.assertEqual([ ( _.name, _.depth, _.asynchronous, ) for _ in self.spans ], [ ( 'items', 1, True, ), ( 'consumer', 0, False, ), ])
+
+    def test_interleaved_generators(self) -> None:
+        '''torment.tracing.span: suspended decorators.log generators don't nest other spans'''
+
+        @decorators.log
+        def f():
+            pass
+
+        @decorators.log
+        def items():
+            yield 1
+            f()
+            yield 2
+
+        first, second = items(), items()
+
+        next(first)
+        next(second)
+        f()
+        next(first)
+        list(second)
+        list(first)
+
+        self.assertEqual([ ( _.name, _.depth, ) for _ in self.spans ], [
+            ( 'f', 0, ),
+            ( 'f', 0, ),
+            ( 'f', 0, ),
+            ( 'items', 0, ),
+            ( 'items', 0, ),
+        ])
+
+        with tracing.span('after'):
+            pass
+
+        self.assertEqual(self.spans[-1].depth, 0)
+
+    def test_collection_and_execution(self) -> None:
+        '''torment.tracing.span: register, MetaContext, and Fixture execution'''
+
+        class SpanFixture(fixtures.Fixture):
+            pass
+
+        ns = {}  # type: typing.Dict[str, typing.Any]
+
+        fixtures.register(ns, ( SpanFixture, ), {}, module = __name__, uuid = uuid.uuid4())
+
+        class SpanTest(contexts.TestContext, metaclass = contexts.MetaContext):
+            fixture_classes = ( SpanFixture, )
+
+        unittest.defaultTestLoader.loadTestsFromTestCase(SpanTest).run(unittest.TestResult())
+
+        names = [ _.name for _ in self.spans ]
+
+        self.assertIn('register', names)
+        self.assertIn('MetaContext', names)
+        self.assertIn(list(ns)[0], names)
+
+
+class ChromeTraceUnitTest(unittest.TestCase):
+    def test_dump(self) -> None:
+        '''torment.tracing.ChromeTrace().dump()'''
+
+        trace = tracing.ChromeTrace()
+
+        trace(tracing.Span('outer', 1.0, 1.5, 7, 0, 'a'))
+        trace(tracing.Span('inner', 1.25, 1.5, 7, 1, ''))
+
+        fp = io.StringIO()
+        trace.dump(fp)
+
+        events = json.loads(fp.getvalue())['traceEvents']
+
+        self.assertEqual([ _['ph'] for _ in events ], [ 'M', 'X', 'X', ])
+        self.assertEqual(events[1]['ts'], 1e6)
+        self.assertEqual(events[1]['dur'], 0.5e6)
+        self.assertEqual(events[2]['args'], { 'arguments': '', 'depth': 1, })
+        self.assertEqual(set(_['tid'] for _ in events), { 7, })
+
+    def test_dump_asynchronous(self) -> None:
+        '''torment.tracing.ChromeTrace().dump(): asynchronous spans'''
+
+        trace = tracing.ChromeTrace()
+
+        trace(tracing.Span('first', 1.0, 2.0, 7, 0, '', True))
+        trace(tracing.Span('second', 1.5, 2.5, 7, 0, '', True))
+
+        fp = io.StringIO()
+        trace.dump(fp)
+
+        events = json.loads(fp.getvalue())['traceEvents']
+
+        self.assertEqual([ ( _['ph'], _.get('ts'), ) for _ in events ], [
+            ( 'M', None, ),
+            ( 'b', 1e6, ),
+            ( 'e', 2e6, ),
+            ( 'b', 1.5e6, ),
+            ( 'e', 2.5e6, ),
+        ])
+
+        self.assertEqual(events[1]['id'], events[2]['id'])
+        self.assertNotEqual(events[1]['id'], events[3]['id'])
+
+    def test_threads(self) -> None:
+        '''torment.tracing.ChromeTrace(): spans from several threads'''
+
+        trace = tracing.ChromeTrace()
+
+        def spanning() -> None:
+            for _ in range(100):
+                trace(tracing.Span('span', 1.0, 2.0, threading.get_ident(), 0, '', bool(_ % 2)))
+
+        threads = [ threading.Thread(target = spanning) for _ in range(4) ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        fp = io.StringIO()
+        trace.dump(fp)
+
+        events = json.loads(fp.getvalue())['traceEvents']
+
+        self.assertEqual(len([ _ for _ in events if _['ph'] == 'M' ]), len(set(_['tid'] for _ in events)))
+        self.assertEqual(len([ _ for _ in events if _['ph'] == 'X' ]), 200)
+        self.assertEqual(len(set(_['id'] for _ in events if _['ph'] == 'b')), 200)
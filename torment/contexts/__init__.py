@@ -12,21 +12,37 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib
 import unittest
 import unittest.mock
 import re
 import logging
+import threading
+import types
 import typing  # noqa (use mypy typing)
 import warnings
 
 from typing import Any
 from typing import Callable
+from typing import Tuple
+from typing import Union
 
 from torment import decorators
 from torment import fixtures
+from torment import tracing
 
 logger = logging.getLogger(__name__)
 
+_PATCH_LOCK = threading.Condition()
+
+_PATCHED = {}  # type: typing.Dict[str, Tuple[int, int]]
+
+_TEST_PATCHES = {}  # type: typing.Dict[int, int]
+
+_TARGETS = {}  # type: typing.Dict[str, Tuple[types.ModuleType, str]]
+
+_AUTOSPECS = {}  # type: typing.Dict[str, typing.List[_Autospec]]
+
 
 @property
 def _module(self) -> str:
@@ -39,60 +55,264 @@ class MetaContext(type):
     '''``torment.TestContext`` class creator.
 
     Generates all testing methods that correspond with the fixtures associated
-    with a ``torment.TestContext``.  Also updates the definitions of
+    with a ``torment.TestContext``.  Only the fixtures' classes are involved:
+    each method creates its Fixture when it's run (and only then).  Also updates the definitions of
     ``mocks_mask`` and ``mocks`` to include the union of all involved classes
-    in the creation process (all parent classes and the class being created).
+    in the creation process (all parent classes and the class being created)
+    and indexes the class' ``mock_`` methods as ``mockers`` (so fixtures'
+    ``mocks`` can be matched to mockers without probing the class).
 
     When creating a ``torment.TestContext`` subclass, ensure you specify this
     class as its metaclass to automatically generate test cases based on its
-    ``fixture_classes`` property.
+    ``fixture_classes`` property (limited to the Fixtures in the class'
+    ``shard``, if any, so splitting a suite across machines only creates the
+    local shard's test methods).  With an ``async_concurrency``, the
+    ``torment.fixtures.AsyncFixture`` classes that can run concurrently are
+    collected into a single ``test_async_fixtures`` method instead (each
+    Fixture is reported as a subtest).  With ``batch_fixtures``, the other
+    Fixtures are all run by a single ``test_fixtures`` method (in the order the
+    loader would have run their methods and each reported as a subtest).
 
     '''
 
     module = _module
 
     def __init__(cls, name, bases, dct) -> None:
-        super(MetaContext, cls).__init__(name, bases, dct)
+        with tracing.span('MetaContext', name):
+            super(MetaContext, cls).__init__(name, bases, dct)
+
+            cls.mocks_mask = set().union(getattr(cls, 'mocks_mask', set()), *[ getattr(base, 'mocks_mask', set()) for base in bases ])
+            cls.mocks = set().union(getattr(cls, 'mocks', set()), *[ getattr(base, 'mocks', set()) for base in bases ])
+
+            cls.docker_compose_services = set().union(getattr(cls, 'docker_compose_services', set()), *[ getattr(base, 'docker_compose_services', set()) for base in bases ])
+
+            cls.mockers = frozenset(_ for _ in dir(cls) if _.startswith('mock_'))
+
+            if not hasattr(cls, 'fixture_classes'):
+                warnings.warn('type object \'{0}\' has no attribute \'fixture_classes\'')
+            else:
+                shard = getattr(cls, 'shard', None)
+                async_concurrency = getattr(cls, 'async_concurrency', None)
+
+                batch = []  # type: typing.List[type]
+                cases = []  # type: typing.List[Tuple[str, _Case]]
+
+                for fixture_class in fixtures.classes_of(cls.fixture_classes, shard = shard):
+                    if async_concurrency is not None and issubclass(fixture_class, fixtures.AsyncFixture) and _concurrent(fixture_class):
+                        batch.append(fixture_class)
+                    else:
+                        cases.append(( 'test_' + fixture_class.__name__, _Case(fixture_class), ))
+
+                if len(batch):
+                    cls.test_async_fixtures = _method(_AsyncBatch(tuple(batch)), 'test_async_fixtures', cls, 'AsyncFixtures of {0} (concurrently)'.format(name))
+
+                for product in fixtures.products(cls.fixture_classes):
+                    for index in product.indices(shard = shard):
+                        cases.append(( product.name(index), _ProductCase(product, index), ))
+
+                if getattr(cls, 'batch_fixtures', False):
+                    if len(cases):
+                        cls.test_fixtures = _method(_Batch(tuple(case for _, case in sorted(cases, key = lambda _: _[0]))), 'test_fixtures', cls, 'Fixtures of {0} (batched)'.format(name))
+                else:
+                    for method_name, case in cases:
+                        setattr(cls, method_name, _method(case, method_name, cls))
+
+
+def _method(case: Callable[['TestContext'], None], name: str, owner: Union[None, type] = None, doc: Union[None, str] = None) -> Callable[['TestContext'], None]:
+    '''Test method (a plain function, as test loaders expect) running case.
+
+    **Parameters**
+
+    :``case``:  callable run with the test's context (i.e. a ``_Case``)
+    :``name``:  name of the method
+    :``owner``: class the method is defined in (qualifies its name)
+    :``doc``:   docstring of the method (``_Case`` methods are described
+                lazily by ``TestContext.shortDescription``)
+
+    **Return Value(s)**
+
+    The function (with the case as its ``_torment_case``).
+
+    '''
+
+    def method(self) -> None:
+        case(self)
+
+    method.__name__ = name
+    method.__qualname__ = owner.__qualname__ + '.' + name if owner is not None else name
+    method.__doc__ = doc
+    method._torment_case = case
+
+    if owner is not None:
+        method.__module__ = owner.__module__
+
+    return method
+
+
+def _case(test: unittest.TestCase) -> Union[None, '_Case']:
+    '''The ``_Case`` test runs (``None`` if it isn't a Fixture test case).'''
+
+    method = getattr(type(test), getattr(test, '_testMethodName', ''), None)
+    case = getattr(method, '_torment_case', None)
+
+    return case if isinstance(case, _Case) else None
+
+
+class _Case(object):
+    '''Test case for a Fixture class (run by its ``_method``).
+
+    Holds only the Fixture class; the Fixture is created (once per test) when
+    the test is run.
+
+    '''
+
+    __slots__ = ( 'fixture_class', )
+
+    def __init__(self, fixture_class: type) -> None:
+        self.fixture_class = fixture_class
+
+    def __call__(self, context: 'TestContext') -> None:
+        with tracing.span(self.fixture_class.__name__, context.id()):
+            self.fixture(context)._execute()
+
+    def fixture(self, context: 'TestContext') -> fixtures.Fixture:
+        '''The Fixture for the test running in context (created on first use).'''
+
+        if '_torment_fixture' not in vars(context):
+            context._torment_fixture = self.fixture_class(context)
+
+        return context._torment_fixture
+
+    @property
+    def uuid(self) -> str:
+        '''Hex UUID of the Fixture class (its name if it has no UUID).'''
+
+        return _uuid_hex(self.fixture_class)
+
+    def description(self, context: 'TestContext') -> str:
+        '''Description of the test running in context.
 
-        cls.mocks_mask = set().union(getattr(cls, 'mocks_mask', set()), *[ getattr(base, 'mocks_mask', set()) for base in bases ])
-        cls.mocks = set().union(getattr(cls, 'mocks', set()), *[ getattr(base, 'mocks', set()) for base in bases ])
+        The Fixture's description once the test has created it; until then (or
+        if the Fixture can't be described) the Fixture's UUID and context's
+        module.  Describing never creates the Fixture: runners describe tests
+        outside of any error handling so only running the test does.
 
-        cls.docker_compose_services = set().union(getattr(cls, 'docker_compose_services', set()), *[ getattr(base, 'docker_compose_services', set()) for base in bases ])
+        '''
+
+        _ = None
+
+        fixture = vars(context).get('_torment_fixture')
+
+        if fixture is not None:
+            try:
+                _ = fixture.description
+            except Exception:
+                logger.exception('description of %s failed', self.uuid)
+
+        if _ is None:
+            _ = '{0}—{1}'.format(self.uuid, context.module)
+
+        if len(context.mocks_mask):
+            _ += '—unmocked:' + ','.join(sorted(context.mocks_mask))
+
+        return _
+
+
+class _ProductCase(_Case):
+    '''Test method for a combination of a ``torment.fixtures.FixtureProduct``.
+
+    Holds only the product and the combination's index; the combination's
+    Fixture class is created along with its Fixture.
+
+    '''
+
+    __slots__ = ( 'product', 'index', )
+
+    def __init__(self, product: fixtures.FixtureProduct, index: int) -> None:
+        self.product = product
+        self.index = index
+
+    @property
+    def fixture_class(self) -> type:
+        return self.product[self.index]
+
+    @property
+    def uuid(self) -> str:
+        return self.product.uuid_of(self.index).hex
+
+
+class _AsyncBatch(object):
+    '''Test case running AsyncFixture classes concurrently on one context.
+
+    The Fixtures are created and executed together (see
+    ``torment.fixtures.execute_concurrently``) and then each Fixture's outcome
+    is reported as a subtest.
+
+    '''
+
+    __slots__ = ( 'fixture_classes', )
 
-        def generate_case(fixture: fixtures.Fixture) -> Callable[[Any], None]:
-            '''Generate a ``unittest.TestCase`` compatible test method.
+    def __init__(self, fixture_classes: Tuple[type, ...]) -> None:
+        self.fixture_classes = fixture_classes
 
-            Parameters
-            ----------
+    def __call__(self, context: 'TestContext') -> None:
+        batch = []  # type: typing.List[fixtures.AsyncFixture]
 
-            :``fixture``: the fixture to transform into a ``unittest.TestCase``
-                          compatible test method
+        for fixture_class in self.fixture_classes:
+            with context.subTest(fixture = fixture_class.__name__):
+                batch.append(fixture_class(context))
 
-            Return Value(s)
-            ---------------
+        for fixture, error in zip(batch, fixtures.execute_concurrently(batch, context.async_concurrency)):
+            with context.subTest(fixture = fixture.__class__.__name__):
+                if error is not None:
+                    raise error
 
-            An acceptable method that nose will execute as a test case.
 
-            '''
+class _Batch(object):
+    '''Test case running the cases of a context one after the other.
 
-            def case(self) -> None:
-                fixture.context = self
-                fixture._execute()
+    Each case is run as a subtest (identified by its Fixture's UUID) as if it
+    were its own test: the context is torn down (running its cleanups) and
+    set up again between cases and each case creates its own Fixture.
 
-            case.__name__ = fixture.name
-            case.__doc__ = fixture.description
+    '''
+
+    __slots__ = ( 'cases', )
+
+    def __init__(self, cases: Tuple[_Case, ...]) -> None:
+        self.cases = cases
+
+    def __call__(self, context: 'TestContext') -> None:
+        last = len(self.cases) - 1
+
+        for index, case in enumerate(self.cases):
+            with context.subTest(uuid = case.uuid):
+                if index:
+                    context.setUp()
+
+                try:
+                    case(context)
+                finally:
+                    if index < last:
+                        _finish_case(context)
 
-            if len(cls.mocks_mask):
-                case.__doc__ += '—unmocked:' + ','.join(sorted(cls.mocks_mask))
 
-            return case
+def _uuid_hex(fixture_class: type) -> str:
+    '''Hex UUID of fixture_class (its name if it has no UUID).'''
 
-        if not hasattr(cls, 'fixture_classes'):
-            warnings.warn('type object \'{0}\' has no attribute \'fixture_classes\'')
-        else:
-            for fixture in fixtures.of(cls.fixture_classes, context = cls):
-                _ = generate_case(fixture)
-                setattr(cls, _.__name__, _)
+    return getattr(getattr(fixture_class, 'uuid', None), 'hex', fixture_class.__name__)
+
+
+def _finish_case(context: 'TestContext') -> None:
+    '''Tear down context after a batched case (as the end of a test would).'''
+
+    try:
+        context.tearDown()
+    finally:
+        context.doCleanups()
+
+        vars(context).pop('_torment_fixture', None)
+        vars(context).pop('_torment_mocked', None)
 
 
 class TestContext(unittest.TestCase):
@@ -113,6 +333,7 @@ class TestContext(unittest.TestCase):
     **Properties**
 
     * ``module``
+    * ``_is_mocked_<name>`` (read only; see ``__getattr__``)
 
     **Public Methods**
 
@@ -122,12 +343,49 @@ class TestContext(unittest.TestCase):
 
     :``mocks_mask``: set of mocks to mask from being mocked
     :``mocks``:      set of mocks this TestContext provides
+    :``mockers``:    names of this TestContext's ``mock_`` methods (set by
+                     ``torment.contexts.MetaContext``)
+    :``shard``:      shard of the Fixtures to generate test methods for (see
+                     ``torment.fixtures.classes_of``); defaults to the
+                     ``TORMENT_SHARD`` environment variable
+    :``async_concurrency``: maximum number of AsyncFixtures executing at once
+                            when they're run as a batch (see
+                            ``torment.contexts.MetaContext``); ``None`` (the
+                            default) gives each its own test method
+    :``concurrent``: whether this context's test cases can run alongside each
+                     other (see ``torment.runners.ThreadedTestRunner``);
+                     defaults to True
+    :``batch_fixtures``: run all (other) Fixtures from a single test method on
+                         one context instead of a method (and context) per
+                         Fixture (see ``torment.contexts.MetaContext``);
+                         cheaper to load and run for many cheap Fixtures
+    :``patch_scope``: ``'test'`` (the default) starts and stops patches
+                      for each test; ``'class'`` starts them once per context
+                      class (stopped after ``tearDownClass``) and resets their
+                      mocks (including ``return_value`` and ``side_effect``)
+                      before each test
+
+    .. note::
+        With a ``'class'`` ``patch_scope``, ``mock_`` methods are only called
+        by the first test that needs them so they should only ``patch``
+        (per-test configuration of the mocks belongs in the Fixtures'
+        ``mocks``).
 
     '''
 
     mocks_mask = set()  # type: Set[str]
     mocks = set()  # type: Set[str]
 
+    shard = None  # type: Union[None, str, Tuple[int, int]]
+
+    async_concurrency = None  # type: Union[None, int]
+
+    batch_fixtures = False  # type: bool
+
+    concurrent = True  # type: bool
+
+    patch_scope = 'test'  # type: str
+
     module = _module
 
     def setUp(self) -> None:
@@ -136,18 +394,68 @@ class TestContext(unittest.TestCase):
         logger.debug('self.__class__.mocks_mask: %s', self.__class__.mocks_mask)
         logger.debug('self.__class__.mocks: %s', self.__class__.mocks)
 
+        for attribute, mocked, template in vars(self.__class__).get('_torment_class_patches', {}).values():
+            if template is not None:
+                template.reset()
+            else:
+                _reset_mock(mocked)
+
+            setattr(self, attribute, mocked)
+
+    def shortDescription(self) -> str:
+        case = _case(self)
+
+        if case is not None:
+            return case.description(self)
+
+        return super().shortDescription()
+
+    def __getattr__(self, name: str) -> Any:
+        '''Compatibility ``_is_mocked_<name>`` attributes.
+
+        ``torment.decorators.mock`` used to record its result in a
+        ``_is_mocked_<name>`` attribute of the context.  It now records it per
+        thread (see ``torment.decorators.is_mocked``); these attributes read
+        that record for the current thread (False until the ``mock_`` method
+        has been called).  Assigning them no longer affects ``mock``.
+
+        '''
+
+        if name.startswith('_is_mocked_'):
+            return decorators.is_mocked(self, name[len('_is_mocked_'):])
+
+        raise AttributeError('{0!r} object has no attribute {1!r}'.format(self.__class__.__name__, name))
+
     @decorators.log
-    def patch(self, name: str, relative: bool = True) -> None:
+    def patch(self, name: str, relative: bool = True, autospec: bool = False) -> None:
         '''Patch name with mock in actual module.
 
         Sets up mock objects for the given symbol in the actual module
         corresponding to this context's testing module.
 
+        The module holding the symbol is resolved once per process and
+        autospecced mocks are created once per symbol: later patches of the
+        symbol reuse an idle one (reset as ``'class'`` ``patch_scope`` resets
+        mocks) rather than introspecting the original again.
+
+        With a ``'class'`` ``patch_scope``, the patch is started by the first
+        test of the context class and reused by the others (even when they run
+        concurrently).
+
+        Safe to call from concurrently running contexts: starting and stopping
+        patches is serialized and only one thread at a time has (``'test'``
+        scoped) patches.  Other threads wait for it to stop all of its patches
+        before starting theirs (patched symbols are shared by every thread so
+        their patches would clobber each other).  Patching a symbol that another
+        thread has patched for its context class raises ``RuntimeError``.
+
         **Parameters**
 
         :``name``:     the symbol to mock—must exist in the actual module under test
         :``relative``: prefix actual module corresponding to this context's
                        testing module to the given symbol to patch
+        :``autospec``: create the mock with ``unittest.mock.create_autospec``
+                       (calls are checked against the original's signatures)
 
         '''
 
@@ -158,6 +466,201 @@ class TestContext(unittest.TestCase):
 
         logger.debug('prefix: %s', prefix)
 
-        _ = unittest.mock.patch(prefix + name)
-        setattr(self, 'mocked_' + name.replace('.', '_').strip('_'), _.start())
-        self.addCleanup(_.stop)
+        target = prefix + name
+        attribute = 'mocked_' + name.replace('.', '_').strip('_')
+
+        holder, symbol = _resolve(target)
+
+        me = threading.get_ident()
+
+        with _PATCH_LOCK:
+            if self.patch_scope == 'class':
+                patches = vars(self.__class__).get('_torment_class_patches')
+
+                if patches is None:
+                    patches = self.__class__._torment_class_patches = {}
+
+                if target in patches:
+                    setattr(self, attribute, patches[target][1])
+
+                    return
+            else:
+                while len(_TEST_PATCHES) and me not in _TEST_PATCHES:
+                    _PATCH_LOCK.wait()
+
+            owner, count = _PATCHED.get(target, ( me, 0, ))
+
+            if owner != me:
+                raise RuntimeError('{0} is patched by another thread'.format(target))
+
+            template = None
+
+            if autospec and count == 0:
+                template = _autospec(target, getattr(holder, symbol))
+
+                _ = unittest.mock.patch.object(holder, symbol, template.mocked)
+            else:
+                _ = unittest.mock.patch.object(holder, symbol, autospec = autospec or None)
+
+            setattr(self, attribute, _.start())
+
+            _PATCHED[target] = ( owner, count + 1, )
+
+            if self.patch_scope == 'class':
+                patches[target] = ( attribute, getattr(self, attribute), template, )
+
+                self.addClassCleanup(_unpatch_class, self.__class__, target, _, template)
+            else:
+                _TEST_PATCHES[me] = _TEST_PATCHES.get(me, 0) + 1
+
+        if self.patch_scope != 'class':
+            self.addCleanup(_unpatch, target, _, template, me)
+
+
+class _Autospec(object):
+    '''Autospecced mock of a patch target (reused by later patches of it).
+
+    **Parameters**
+
+    :``original``: the object being patched
+
+    '''
+
+    __slots__ = ( 'mocked', 'return_value', )
+
+    def __init__(self, original: Any) -> None:
+        self.mocked = unittest.mock.create_autospec(original)
+
+        # i.e. the autospecced instance returned by an autospecced class
+        self.return_value = self.mocked.return_value if callable(self.mocked) else None
+
+    def reset(self) -> None:
+        '''Forget calls and configuration (keeping the spec'd return value).'''
+
+        _reset_mock(self.mocked)
+
+        if self.return_value is not None:
+            _reset_mock(self.return_value)
+
+            self.mocked.return_value = self.return_value
+
+
+def _autospec(target: str, original: Any) -> _Autospec:
+    '''Idle (reset) autospecced mock for target (created if there are none).'''
+
+    idle = _AUTOSPECS.setdefault(target, [])
+
+    if not len(idle):
+        return _Autospec(original)
+
+    template = idle.pop()
+    template.reset()
+
+    return template
+
+
+def _resolve(target: str) -> Tuple[Any, str]:
+    '''Object holding the patch target and the target's attribute name.
+
+    The holder is found as ``unittest.mock.patch`` finds it: each component of
+    its dotted path is an attribute of the previous one or else a submodule to
+    import.  Holders that are modules are cached (they're the same object for
+    the life of the process); others (i.e. classes that might be patched
+    themselves) are resolved on each call.
+
+    '''
+
+    try:
+        return _TARGETS[target]
+    except KeyError:
+        pass
+
+    path, symbol = target.rsplit('.', 1)
+
+    components = path.split('.')
+    holder = importlib.import_module(components[0])
+
+    for index, component in enumerate(components[1:], 2):
+        try:
+            holder = getattr(holder, component)
+        except AttributeError:
+            holder = importlib.import_module('.'.join(components[:index]))
+
+    if isinstance(holder, types.ModuleType):
+        _TARGETS[target] = ( holder, symbol, )
+
+    return holder, symbol
+
+
+def _reset_mock(mocked: Any) -> None:
+    '''Reset mocked's calls, ``return_value``, and ``side_effect``.
+
+    Only mocked's own ``return_value`` and ``side_effect`` are reset:
+    ``reset_mock(return_value = True)`` would also reset those of its children
+    (i.e. a ``MagicMock``'s ``__str__`` would return a ``MagicMock``).
+    Autospecced functions are functions (wrapping a mock) whose ``reset_mock``
+    takes no arguments and are reset the same way.
+
+    '''
+
+    mocked.reset_mock()
+
+    mocked.return_value = unittest.mock.DEFAULT
+    mocked.side_effect = None
+
+
+def _concurrent(fixture_class: type) -> bool:
+    '''Whether Fixtures of fixture_class can run alongside other Fixtures.
+
+    Fixture classes that aren't ``concurrent`` or have ``mocks`` (patches
+    replace module globals for every Fixture in the process) can't.
+
+    '''
+
+    mocks = getattr(fixture_class, '_torment_properties', {}).get('mocks', getattr(fixture_class, 'mocks', None))
+
+    return getattr(fixture_class, 'concurrent', False) and not mocks
+
+
+def _unpatch_class(context_class: type, target: str, patcher: Any, template: Union[None, _Autospec] = None) -> None:
+    '''Stop a class-scoped patch started by ``TestContext.patch``.
+
+    Also forgets the class' mocks recorded by ``torment.decorators.mock`` so the
+    next run of the class mocks them again.
+
+    '''
+
+    with _PATCH_LOCK:
+        _unpatch(target, patcher, template)
+
+        del context_class._torment_class_patches[target]
+
+    vars(context_class).get('_torment_class_mocked', set()).clear()
+
+
+def _unpatch(target: str, patcher: Any, template: Union[None, _Autospec] = None, thread: Union[None, int] = None) -> None:
+    '''Stop a patch started by ``TestContext.patch`` (returning its autospec).
+
+    Test scoped patches pass the thread that started them: once it has no more
+    patches, threads waiting to patch are woken.
+
+    '''
+
+    with _PATCH_LOCK:
+        patcher.stop()
+
+        owner, count = _PATCHED.pop(target)
+
+        if count > 1:
+            _PATCHED[target] = ( owner, count - 1, )
+
+        if template is not None:
+            _AUTOSPECS[target].append(template)
+
+        if thread is not None:
+            _TEST_PATCHES[thread] -= 1
+
+            if not _TEST_PATCHES[thread]:
+                del _TEST_PATCHES[thread]
+
+                _PATCH_LOCK.notify_all()
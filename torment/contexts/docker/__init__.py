@@ -50,11 +50,16 @@ class DockerContext(contexts.TestContext):
     :``docker_compose_services``: services defined in docker-compose.yml that
                                   this TestContext should start and stop for
                                   each test case
+    :``concurrent``:              False: every test case starts and stops the
+                                  (shared) docker-compose services so they
+                                  can't run alongside each other
 
     '''
 
     docker_compose_services = set()  # type: Set[str]
 
+    concurrent = False
+
     @staticmethod
     def setUpModule() -> None:
         '''Ensure docker-compose is available and all services are stopped.
@@ -13,7 +13,8 @@
 # limitations under the License.
 
 import logging
-import select
+import os
+import selectors
 import subprocess
 import typing  # noqa (use mypy typing)
 
@@ -21,6 +22,10 @@ from typing import Iterable
 
 logger = logging.getLogger(__name__)
 
+_READ_SIZE = 65536
+
+_EXITED_TIMEOUT = 1.0  # seconds between checks that command hasn't exited
+
 
 def found() -> bool:
     '''Determines if docker-compose is available as a shell command.
@@ -78,6 +83,10 @@ def up(services: Iterable[str] = ()) -> int:
 def _call(command: str, *args, **kwargs) -> int:
     '''Wrapper around ``subprocess.Popen`` that sends command output to logger.
 
+    Waits on command's output with a selector (so waiting costs no CPU), reads
+    whatever output is available at once, and logs it a line at a time (stdout
+    as debug and stderr as error messages) as lines are completed.
+
     .. seealso::
 
        ``subprocess.Popen``_
@@ -98,21 +107,66 @@ def _call(command: str, *args, **kwargs) -> int:
 
     child = subprocess.Popen(command, stdout = subprocess.PIPE, stderr = subprocess.PIPE, *args, **kwargs)
 
-    def log():
-        '''Send processes stdout and stderr to logger.'''
+    with selectors.DefaultSelector() as selector:
+        selector.register(child.stdout.fileno(), selectors.EVENT_READ, _Lines(command, logging.DEBUG))
+        selector.register(child.stderr.fileno(), selectors.EVENT_READ, _Lines(command, logging.ERROR))
 
-        for fh in select.select(( child.stdout, child.stderr, ), (), (), 0)[0]:
-            line = fh.readline()[:-1]
+        timeout = _EXITED_TIMEOUT
 
-            if len(line):
-                getattr(logger, {
-                    child.stdout: 'debug',
-                    child.stderr: 'error',
-                }[fh])('%s: %s', command, line)
+        while len(selector.get_map()):
+            events = selector.select(timeout)
+
+            for key, _ in events:
+                data = os.read(key.fd, _READ_SIZE)
+
+                if not len(data):
+                    selector.unregister(key.fd)
 
-    while child.poll() is None:
-        log()
+                key.data.feed(data)
 
-    log()
+            if not len(events):
+                if timeout == 0:
+                    break  # command exited but something else holds its output open
+
+                if child.poll() is not None:
+                    timeout = 0  # collect the output that's left
+
+    for fh in ( child.stdout, child.stderr, ):
+        fh.close()
 
     return child.wait()
+
+
+class _Lines(object):
+    '''Splits a command's output into lines (logging each at level).
+
+    **Parameters**
+
+    :``command``: command whose output this is
+    :``level``:   logging level of the output's lines
+
+    '''
+
+    __slots__ = ( 'command', 'level', 'partial', )
+
+    def __init__(self, command: str, level: int) -> None:
+        self.command = command
+        self.level = level
+
+        self.partial = b''
+
+    def feed(self, data: bytes) -> None:
+        '''Log the lines completed by data (all remaining output if data is empty).'''
+
+        if len(data):
+            lines = ( self.partial + data ).split(b'\n')
+            self.partial = lines.pop()
+        else:
+            lines, self.partial = [ self.partial, ], b''
+
+        if not logger.isEnabledFor(self.level):
+            return
+
+        for line in lines:
+            if len(line):
+                logger.log(self.level, '%s: %s', self.command, line.decode(errors = 'replace'))
@@ -15,19 +15,41 @@
 import functools
 import inspect
 import logging
+import reprlib
+import threading
 import typing  # noqa (use mypy typing)
 
 from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import Set
+from typing import Tuple
+
+from torment import tracing
 
 logger = logging.getLogger(__name__)
 logger.propogate = False
 logger.addHandler(logging.NullHandler())
 
+_REPR = reprlib.Repr()
+_REPR.maxstring = _REPR.maxother = 80
+
 
 def log(prefix = ''):
     '''Add start and stop logging messages to the function.
 
+    The logged name (prefixed, and qualified by the class for methods) is
+    determined when the function is decorated and the arguments are only
+    rendered (with ``reprlib``, so large arguments are abbreviated) when the
+    messages will be logged: with ``logger`` silent the wrapper costs little
+    more than the call itself.  Calls are also recorded as spans (see
+    ``torment.tracing``) while a span sink is installed.
+
+    Generator functions and coroutine functions are logged (and timed, as
+    asynchronous spans) from when their iteration starts (or they're first
+    awaited) until it's finished: exceptions raised while iterating (or awaiting) are logged as
+    the call's and closing a generator early isn't an exception.
+
     Parameters
     ----------
 
@@ -41,35 +63,68 @@ def log(prefix = ''):
         prefix, function = '', prefix
 
     def _(function):
-        @functools.wraps(function, assigned = functools.WRAPPER_ASSIGNMENTS + ( '__file__', ))
-        def wrapper(*args, **kwargs):
-            name, my_args = function.__name__, args
-
-            if inspect.ismethod(function):
-                name = function.__self__.__class__.__name__ + '.' + function.__name__
-            elif len(args):
-                members = dict(inspect.getmembers(args[0], predicate = lambda _: inspect.ismethod(_) and _.__name__ == function.__name__))
-                logger.debug('members.keys(): %s', members.keys())
-
-                if len(members):
-                    name, my_args = args[0].__class__.__name__ + '.' + function.__name__, args[1:]
-
-            format_args = (
-                prefix + name,
-                ', '.join(list(map(str, my_args)) + [ ' = '.join(map(str, item)) for item in kwargs.items() ]),
-            )
-
-            logger.info('STARTING: %s(%s)', *format_args)
-
-            try:
-                return function(*args, **kwargs)
-            except:
-                logger.exception('EXCEPTION: %s(%s)', *format_args)
-                raise
-            finally:
-                logger.info('STOPPING: %s(%s)', *format_args)
+        name, method = _log_name(function)
+        name = prefix + name
 
-        return wrapper
+        def format_args(args, kwargs):
+            if method:
+                args = args[1:]
+
+            return name, ', '.join([ _REPR.repr(_) for _ in args ] + [ key + ' = ' + _REPR.repr(value) for key, value in kwargs.items() ])
+
+        def call(args, kwargs, asynchronous = False):
+            logged = logger.isEnabledFor(logging.INFO)
+
+            if not logged and not tracing.active():
+                return None
+
+            return _Call(format_args(args, kwargs), logged, asynchronous)
+
+        def failed(args, kwargs):
+            if logger.isEnabledFor(logging.ERROR):
+                logger.exception('EXCEPTION: %s(%s)', *format_args(args, kwargs))
+
+        if inspect.isgeneratorfunction(function):
+            def wrapper(*args, **kwargs):
+                logged_call = call(args, kwargs, asynchronous = True)
+
+                if logged_call is None:
+                    try:
+                        return ( yield from function(*args, **kwargs) )
+                    except Exception:
+                        failed(args, kwargs)
+                        raise
+
+                with logged_call:
+                    return ( yield from function(*args, **kwargs) )
+        elif inspect.iscoroutinefunction(function):
+            async def wrapper(*args, **kwargs):
+                logged_call = call(args, kwargs, asynchronous = True)
+
+                if logged_call is None:
+                    try:
+                        return await function(*args, **kwargs)
+                    except Exception:
+                        failed(args, kwargs)
+                        raise
+
+                with logged_call:
+                    return await function(*args, **kwargs)
+        else:
+            def wrapper(*args, **kwargs):
+                logged_call = call(args, kwargs)
+
+                if logged_call is None:
+                    try:
+                        return function(*args, **kwargs)
+                    except Exception:
+                        failed(args, kwargs)
+                        raise
+
+                with logged_call:
+                    return function(*args, **kwargs)
+
+        return functools.wraps(function, assigned = functools.WRAPPER_ASSIGNMENTS + ( '__file__', ))(wrapper)
 
     if function is not None:
         _ = _(function)
@@ -77,6 +132,71 @@ def log(prefix = ''):
     return _
 
 
+class _Call(object):
+    '''Context manager logging (and recording a span of) a call for ``log``.
+
+    **Parameters**
+
+    :``format_args``:  the call's name and rendered arguments
+    :``logged``:       whether to log STARTING and STOPPING messages
+    :``asynchronous``: whether the call can be suspended (see
+                       ``torment.tracing.span``)
+
+    '''
+
+    __slots__ = ( 'format_args', 'logged', 'asynchronous', 'span', )
+
+    def __init__(self, format_args: Tuple[str, str], logged: bool, asynchronous: bool = False) -> None:
+        self.format_args = format_args
+        self.logged = logged
+        self.asynchronous = asynchronous
+
+    def __enter__(self) -> None:
+        if self.logged:
+            logger.info('STARTING: %s(%s)', *self.format_args)
+
+        self.span = tracing.span(*self.format_args, asynchronous = self.asynchronous)
+        self.span.__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.span.__exit__(exc_type, exc_value, traceback)
+
+        if exc_type is not None and issubclass(exc_type, Exception):
+            logger.error('EXCEPTION: %s(%s)', *self.format_args, exc_info = ( exc_type, exc_value, traceback, ))
+
+        if self.logged:
+            logger.info('STOPPING: %s(%s)', *self.format_args)
+
+
+def _log_name(function: Callable[..., Any]) -> Tuple[str, bool]:
+    '''Name ``log`` uses for function and whether its first argument is self.
+
+    Bound methods are named by their instance's class; functions defined in a
+    class body (i.e. methods decorated in their class) by their qualified name
+    (without any enclosing function's name) if their first parameter is
+    ``self`` or ``cls``.
+
+    '''
+
+    if inspect.ismethod(function):
+        return function.__self__.__class__.__name__ + '.' + function.__name__, False
+
+    qualname = getattr(function, '__qualname__', function.__name__).rsplit('<locals>.', 1)[-1]
+
+    if '.' not in qualname:
+        return function.__name__, False
+
+    try:
+        parameters = list(inspect.signature(function).parameters)
+    except ( TypeError, ValueError, ):
+        parameters = []
+
+    if not len(parameters) or parameters[0] not in ( 'self', 'cls', ):
+        return function.__name__, False
+
+    return qualname, True
+
+
 def mock(name: str) -> Callable[[Any], None]:
     '''Setup properties indicating status of name mock.
 
@@ -92,37 +212,108 @@ def mock(name: str) -> Callable[[Any], None]:
     Return Value(s)
     ---------------
 
-    True if name is mocked; otherwise, False.  Also, creates a property on the
-    method's self, is_mocked_name, with this value.
+    True if name is mocked; otherwise, False.  Also, records this value for the
+    method's self in the current thread (see ``is_mocked``) so contexts shared
+    between threads don't see each other's mocks.  The ``_is_mocked_<name>``
+    attributes this used to set on self are now read only aliases of that
+    record on ``torment.contexts.TestContext``.
+
+    For contexts with a ``'class'`` ``patch_scope`` (see
+    ``torment.contexts.TestContext``) a successful mock is also recorded for
+    the context's class so later tests of the class don't call the method
+    (and re-patch) again.
 
     '''
 
+    sanitized_name = _sanitize(name)
+
     def _(func):
         @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
-            logger.info('STARTING: mock ' + name)
+            logged = logger.isEnabledFor(logging.INFO)
 
-            is_mocked = False
+            if logged:
+                logger.info('STARTING: mock %s', name)
 
-            sanitized_name = name.replace('.', '_').strip('_')
+            state = _mock_state(self)
 
             if name in self.mocks_mask:
-                logger.info('STOPPING: mock ' + name + '—MASKED')
-            elif getattr(self, '_is_mocked_' + sanitized_name, False):
+                is_mocked = False
+
+                if logged:
+                    logger.info('STOPPING: mock %s—MASKED', name)
+            elif state.get(sanitized_name, False) or sanitized_name in self.__class__.__dict__.get('_torment_class_mocked', ()):
                 is_mocked = True
 
-                logger.info('STOPPING: mock ' + name + '—EXISTS')
+                if logged:
+                    logger.info('STOPPING: mock %s—EXISTS', name)
             else:
                 func(self, *args, **kwargs)
 
                 is_mocked = True
 
-                logger.info('STOPPING: mock ' + name)
+                if getattr(self, 'patch_scope', 'test') == 'class':
+                    _class_mock_state(self.__class__).add(sanitized_name)
+
+                if logged:
+                    logger.info('STOPPING: mock %s', name)
 
-            setattr(self, '_is_mocked_' + sanitized_name, is_mocked)
+            state[sanitized_name] = is_mocked
 
             return is_mocked
 
         return wrapper
 
     return _
+
+
+def is_mocked(context: Any, name: str) -> bool:
+    '''Whether name was mocked (by a ``mock`` decorated method) in this thread.
+
+    Parameters
+    ----------
+
+    :``context``: ``torment.TestContext`` the mock method was called on
+    :``name``:    symbol passed to ``mock``
+
+    Return Value(s)
+    ---------------
+
+    The value the mock method last returned for context in this thread; False
+    if it hasn't been called.
+
+    '''
+
+    return _mock_state(context).get(_sanitize(name), False)
+
+
+def _sanitize(name: str) -> str:
+    '''Key of name in the mock state.'''
+
+    return name.replace('.', '_').strip('_')
+
+
+def _class_mock_state(context_class: type) -> Set[str]:
+    '''Names mocked for context_class with a ``'class'`` ``patch_scope``.'''
+
+    if '_torment_class_mocked' not in vars(context_class):
+        context_class._torment_class_mocked = set()
+
+    return context_class._torment_class_mocked
+
+
+def _mock_state(context: Any) -> Dict[str, bool]:
+    '''Per thread mock state of context (created on first use).
+
+    The state is the current thread's ``__dict__`` of a ``threading.local``
+    kept in context's ``__dict__`` (so each thread running the context has its
+    own dict mapping sanitized names to whether they're mocked).
+
+    '''
+
+    try:
+        local = context.__dict__['_torment_mocked']
+    except KeyError:
+        local = context.__dict__.setdefault('_torment_mocked', threading.local())
+
+    return local.__dict__
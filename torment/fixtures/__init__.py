@@ -12,26 +12,101 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import collections
 import copy
+import csv
 import functools
 import inspect
+import itertools
+import json
+import keyword
 import logging
 import os
 import sys
+import threading
+import types
 import typing  # noqa (use mypy typing)
 import uuid
+import weakref
 
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import Iterable
+from typing import List
+from typing import Set
 from typing import Tuple
 from typing import Union
 
 from torment import decorators
+from torment import helpers
+from torment import snapshots
+from torment import tracing
 
 logger = logging.getLogger(__name__)
 
+_LEAVES = weakref.WeakKeyDictionary()  # type: Dict[type, Dict[type, int]]
+
+_ORDER = weakref.WeakKeyDictionary()  # type: Dict[type, int]
+_COUNTER = itertools.count()
+
+_PRODUCTS = weakref.WeakValueDictionary()  # type: Dict[int, FixtureProduct]
+
+_LOOPS = threading.local()
+
+
+class _class_property(object):
+    '''Read-only property computed from (and cached for) the instance's class.
+
+    For Fixture metadata that only depends on the class (i.e. ``name``): it's
+    computed once per class rather than on every access.
+
+    '''
+
+    def __init__(self, function: Callable[[type], Any]) -> None:
+        self.function = function
+        self.values = weakref.WeakKeyDictionary()  # type: Dict[type, Any]
+
+        functools.update_wrapper(self, function)
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+
+        cls = type(instance)
+
+        try:
+            return self.values[cls]
+        except KeyError:
+            self.values[cls] = self.function(cls)
+
+        return self.values[cls]
+
+
+def _index(cls: type) -> None:
+    '''Add cls to the leaves of itself and its Fixture ancestors.'''
+
+    for ancestor in cls.__mro__:
+        if ancestor in _LEAVES:
+            _LEAVES[ancestor][cls] = _ORDER[cls]
+
+
+def _unindex(cls: type) -> None:
+    '''Remove cls from the leaves of itself and its Fixture ancestors.'''
+
+    for ancestor in cls.__mro__:
+        if ancestor in _LEAVES:
+            _LEAVES[ancestor].pop(cls, None)
+
+
+def _reindex(bases: Tuple[type, ...]) -> None:
+    '''Index the bases of a collected Fixture class that are leaves again.'''
+
+    for base in bases:
+        if base in _LEAVES and not len(type.__subclasses__(base)):
+            _index(base)
+
 
 class Fixture(object):
     '''Collection of data and actions for a particular test case.
@@ -139,6 +214,14 @@ class Fixture(object):
     * ``run (required)``
     * ``setup``
 
+    **Class Variables**
+
+    :``concurrent``: whether this Fixture can run alongside other Fixtures in
+                     the same process (see
+                     ``torment.runners.ThreadedTestRunner``); set to False for
+                     Fixtures that modify shared state (i.e. module globals).
+                     Fixtures with ``mocks`` are never run concurrently.
+
     **Instance Variables**
 
     :``context``: the ``torment.TestContext`` this case is running in which
@@ -146,6 +229,28 @@ class Fixture(object):
 
     '''
 
+    concurrent = True
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        '''Index cls as a leaf of itself and its Fixture ancestors (see ``leaves``).
+
+        Its bases are no longer leaves: they're dropped from the index until
+        cls (and any other subclasses of theirs) are garbage collected.
+
+        '''
+
+        super().__init_subclass__(**kwargs)
+
+        _ORDER[cls] = next(_COUNTER)
+        _LEAVES[cls] = weakref.WeakKeyDictionary()
+
+        for base in cls.__bases__:
+            _unindex(base)
+
+        _index(cls)
+
+        weakref.finalize(cls, _reindex, cls.__bases__).atexit = False
+
     def __init__(self, context: 'torment.TestContext') -> None:
         '''Create Fixture
 
@@ -162,8 +267,24 @@ class Fixture(object):
 
         self.context = context
 
-    @property
-    def category(self) -> str:
+    def __getstate__(self) -> Dict[str, Any]:
+        '''State of the Fixture for pickling.
+
+        The context (a ``unittest.TestCase`` with its mocks) and the resolver's
+        exception (with its traceback) stay in this process; an unpickled
+        Fixture's context is ``None``.
+
+        '''
+
+        state = dict(self.__dict__)
+
+        state['context'] = None
+        state.pop('_last_resolver_exception', None)
+
+        return state
+
+    @_class_property
+    def category(cls) -> str:
         '''Fixture's category (the containing testing module name)
 
         **Examples**
@@ -173,21 +294,24 @@ class Fixture(object):
 
         '''
 
-        logger.debug('dir(self.__module__): %s', dir(self.__module__))
-
-        return self.__module__.__name__.rsplit('.', 2)[-2].replace('test_', '')
+        return getattr(cls.__module__, '__name__', cls.__module__).rsplit('.', 2)[-2].replace('test_', '')
 
     @property
     def description(self) -> str:
-        '''Test name in nose output (intended to be overridden).'''
+        '''Test name in nose output (intended to be overridden).
+
+        Only computed when a runner asks for the test's description; format
+        large data with ``torment.helpers.brief`` to keep it short.
+
+        '''
 
         return '{0.uuid.hex}—{1}'.format(self, self.context.module)
 
-    @property
-    def name(self) -> str:
+    @_class_property
+    def name(cls) -> str:
         '''Method name in nose runtime.'''
 
-        return 'test_' + self.__class__.__name__
+        return 'test_' + cls.__name__
 
     def initialize(self) -> None:
         '''Post-data population initialization hook.
@@ -280,47 +404,187 @@ class ErrorFixture(Fixture):
 
         return super().description + ' → {0.error}'.format(self)
 
-    def run(self) -> None:
-        '''Calls sibling with exception expectation.'''
+    def run(self) -> Any:
+        '''Calls sibling with exception expectation.
+
+        A sibling ``run`` that's a coroutine function (i.e. of an
+        ``AsyncFixture``) is awaited inside the expectation: the returned
+        coroutine is awaited by ``AsyncFixture``.
+
+        '''
+
+        if inspect.iscoroutinefunction(super().run):
+            return self._run_async()
 
         with self.context.assertRaises(self.error.__class__) as error:
             super().run()
 
         self.exception = error.exception
 
+    async def _run_async(self) -> None:
+        '''Awaits sibling (a coroutine function) with exception expectation.'''
+
+        with self.context.assertRaises(self.error.__class__) as error:
+            await super().run()
+
+        self.exception = error.exception
+
+
+class AsyncFixture(Fixture):
+    '''Fixture whose actions (setup, run, check) may be coroutines.
+
+    Actions are awaited on this thread's event loop which is created once and
+    shared by every AsyncFixture (rather than an event loop per Fixture as
+    ``asyncio.run`` in ``run`` would).  Contexts with an ``async_concurrency``
+    run their AsyncFixtures as a batch (see ``execute_concurrently``) so the
+    Fixtures' awaits overlap.
+
+    **Examples**
+
+    .. code-block:: python
+
+       class FetchFixture(AsyncFixture):
+           async def run(self):
+               self.result = await fetch(self.parameters['url'])
+
+           def check(self):
+               self.context.assertEqual(self.result, self.expected)
+
+    '''
+
+    def _execute(self) -> None:
+        '''Run Fixture actions (setup, run, check) on this thread's event loop.'''
+
+        _event_loop().run_until_complete(self._execute_async())
+
+    async def _execute_async(self) -> None:
+        '''Run Fixture actions (setup, run, check) awaiting those that are coroutines.'''
+
+        if hasattr(self, '_last_resolver_exception'):
+            logger.warning('last exception from %s.%s:', self.__class__.__name__, self._last_resolver_exception[0], exc_info = self._last_resolver_exception[1])
+
+        for action in ( self.setup, self.run, self.check, ):
+            result = action()
+
+            if inspect.isawaitable(result):
+                await result
+
+
+_ORDER[Fixture] = next(_COUNTER)
+_LEAVES[Fixture] = weakref.WeakKeyDictionary()
+
+_index(Fixture)
+
 
 @decorators.log
-def of(fixture_classes: Iterable[type], context: Union[None, 'torment.TestContext'] = None) -> Iterable['torment.fixtures.Fixture']:
+def of(fixture_classes: Iterable[type], context: Union[None, 'torment.TestContext'] = None, shard: Union[None, str, Tuple[int, int]] = None) -> Iterable['torment.fixtures.Fixture']:
     '''Obtain all Fixture objects of the provided classes.
 
     **Parameters**
 
     :``fixture_classes``: classes inheriting from ``torment.fixtures.Fixture``
     :``context``:         a ``torment.TestContext`` to initialize Fixtures with
+    :``shard``:           only Fixtures in this shard (see ``classes_of``)
 
     **Return Value(s)**
 
-    Instantiated ``torment.fixtures.Fixture`` objects for each individual
-    fixture class that inherits from one of the provided classes.
+    Generator of instantiated ``torment.fixtures.Fixture`` objects for each
+    class ``classes_of`` finds.
 
     '''
 
-    classes = list(copy.copy(fixture_classes))
-    fixtures = []  # type: Iterable[torment.fixtures.Fixture]
+    for fixture_class in classes_of(fixture_classes, shard = shard):
+        yield fixture_class(context)
 
-    while len(classes):
-        current = classes.pop()
-        subclasses = current.__subclasses__()
 
-        if len(subclasses):
-            classes.extend(subclasses)
-        elif current not in fixture_classes:
-            fixtures.append(current(context))
+def classes_of(fixture_classes: Iterable[type], shard: Union[None, str, Tuple[int, int]] = None) -> Iterable[type]:
+    '''Obtain all Fixture classes of the provided classes (without instantiating them).
+
+    **Parameters**
+
+    :``fixture_classes``: classes inheriting from ``torment.fixtures.Fixture``
+    :``shard``:           only classes in this shard: ``'k/n'`` or ``( k, n, )``
+                          for the k-th (from 1) of n shards (see
+                          ``shard_of``); defaults to the ``TORMENT_SHARD``
+                          environment variable (all classes if unset)
+
+    **Return Value(s)**
+
+    Generator of each individual fixture class (see ``leaves``) that inherits
+    from one of the provided classes (Fixtures of a ``FixtureProduct`` are only
+    available through ``products``).
+
+    '''
+
+    shard = _shard(shard)
+
+    excluded = set(fixture_classes).union(*[ _.base_classes for _ in list(_PRODUCTS.values()) ])
+    found = set()  # type: Set[type]
+
+    for fixture_class in fixture_classes:
+        for leaf in _leaves(fixture_class):
+            if leaf not in excluded and leaf not in found and '_torment_product' not in vars(leaf):
+                found.add(leaf)
+
+                if shard is None or shard_of(_class_uuid(leaf), shard[1]) == shard[0]:
+                    yield leaf
+
+
+def leaves(base: type) -> Iterable[type]:
+    '''Obtain the Fixture classes without subclasses that inherit from base.
+
+    Uses the index of leaves ``torment.fixtures.Fixture`` maintains as it's
+    subclassed (rather than walking ``__subclasses__``); thus, the cost is
+    proportional to the number of leaves returned rather than the number of
+    classes inheriting from base.
+
+    **Parameters**
+
+    :``base``: a class inheriting from ``torment.fixtures.Fixture``
+
+    **Return Value(s)**
+
+    Generator of the classes (in the order they were created) inheriting from
+    base that have no subclasses (base itself if it has none).
+
+    '''
+
+    for cls, _ in sorted(list(_LEAVES[base].items()), key = lambda _: _[1]):
+        yield cls
+
+
+def shard_of(fixture_uuid: uuid.UUID, count: int) -> int:
+    '''Shard (from 1) of count shards the Fixture with fixture_uuid belongs to.
+
+    Uses a jump consistent hash of the UUID: the assignment of a Fixture
+    doesn't depend on any other Fixture and, when count grows, only the Fixtures
+    moving to the new shards change shards.
+
+    **Parameters**
+
+    :``fixture_uuid``: UUID of the Fixture
+    :``count``:        number of shards
+
+    **Return Value(s)**
+
+    The Fixture's shard (between 1 and count).
+
+    '''
+
+    key = ( fixture_uuid.int ^ fixture_uuid.int >> 64 ) & 0xFFFFFFFFFFFFFFFF
+
+    bucket, candidate = -1, 0
+
+    while candidate < count:
+        bucket = candidate
+
+        key = ( key * 2862933555777941757 + 1 ) & 0xFFFFFFFFFFFFFFFF
+        candidate = int(( bucket + 1 ) * ( float(1 << 31) / float(( key >> 33 ) + 1) ))
 
-    return fixtures
+    return bucket + 1
 
 
-def register(namespace, base_classes: Tuple[type], properties: Dict[str, Any]) -> None:
+def register(namespace, base_classes: Tuple[type], properties: Dict[str, Any], module: Union[None, str, types.ModuleType] = None, uuid: Union[None, str, 'uuid.UUID'] = None, lazy: bool = False) -> None:
     '''Register a Fixture class in namespace with the given properties.
 
     Creates a Fixture class (not object) and inserts it into the provided
@@ -335,24 +599,44 @@ def register(namespace, base_classes: Tuple[type], properties: Dict[str, Any]) -
     track the Fixture through the test suite and allow Fixtures to scale without
     concern.
 
+    The calling module and its file name are found by looking at the caller's
+    frame directly (constant time regardless of stack depth or the number of
+    loaded modules).  Passing both ``module`` and ``uuid`` skips this
+    introspection entirely.
+
     **Parameters**
 
     :``namespace``:    dictionary to insert the generated class into
     :``base_classes``: list of classes the new class should inherit
     :``properties``:   dictionary of properties with their values
+    :``module``:       module (or module name) the Fixture belongs to; defaults
+                       to the calling module
+    :``uuid``:         UUID (or its hex string) of the Fixture; defaults to the
+                       UUID in the calling file's (or ``module``'s) name
+    :``lazy``:         compute function and class properties on first access
+                       (and only once) rather than when the Fixture is created
 
     Properties can have the following forms:
 
-    :functions: invoked with the Fixture as it's argument
+    :functions: invoked with the Fixture as it's argument (a stand-in that
+                resolves the properties it reads first; ``self.__class__``
+                and ``isinstance`` see the Fixture's class but ``type(self)``
+                doesn't)
     :classes:   instantiated without any arguments (unless it subclasses
                 ``torment.fixtures.Fixture`` in which case it's passed context)
     :literals:  any standard python type (i.e. int, str, dict)
 
     .. note::
         function execution may error (this will be emitted as a logging event).
-        functions will continually be tried until they resolve or the same set
-        of functions is continually erroring.  These functions that failed to
-        resolve are left in tact for later processing.
+        functions are evaluated once each in dependency order (the properties a
+        function reads are resolved before it); circular references are
+        reported as such.  These functions that failed to resolve are left in
+        tact for later processing.
+
+    .. note::
+        with ``lazy``, functions and classes are evaluated when the property is
+        first accessed instead (errors are raised from that access).  Function
+        results aren't copied unless the function is marked with ``mutable``.
 
     Properties by the following names also have defined behavior:
 
@@ -369,233 +653,1208 @@ def register(namespace, base_classes: Tuple[type], properties: Dict[str, Any]) -
 
     '''
 
-    # ensure we have a clean copy of the data
-    # and won't stomp on re-uses elsewhere in
-    # someone's code
-    props = copy.deepcopy(properties)
+    module, my_uuid = _origin(module, uuid)
 
-    desc = props.pop('description', None)  # type: Union[str, None]
+    with tracing.span('register', my_uuid.hex):
+        # ensure we have a clean copy of the data
+        # and won't stomp on re-uses elsewhere in
+        # someone's code
+        props = copy.deepcopy(properties)
 
-    caller_frame = inspect.stack()[1]
+        _register(namespace, base_classes, props, module, my_uuid, _unique_class_name(namespace, my_uuid), lazy)
 
-    caller_file = caller_frame[1]
-    caller_module = inspect.getmodule(caller_frame[0])
 
-    my_uuid = uuid.UUID(os.path.basename(caller_file).replace('.py', '').rsplit('_', 1)[-1])
-    class_name = _unique_class_name(namespace, my_uuid)
+def register_many(namespace, base_classes: Tuple[type], properties: Iterable[Dict[str, Any]], module: Union[None, str, types.ModuleType] = None, uuid: Union[None, str, 'uuid.UUID'] = None, lazy: bool = False) -> None:
+    '''Register a Fixture class in namespace for each of the given properties.
 
-    @property
-    def description(self) -> str:
-        _ = super(self.__class__, self).description
+    Equivalent to calling ``register`` once per properties dictionary but
+    intended for fixtures generated in a loop inside a single module.  The
+    caller's module and UUID are resolved once for the whole batch and class
+    names are assigned from a counter rather than probed for each fixture.  As
+    with ``register``, each properties dictionary is copied on its own (structure
+    shared between the given dictionaries isn't shared between the registered
+    fixtures).
 
-        if desc is not None:
-            _ += '—' + desc
+    Each Fixture's UUID is derived deterministically from the module's UUID and
+    the Fixture's position in the module (the same position that numbers its
+    class name).
 
-        return _
+    **Parameters**
 
-    def __init__(self, context: 'torment.TestContext') -> None:
-        super(self.__class__, self).__init__(context)
+    :``namespace``:    dictionary to insert the generated classes into
+    :``base_classes``: list of classes the new classes should inherit
+    :``properties``:   iterable of dictionaries of properties with their values
+                       (as described in ``register``)
+    :``module``:       module (or module name) the Fixtures belong to; defaults
+                       to the calling module
+    :``uuid``:         UUID (or its hex string) the Fixtures' UUIDs are derived
+                       from; defaults to the UUID in the calling file's (or
+                       ``module``'s) name
+    :``lazy``:         compute function and class properties on first access
+                       (as described in ``register``)
 
-        functions = {}
+    **Examples**
 
-        for name, value in props.items():
-            if name == 'error':
-                self.error = value['class'](*value.get('args', ()), **value.get('kwargs', {}))
-                continue
+    .. code-block:: python
 
-            if inspect.isclass(value):
-                if issubclass(value, Fixture):
-                    value = value(self.context)
-                else:
-                    value = value()
+       register_many(globals(), ( AddFixture, ), ( {
+           'parameters': { 'x': x, 'y': y, },
+           'expected': x + y,
+       } for x, y in itertools.product(range(10), repeat = 2) ))
 
-            if inspect.isfunction(value):
-                functions[name] = value
-                continue
+    '''
 
-            setattr(self, name, value)
+    module, my_uuid = _origin(module, uuid)
 
-        _resolve_functions(functions, self)
+    with tracing.span('register_many', my_uuid.hex):
+        for ( count, class_name, ), props in zip(_class_names(namespace, my_uuid), properties):
+            _register(namespace, base_classes, copy.deepcopy(props), module, _derive_uuid(my_uuid, count), class_name, lazy)
 
-        self.initialize()
 
-    def setup(self) -> None:
-        if hasattr(self, 'mocks'):
-            logger.debug('self.mocks: %s', self.mocks)
+def register_product(namespace, base_classes: Tuple[type], properties: Dict[str, Any], axes: Iterable[Dict[str, Tuple]], module: Union[None, str, types.ModuleType] = None, uuid: Union[None, str, 'uuid.UUID'] = None, lazy: bool = False) -> 'FixtureProduct':
+    '''Register a parametric family of Fixtures (one per combination of axes).
 
-            for mock_symbol, mock_result in self.mocks.items():
-                if _find_mocker(mock_symbol, self.context)():
-                    _prepare_mock(self.context, mock_symbol, **mock_result)
+    Equivalent to registering ``helpers.merge(properties, …)`` with every
+    combination of ``helpers.evert(axes)`` merged in, but nothing is generated
+    up front: the Fixture class for a combination is created when that
+    combination's test case is described or run.  ``torment.contexts.MetaContext``
+    generates a test case per combination (in the order ``helpers.evert``
+    produces them) for contexts whose ``fixture_classes`` include a class the
+    family inherits.
 
-        super(self.__class__, self).setup()
+    The name and UUID of the Fixture for the i-th combination are derived from
+    the family's (as ``register_many`` does).
 
-    namespace[class_name] = type(class_name, base_classes, {
-        'description': description,
-        '__init__': __init__,
-        '__module__': caller_module,
-        'setup': setup,
-        'uuid': my_uuid,
-    })
+    **Parameters**
 
+    :``namespace``:    dictionary to insert the family and its generated classes
+                       into
+    :``base_classes``: list of classes the generated classes should inherit
+    :``properties``:   dictionary of properties shared by the family (as
+                       described in ``register``)
+    :``axes``:         list of dictionaries mapping a property to a tuple of its
+                       choices (as accepted by ``helpers.evert``); dictionary
+                       choices are merged into the property
+    :``module``:       module (or module name) the Fixtures belong to; defaults
+                       to the calling module
+    :``uuid``:         UUID (or its hex string) the Fixtures' UUIDs are derived
+                       from; defaults to the UUID in the calling file's (or
+                       ``module``'s) name
+    :``lazy``:         compute function and class properties on first access
+                       (as described in ``register``)
 
-def _prepare_mock(context: 'torment.contexts.TestContext', symbol: str, return_value = None, side_effect = None) -> None:
-    '''Sets return value or side effect of symbol's mock in context.
+    **Return Value(s)**
 
-    .. seealso:: :py:func:`_find_mocker`
+    The registered ``FixtureProduct``.
+
+    **Examples**
+
+    .. code-block:: python
+
+       register_product(globals(), ( AddFixture, ), { 'expected': … }, [
+           { 'parameters': tuple({ 'x': _, } for _ in range(1000)), },
+           { 'mocks': ( {}, { 'random.random': { 'return_value': 0.5, }, }, ), },
+       ])
+
+    '''
+
+    module, my_uuid = _origin(module, uuid)
+
+    class_name = _unique_class_name(namespace, my_uuid)
+
+    with tracing.span('register_product', my_uuid.hex):
+        product = FixtureProduct(namespace, tuple(base_classes), copy.deepcopy(properties), list(axes), module, my_uuid, class_name, lazy)
+
+    namespace[class_name] = product
+    _PRODUCTS[id(product)] = product
+
+    return product
+
+
+def products(fixture_classes: Iterable[type]) -> Iterable['FixtureProduct']:
+    '''Obtain all registered FixtureProducts of the provided classes.
 
     **Parameters**
 
-    :``context``:       the search context
-    :``symbol``:        the symbol to be located
-    :``return_value``:  pass through to mock ``return_value``
-    :``side_effect``:   pass through to mock ``side_effect``
+    :``fixture_classes``: classes inheriting from ``torment.fixtures.Fixture``
+
+    **Return Value(s)**
+
+    ``torment.fixtures.FixtureProduct`` objects whose Fixtures inherit from one
+    of the provided classes (only those still referenced, i.e. by the namespace
+    they were registered in).
 
     '''
 
-    methods = symbol.split('.')
-    index = len(methods)
+    fixture_classes = tuple(fixture_classes)
 
-    mock = None
+    return [ _ for _ in list(_PRODUCTS.values()) if any(issubclass(base, fixture_classes) for base in _.base_classes) ]
 
-    while index > 0:
-        name = 'mocked_' + '_'.join(methods[:index]).lower()
-        logger.debug('name: %s', name)
 
-        if hasattr(context, name):
-            mock = getattr(context, name)
-            break
+class FixtureProduct(object):
+    '''Parametric family of Fixtures registered by ``register_product``.
 
-        index -= 1
+    A sequence of Fixture classes (one per combination of its axes) created on
+    first access.
 
-    logger.debug('mock: %s', mock)
+    **Instance Variables**
 
-    if mock is not None:
-        mock = functools.reduce(getattr, methods[index:], mock)
-        logger.debug('mock: %s', mock)
+    :``base_classes``: classes the generated classes inherit
+    :``uuid``:         UUID the Fixtures' UUIDs are derived from
 
-        if return_value is not None:
-            mock.return_value = return_value
+    '''
 
-        if side_effect is not None:
-            mock.side_effect = side_effect
+    def __init__(self, namespace, base_classes: Tuple[type], properties: Dict[str, Any], axes: List[Dict[str, Tuple]], module: types.ModuleType, my_uuid: uuid.UUID, class_name: str, lazy: bool = False) -> None:
+        self.namespace = namespace
+        self.base_classes = base_classes
+        self.properties = properties
+        self.axes = axes
+        self.module = module
+        self.uuid = my_uuid
+        self.class_name = class_name
+        self.lazy = lazy
 
+        self._length = helpers.evert_count(axes)
 
-def _find_mocker(symbol: str, context: 'torment.contexts.TestContext') -> Callable[[], bool]:
-    '''Find method within the context that mocks symbol.
+    def __len__(self) -> int:
+        return self._length
 
-    Given a symbol (i.e. ``tornado.httpclient.AsyncHTTPClient.fetch``), find
-    the shortest ``mock_`` method that resembles the symbol. Resembles means
-    the lowercased and periods replaced with underscores.
+    def __getitem__(self, index: int) -> type:
+        '''Fixture class of the combination at index (created if necessary).'''
 
-    If no match is found, a dummy function (only returns False) is returned.
+        index = range(self._length)[index]
+        class_name = self.name(index)[len('test_'):]
 
-    **Parameters**
+        if class_name not in self.namespace:
+            props = self.properties
 
-    :``symbol``:  the symbol to be located
-    :``context``: the search context
+            for _ in helpers.evert_at(self.axes, index):
+                props = helpers.merge(props, _)
 
-    **Return Value(s)**
+            if props is self.properties:
+                props = copy.deepcopy(props)
 
-    The method used to mock the symbol.
+            _register(self.namespace, self.base_classes, props, self.module, self.uuid_of(index), class_name, self.lazy, '{0}.{1}'.format(self.class_name, index))
 
-    **Examples**
+            self.namespace[class_name]._torment_product = self
 
-    Assuming the symbol is ``tornado.httpclient.AsyncHTTPClient.fetch``, the
-    first of the following methods would be returned:
+        return self.namespace[class_name]
 
-    * ``mock_tornado``
-    * ``mock_tornado_httpclient``
-    * ``mock_tornado_httpclient_asynchttpclient``
-    * ``mock_tornado_httpclient_asynchttpclient_fetch``
+    def __getattr__(self, name: str) -> type:
+        '''Fixture class of the combination whose index is name.
 
-    '''
+        Generated classes are qualified by their family (i.e. ``f_<uuid>.4``)
+        so pickle can find a class in a process that hasn't created it yet.
 
-    components = []
-    method = None
+        '''
 
-    for component in symbol.split('.'):
-        components.append(component.lower())
-        name = '_'.join([ 'mock' ] + components)
+        if not name.isdigit():
+            raise AttributeError(name)
 
-        if hasattr(context, name):
-            method = getattr(context, name)
-            break
+        return self[int(name)]
 
-    if method is None:
-        logger.warn('no mocker for %s', symbol)
+    def indices(self, shard: Union[None, str, Tuple[int, int]] = None) -> Iterable[int]:
+        '''Indices of the combinations (only those in shard; see ``classes_of``).'''
 
-        def noop(*args, **kwargs):
-            return False
+        shard = _shard(shard)
 
-        method = noop
+        for index in range(self._length):
+            if shard is None or shard_of(self.uuid_of(index), shard[1]) == shard[0]:
+                yield index
 
-    return method
+    def uuid_of(self, index: int) -> uuid.UUID:
+        '''UUID of the combination at index (without creating it).'''
 
+        return _derive_uuid(self.uuid, index)
 
-def _resolve_functions(functions: Dict[str, Callable[[Any], Any]], fixture: Fixture) -> None:
-    '''Apply functions and collect values as properties on fixture.
+    def name(self, index: int) -> str:
+        '''Test method name of the combination at index (without creating it).'''
+
+        return 'test_{0}__{1}'.format(self.class_name, index)
+
+    def fixture(self, index: int, context: 'torment.TestContext') -> Fixture:
+        '''Fixture object of the combination at index.'''
+
+        return self[index](context)
+
+
+def load(namespace, path: str, classes: Dict[str, type], base_classes: Tuple[type] = (), module: Union[None, str, types.ModuleType] = None, lazy: bool = False) -> None:
+    '''Register a Fixture class in namespace for each row of a data file.
 
-    Call functions and apply their values as properteis on fixture.
-    Functions will continue to get applied until no more functions resolve.
-    All unresolved functions are logged and the last exception to have
-    occurred is also logged.  This function does not return but adds the
-    results to fixture directly.
+    Data-heavy suites can keep their fixtures in a single JSON Lines
+    (``.jsonl``, one JSON object per line) or CSV (``.csv``, one fixture per row
+    after a header row) file rather than a python module per fixture.  The file
+    is read and registered row by row (it's never loaded as a whole).
+
+    Every row must provide its Fixture's UUID in a ``uuid`` field and can name
+    the classes its Fixture inherits in a ``bases`` field (a list of names in
+    JSON Lines and whitespace separated names in CSV) which are looked up in
+    classes.  The remaining fields are the Fixture's properties (as described in
+    ``register`` but limited to what the format can express).  CSV cells are
+    decoded as JSON when possible (otherwise kept as strings) and empty cells
+    are omitted.
 
     **Parameters**
 
-    :``functions``: dict mapping function names (property names) to
-                    callable functions
-    :``fixture``:   Fixture to add values to
+    :``namespace``:    dictionary to insert the generated classes into
+    :``path``:         JSON Lines or CSV file to load (by extension)
+    :``classes``:      dictionary mapping the names used in ``bases`` to classes
+                       (i.e. ``globals()`` of the calling module)
+    :``base_classes``: list of classes inherited by Fixtures without ``bases``
+    :``module``:       module (or module name) the Fixtures belong to; defaults
+                       to the calling module
+    :``lazy``:         compute class properties on first access (as described
+                       in ``register``)
+
+    **Examples**
+
+    .. code-block:: python
+
+       # add_fixtures.jsonl:
+       # { "uuid": "38de9ceec5694c96ace90c9ca37e5bcb", "bases": [ "AddFixture" ], "parameters": { "x": 1, "y": 2 }, "expected": 3 }
+
+       load(globals(), os.path.join(os.path.dirname(__file__), 'add_fixtures.jsonl'), globals())
 
     '''
 
-    exc_info = last_function = None
-    function_count = float('inf')
+    if module is None:
+        module = _caller()[1]
+    elif isinstance(module, str):
+        module = sys.modules.get(module, module)
+
+    bases = { None: tuple(base_classes), }  # type: Dict[Union[None, str, Tuple[str, ...]], Tuple[type, ...]]
+
+    for line, row in _rows(path):
+        location = '{0}:{1}'.format(path, line)
 
-    while function_count > len(functions):
-        function_count = len(functions)
+        if 'uuid' not in row:
+            raise ValueError(location + ': fixture without uuid')
 
-        for name, function in copy.copy(functions).items():
+        names = row.pop('bases', None)
+
+        if isinstance(names, str):
+            names = names.split()
+
+        if names is not None:
+            names = tuple(names)
+
+        if names not in bases:
             try:
-                setattr(fixture, name, copy.deepcopy(function(fixture)))
-                del functions[name]
-            except:
-                exc_info = sys.exc_info()
+                bases[names] = tuple(classes[_] for _ in names)
+            except KeyError as error:
+                raise ValueError(location + ': unknown base class ' + str(error)) from error
 
-                logger.debug('name: %s', name)
-                logger.debug('exc_info: %s', exc_info)
+        my_uuid = _as_uuid(row.pop('uuid'))
 
-                last_function = name
+        _register(namespace, bases[names], row, module, my_uuid, _unique_class_name(namespace, my_uuid), lazy)
 
-    if len(functions):
-        logger.warning('unprocessed Fixture properties: %s', ','.join(functions.keys()))
-        logger.warning('last exception from %s.%s:', fixture.name, last_function, exc_info = exc_info)
 
-        setattr(fixture, '_last_resolver_exception', ( last_function, exc_info, ))
+def mutable(function: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    '''Mark a lazy property function's result as needing a private copy.
 
-        for name, function in copy.copy(functions).items():
-            setattr(fixture, name, function)
+    Lazy properties (see ``register``) hand out whatever their function returns.
+    Functions returning data that is shared (i.e. part of another property) and
+    that the Fixture will modify should be marked so the result is deep copied
+    on first access.
 
+    **Parameters**
 
-def _unique_class_name(namespace: Dict[str, Any], uuid: uuid.UUID) -> str:
-    '''Generate unique to namespace name for a class using uuid.
+    :``function``: property function to mark
+
+    **Return Value(s)**
+
+    The marked function.
+
+    **Examples**
+
+    .. code-block:: python
+
+       register(globals(), ( AppendFixture, ), {
+           'parameters': { 'items': [ 1, 2, ], },
+           'items': mutable(lambda self: self.parameters['items']),
+       }, lazy = True)
+
+    '''
+
+    function._torment_mutable = True
+
+    return function
+
+
+def execute_concurrently(batch: Iterable[AsyncFixture], limit: Union[None, int] = None) -> List[Union[None, BaseException]]:
+    '''Execute AsyncFixtures concurrently on this thread's event loop.
 
     **Parameters**
 
-    :``namespace``: the namespace to verify uniqueness against
-    :``uuid``:      the "unique" portion of the name
+    :``batch``:    AsyncFixture objects to execute
+    :``limit``:    maximum number of Fixtures executing at once (unlimited if
+                   ``None``); at least one
 
     **Return Value(s)**
 
-    A unique string (in namespace) using uuid.
+    List with the exception raised by each Fixture (``None`` if it passed) in
+    the order the Fixtures were given.
 
     '''
 
-    count = 0
+    if limit is not None and limit < 1:
+        raise ValueError('invalid limit (expected at least 1): {0!r}'.format(limit))
 
-    name = original_name = 'f_' + uuid.hex
-    while name in namespace:
-        count += 1
-        name = original_name + '_' + str(count)
+    async def execute(fixture: AsyncFixture, semaphore: Union[None, asyncio.Semaphore]) -> None:
+        if semaphore is None:
+            return await fixture._execute_async()
+
+        async with semaphore:
+            return await fixture._execute_async()
+
+    async def gather() -> List[Any]:
+        semaphore = asyncio.Semaphore(limit) if limit is not None else None
+
+        return await asyncio.gather(*[ execute(_, semaphore) for _ in batch ], return_exceptions = True)
+
+    return [ _ if isinstance(_, BaseException) else None for _ in _event_loop().run_until_complete(gather()) ]
+
+
+def _register(namespace, base_classes: Tuple[type], props: Dict[str, Any], module: types.ModuleType, my_uuid: uuid.UUID, class_name: str, lazy: bool = False, qualname: Union[None, str] = None) -> None:
+    '''Create the Fixture class described by props and insert it into namespace.
+
+    .. seealso:: :py:func:`register`
+
+    The generated class holds its data in class attributes (rather than
+    closures) and is named by its module's name and its qualified name so it
+    (and its instances) can be pickled by reference.
 
-    return name
+    **Parameters**
+
+    :``namespace``:    dictionary to insert the generated class into
+    :``base_classes``: list of classes the new class should inherit
+    :``props``:        dictionary of properties with their values (owned by the
+                       generated class)
+    :``module``:       module the Fixture belongs to
+    :``my_uuid``:      UUID of the Fixture
+    :``class_name``:   name of the generated class (unique in namespace)
+    :``lazy``:         turn function and class properties into
+                       ``_LazyProperty`` descriptors
+    :``qualname``:     qualified name of the generated class in its module
+                       (defaults to class_name)
+
+    '''
+
+    cls = type(class_name, base_classes, {
+        '__module__': getattr(module, '__name__', module),
+        '__qualname__': qualname if qualname is not None else class_name,
+        'uuid': my_uuid,
+        '_torment_description': props.pop('description', None),
+        '_torment_properties': props,
+    })
+
+    cls.description = property(functools.partial(_registered_description, owner = cls))
+    cls.setup = functools.partialmethod(_registered_setup, owner = cls)
+
+    if lazy:
+        for name, value in list(props.items()):
+            if name != 'error' and ( inspect.isclass(value) or inspect.isfunction(value) ):
+                setattr(cls, name, _LazyProperty(name, props.pop(name)))
+
+    cls.__init__ = _generate_init(cls, cls._torment_properties)
+
+    namespace[class_name] = cls
+
+
+def _registered_description(self, owner: type) -> str:
+    '''Description of a registered Fixture (with its description property).
+
+    **Parameters**
+
+    :``owner``: the registered class (self's class or one of its bases) the
+                description is for
+
+    '''
+
+    _ = super(owner, self).description
+
+    if owner._torment_description is not None:
+        _ += '—' + owner._torment_description
+
+    return _
+
+
+def _registered_setup(self, owner: type) -> Any:
+    '''Setup of a registered Fixture (prepares its mocks property).
+
+    **Parameters**
+
+    :``owner``: the registered class (self's class or one of its bases) the
+                setup is for
+
+    '''
+
+    if hasattr(self, 'mocks'):
+        logger.debug('self.mocks: %s', self.mocks)
+
+        context_class = type(self.context)
+
+        for mock_symbol, mock_result in self.mocks.items():
+            _mock_plan(context_class, mock_symbol).setup(self.context, **mock_result)
+
+    return super(owner, self).setup()  # a coroutine for AsyncFixtures
+
+
+def _as_uuid(value: Union[str, uuid.UUID]) -> uuid.UUID:
+    '''Convert value to a UUID.
+
+    **Parameters**
+
+    :``value``: a UUID, a UUID's hex string, or a file or module name ending
+                with ``_`` followed by a UUID's hex string (i.e.
+                ``foo_38de9ceec5694c96ace90c9ca37e5bcb.py``)
+
+    **Return Value(s)**
+
+    The corresponding UUID.
+
+    '''
+
+    if isinstance(value, uuid.UUID):
+        return value
+
+    return uuid.UUID(os.path.basename(value).replace('.py', '').rsplit('_', 1)[-1])
+
+
+def _caller(depth: int = 1) -> Tuple[str, types.ModuleType]:
+    '''File name and module of the caller of our caller.
+
+    Unlike ``inspect.stack`` and ``inspect.getmodule``, this only touches the
+    requested frame and looks the module up by name; thus, its cost doesn't
+    depend on the depth of the stack or the number of loaded modules.
+
+    **Parameters**
+
+    :``depth``: number of frames above our caller to look (defaults to our
+                caller's caller)
+
+    **Return Value(s)**
+
+    Tuple of the file name and the module (``None`` if not found) of the frame.
+
+    '''
+
+    frame = sys._getframe(depth + 1)
+
+    return frame.f_code.co_filename, sys.modules.get(frame.f_globals.get('__name__'))
+
+
+def _class_uuid(cls: type) -> uuid.UUID:
+    '''UUID of a Fixture class (derived from its qualified name if it has none).'''
+
+    my_uuid = getattr(cls, 'uuid', None)
+
+    if isinstance(my_uuid, uuid.UUID):
+        return my_uuid
+
+    return uuid.uuid5(uuid.NAMESPACE_URL, getattr(cls.__module__, '__name__', cls.__module__) + '.' + cls.__qualname__)
+
+
+def _derive_uuid(base: uuid.UUID, index: int) -> uuid.UUID:
+    '''Deterministic UUID for the index-th Fixture registered under base.
+
+    **Parameters**
+
+    :``base``:  UUID of the registering module
+    :``index``: position of the Fixture in the registering module
+
+    **Return Value(s)**
+
+    A name-based (version 5) UUID in base's namespace.
+
+    '''
+
+    return uuid.uuid5(base, str(index))
+
+
+def _origin(module: Union[None, str, types.ModuleType], uuid: Union[None, str, uuid.UUID], depth: int = 1) -> Tuple[Union[str, types.ModuleType], uuid.UUID]:
+    '''Module and UUID for fixtures registered by our caller's caller.
+
+    Only introspects the calling frame if module isn't provided.
+
+    **Parameters**
+
+    :``module``: module (or module name) provided to our caller
+    :``uuid``:   UUID (or a string containing it) provided to our caller
+    :``depth``:  number of frames above our caller to find the registering
+                 module in (defaults to our caller's caller)
+
+    **Return Value(s)**
+
+    Tuple of the module (its name if it isn't loaded) and the UUID.
+
+    '''
+
+    if module is None:
+        caller_file, module = _caller(depth + 1)
+
+        if uuid is None:
+            uuid = caller_file
+    elif uuid is None:
+        uuid = getattr(module, '__name__', module)
+
+    if isinstance(module, str):
+        module = sys.modules.get(module, module)
+
+    return module, _as_uuid(uuid)
+
+
+def _generate_init(cls: type, props: Dict[str, Any]) -> Callable[[Fixture, 'torment.TestContext'], None]:
+    '''Generate a specialised ``__init__`` for a registered Fixture class.
+
+    Properties are classified once (when the class is created) and the
+    generated ``__init__`` assigns them in order with straight-line code:
+    literals are assigned directly (snapshots as a copy-on-write snapshot per
+    instance), classes are instantiated, ``error`` is constructed, and functions
+    are handed to ``_resolve_functions`` (only if there are any) before
+    ``initialize`` is called.
+
+    **Parameters**
+
+    :``cls``:   the registered Fixture class the ``__init__`` is for
+    :``props``: dictionary of properties with their values (as described in
+                ``register``)
+
+    **Return Value(s)**
+
+    The generated ``__init__`` function.
+
+    '''
+
+    namespace = {
+        '_cls': cls,
+        '_resolve_functions': _resolve_functions,
+    }  # type: Dict[str, Any]
+
+    lines = [
+        'def __init__(self, context):',
+        '    super(_cls, self).__init__(context)',
+    ]
+
+    functions = {}  # type: Dict[str, Callable[[Any], Any]]
+
+    for index, ( name, value, ) in enumerate(props.items()):
+        symbol = '_' + str(index)
+
+        if name == 'error':
+            namespace[symbol] = value['class']
+            namespace[symbol + '_args'] = tuple(value.get('args', ()))
+            namespace[symbol + '_kwargs'] = dict(value.get('kwargs', {}))
+
+            expression = '{0}(*{0}_args, **{0}_kwargs)'.format(symbol)
+        elif inspect.isclass(value):
+            namespace[symbol] = value
+
+            expression = symbol + ('(self.context)' if issubclass(value, Fixture) else '()')
+        elif inspect.isfunction(value):
+            functions[name] = value
+            continue
+        else:
+            namespace[symbol] = value
+
+            expression = symbol
+
+            if isinstance(value, ( snapshots.MappingSnapshot, snapshots.SequenceSnapshot, )):
+                expression += '.snapshot()'
+
+        if name.isidentifier() and not keyword.iskeyword(name):
+            lines.append('    self.{0} = {1}'.format(name, expression))
+        else:
+            lines.append('    setattr(self, {0!r}, {1})'.format(name, expression))
+
+    if len(functions):
+        namespace['_functions'] = functions
+
+        lines.append('    _resolve_functions(_functions, self)')
+
+    lines.append('    self.initialize()')
+
+    logger.debug('%s.__init__:\n%s', cls.__name__, '\n'.join(lines))
+
+    exec(compile('\n'.join(lines), '<torment.fixtures: {0}.__init__>'.format(cls.__name__), 'exec'), namespace)
+
+    __init__ = namespace['__init__']
+    __init__.__qualname__ = cls.__qualname__ + '.__init__'
+
+    return __init__
+
+
+def _prepare_mock(context: 'torment.contexts.TestContext', symbol: str, return_value = None, side_effect = None) -> None:
+    '''Sets return value or side effect of symbol's mock in context.
+
+    .. seealso:: :py:func:`_find_mocker`
+
+    **Parameters**
+
+    :``context``:       the search context
+    :``symbol``:        the symbol to be located
+    :``return_value``:  pass through to mock ``return_value``
+    :``side_effect``:   pass through to mock ``side_effect``
+
+    '''
+
+    _mock_plan(type(context), symbol).prepare(context, return_value = return_value, side_effect = side_effect)
+
+
+def _find_mocker(symbol: str, context: 'torment.contexts.TestContext') -> Callable[[], bool]:
+    '''Find method within the context that mocks symbol.
+
+    Given a symbol (i.e. ``tornado.httpclient.AsyncHTTPClient.fetch``), find
+    the shortest ``mock_`` method that resembles the symbol. Resembles means
+    the lowercased and periods replaced with underscores.
+
+    If no match is found, a dummy function (only returns False) is returned.
+
+    **Parameters**
+
+    :``symbol``:  the symbol to be located
+    :``context``: the search context
+
+    **Return Value(s)**
+
+    The method used to mock the symbol.
+
+    **Examples**
+
+    Assuming the symbol is ``tornado.httpclient.AsyncHTTPClient.fetch``, the
+    first of the following methods would be returned:
+
+    * ``mock_tornado``
+    * ``mock_tornado_httpclient``
+    * ``mock_tornado_httpclient_asynchttpclient``
+    * ``mock_tornado_httpclient_asynchttpclient_fetch``
+
+    '''
+
+    mocker = _mock_plan(type(context), symbol).mocker
+
+    if mocker is None:
+        def noop(*args, **kwargs):
+            return False
+
+        return noop
+
+    return getattr(context, mocker)
+
+
+class _MockPlan(object):
+    '''Compiled handling of a ``mocks`` entry for a TestContext class.
+
+    The ``mock_`` method for the symbol is looked up once (in the class' index
+    of mockers) and the candidate ``mocked_`` attributes (longest first) are
+    computed once along with the attribute path left to follow below each.
+
+    **Parameters**
+
+    :``symbol``:  the mocked symbol (i.e. ``tornado.httpclient.AsyncHTTPClient.fetch``)
+    :``mockers``: names of the ``mock_`` methods of the TestContext class
+
+    '''
+
+    __slots__ = ( 'symbol', 'mocker', 'targets', )
+
+    def __init__(self, symbol: str, mockers: Set[str]) -> None:
+        components = symbol.split('.')
+
+        self.symbol = symbol
+        self.mocker = None  # type: Union[None, str]
+
+        for index in range(1, len(components) + 1):
+            name = 'mock_' + '_'.join(components[:index]).lower()
+
+            if name in mockers:
+                self.mocker = name
+                break
+
+        if self.mocker is None:
+            logger.warning('no mocker for %s', symbol)
+
+        self.targets = tuple(( 'mocked_' + '_'.join(components[:index]).lower(), tuple(components[index:]), ) for index in range(len(components), 0, -1))  # type: Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+    def setup(self, context: 'torment.contexts.TestContext', return_value = None, side_effect = None) -> None:
+        '''Mock the symbol in context (if it has a mocker) and prepare the mock.'''
+
+        if self.mocker is not None and getattr(context, self.mocker)():
+            self.prepare(context, return_value = return_value, side_effect = side_effect)
+
+    def prepare(self, context: 'torment.contexts.TestContext', return_value = None, side_effect = None) -> None:
+        '''Set return value or side effect of the symbol's mock in context.'''
+
+        for name, path in self.targets:
+            mock = getattr(context, name, _MISSING)
+
+            if mock is not _MISSING:
+                break
+        else:
+            return
+
+        mock = functools.reduce(getattr, path, mock)
+        logger.debug('mock: %s', mock)
+
+        if return_value is not None:
+            mock.return_value = return_value
+
+        if side_effect is not None:
+            mock.side_effect = side_effect
+
+
+_MISSING = object()
+
+_MOCK_PLANS = weakref.WeakKeyDictionary()  # type: Dict[type, Dict[str, _MockPlan]]
+
+
+def _mock_plan(context_class: type, symbol: str) -> _MockPlan:
+    '''Compiled ``_MockPlan`` for symbol in context_class (cached per class).'''
+
+    try:
+        return _MOCK_PLANS[context_class][symbol]
+    except KeyError:
+        pass
+
+    plans = _MOCK_PLANS.setdefault(context_class, {})
+    plans[symbol] = _MockPlan(symbol, _mockers(context_class))
+
+    return plans[symbol]
+
+
+def _mockers(context_class: type) -> Set[str]:
+    '''Names of the ``mock_`` methods of context_class.
+
+    Classes created by ``torment.contexts.MetaContext`` carry this index as
+    ``mockers``; it's computed here for any other class.
+
+    '''
+
+    mockers = vars(context_class).get('mockers')
+
+    if mockers is None:
+        mockers = frozenset(name for name in dir(context_class) if name.startswith('mock_'))
+
+    return mockers
+
+
+class _LazyProperty(object):
+    '''Registered property computed on first access.
+
+    A non-data descriptor: the computed value is stored in the instance's
+    ``__dict__`` under the same name so later reads don't involve the
+    descriptor at all.
+
+    Function values are invoked with the Fixture (deep copying the result only
+    if the function is marked with ``mutable``) and class values are
+    instantiated (with the Fixture's context if the class subclasses
+    ``torment.fixtures.Fixture``).
+
+    '''
+
+    def __init__(self, name: str, value: Union[type, Callable[[Any], Any]]) -> None:
+        self.name = name
+        self.value = value
+
+        self.mutable = getattr(value, '_torment_mutable', False)
+
+    def __get__(self, instance: Fixture, owner: type) -> Any:
+        if instance is None:
+            return self
+
+        resolving = instance.__dict__.setdefault('_lazy_resolving', set())
+
+        if self.name in resolving:
+            raise RuntimeError('circular Fixture properties: {0}'.format(self.name))
+
+        resolving.add(self.name)
+
+        try:
+            if not inspect.isclass(self.value):
+                value = self.value(instance)
+
+                if self.mutable:
+                    value = copy.deepcopy(value)
+            elif issubclass(self.value, Fixture):
+                value = self.value(instance.context)
+            else:
+                value = self.value()
+        finally:
+            resolving.discard(self.name)
+
+        instance.__dict__[self.name] = value
+
+        return value
+
+
+class _LoopOwner(object):
+    '''Holds an event loop for ``_event_loop`` and closes it when collected.
+
+    Only the thread's local storage refers to the owner so the loop is closed
+    when the thread finishes (or at exit for the main thread).
+
+    '''
+
+    __slots__ = ( 'loop', '__weakref__', )
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+
+        weakref.finalize(self, self.loop.close)
+
+
+class _Recorder(object):
+    '''Stand-in for a Fixture passed to property functions while resolving.
+
+    Attribute reads are handed to a reader (so properties that haven't been
+    resolved yet can be resolved on demand and the dependency recorded) and
+    attribute writes go straight through to the Fixture.  The stand-in passes
+    for the Fixture otherwise: ``__class__`` is the Fixture's class (so
+    ``isinstance`` sees the Fixture's class) and the stand-in's own class (see
+    ``_recorder_class``) carries the Fixture class' name.  ``type(self)`` is
+    that stand-in class though; property functions needing the Fixture's class
+    itself should use ``self.__class__``.
+
+    Once its function has been evaluated, the stand-in is detached by
+    ``_Resolver``: closures the function returned that kept it read straight
+    from the Fixture and don't keep the resolver alive.
+
+    '''
+
+    __slots__ = ( '__fixture', '__read', )
+
+    def __init__(self, fixture: Fixture, read: Callable[[str], Any]) -> None:
+        object.__setattr__(self, '_Recorder__fixture', fixture)
+        object.__setattr__(self, '_Recorder__read', read)
+
+    @property
+    def __class__(self) -> type:
+        return type(self.__fixture)
+
+    def __getattr__(self, name: str) -> Any:
+        return self.__read(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.__fixture, name, value)
+
+    def __repr__(self) -> str:
+        return repr(self.__fixture)
+
+
+_RECORDER_CLASSES = weakref.WeakKeyDictionary()  # type: Dict[type, type]
+
+
+def _recorder_class(fixture_class: type) -> type:
+    '''``_Recorder`` subclass named (and qualified) like fixture_class.'''
+
+    try:
+        return _RECORDER_CLASSES[fixture_class]
+    except KeyError:
+        pass
+
+    return _RECORDER_CLASSES.setdefault(fixture_class, type(fixture_class.__name__, ( _Recorder, ), {
+        '__slots__': (),
+        '__module__': fixture_class.__module__,
+        '__qualname__': fixture_class.__qualname__,
+    }))
+
+
+class _Resolver(object):
+    '''Evaluates property functions in dependency order.
+
+    Each function is called with a ``_Recorder`` for the Fixture (which is
+    replaced by the Fixture wherever it appears in the function's result).
+    When a function reads a property that is itself an unresolved function,
+    that function is evaluated first (a depth first topological ordering of the
+    dependency graph discovered while evaluating).  Reading a property that is
+    still being evaluated further up the chain is a cycle.
+
+    **Instance Variables**
+
+    :``dependencies``: dict mapping function names to the set of function names
+                       they read
+    :``cycles``:       list of cycles found (each a list of function names
+                       starting and ending with the same name)
+    :``failures``:     ordered dict mapping failed function names to the
+                       ``sys.exc_info()`` of their failure (root causes first)
+    :``resolved``:     set of successfully resolved function names
+
+    '''
+
+    def __init__(self, functions: Dict[str, Callable[[Any], Any]], fixture: Fixture) -> None:
+        self.functions = functions
+        self.fixture = fixture
+
+        self.dependencies = { name: set() for name in functions }  # type: Dict[str, Set[str]]
+        self.cycles = []  # type: List[List[str]]
+        self.failures = collections.OrderedDict()  # type: Dict[str, Any]
+        self.resolved = set()  # type: Set[str]
+
+        self._evaluated = set()  # type: Set[str]
+        self._stack = []  # type: List[str]
+
+    @property
+    def cyclic(self) -> Set[str]:
+        '''Names of functions that are part of a cycle.'''
+
+        return set().union(*self.cycles)
+
+    def resolve(self, name: str) -> None:
+        '''Evaluate the named function (once) and set its value on the Fixture.'''
+
+        if name in self._evaluated:
+            return
+
+        self._evaluated.add(name)
+        self._stack.append(name)
+
+        recorder = _recorder_class(type(self.fixture))(self.fixture, functools.partial(self._read, name))
+
+        try:
+            value = copy.deepcopy(self.functions[name](recorder), { id(recorder): self.fixture, })
+        except Exception:
+            self.failures[name] = sys.exc_info()
+
+            logger.debug('name: %s', name)
+            logger.debug('exc_info: %s', self.failures[name])
+        else:
+            setattr(self.fixture, name, value)
+            self.resolved.add(name)
+        finally:
+            # closures over the recorder outlive the resolution; stop reading through this resolver
+            object.__setattr__(recorder, '_Recorder__read', functools.partial(getattr, self.fixture))
+
+            self._stack.pop()
+
+    def retry(self, names: Iterable[str]) -> None:
+        '''Forget the outcome of the named functions so they can be resolved again.'''
+
+        for name in names:
+            self._evaluated.discard(name)
+            self.failures.pop(name, None)
+
+    def _read(self, reader: str, name: str) -> Any:
+        '''Read name on behalf of the reader function (resolving it if necessary).'''
+
+        if name in self.functions and name not in self.resolved:
+            self.dependencies[reader].add(name)
+
+            if name in self._stack:
+                cycle = self._stack[self._stack.index(name):] + [ name ]
+
+                if cycle not in self.cycles:
+                    self.cycles.append(cycle)
+
+                raise AttributeError('circular Fixture properties: ' + ' → '.join(cycle))
+
+            self.resolve(name)
+
+            if name in self.failures:
+                raise AttributeError('unresolved Fixture property: ' + name)
+
+        return getattr(self.fixture, name)
+
+
+def _resolve_functions(functions: Dict[str, Callable[[Any], Any]], fixture: Fixture) -> None:
+    '''Apply functions and collect values as properties on fixture.
+
+    Call functions and apply their values as properties on fixture.  Functions
+    are evaluated in dependency order (discovered by recording which properties
+    each function reads) so each is called once.  Dependencies that can't be
+    recorded (i.e. a property read indirectly through a method of the fixture)
+    are handled by retrying failed functions while other functions continue to
+    resolve.
+
+    All unresolved functions are logged (cycles precisely) and the first
+    exception to have occurred is also logged.  This function does not return
+    but adds the results to fixture directly.
+
+    **Parameters**
+
+    :``functions``: dict mapping function names (property names) to
+                    callable functions
+    :``fixture``:   Fixture to add values to
+
+    '''
+
+    resolver = _Resolver(functions, fixture)
+
+    pending = list(functions)
+
+    while len(pending):
+        resolved_count = len(resolver.resolved)
+
+        for name in pending:
+            resolver.resolve(name)
+
+        if not len(resolver.failures):
+            break
+
+        pending = [ name for name in resolver.failures if name not in resolver.cyclic ]
+
+        if len(resolver.resolved) == resolved_count:
+            break
+
+        resolver.retry(pending)
+
+    for cycle in resolver.cycles:
+        logger.warning('circular Fixture properties: %s', ' → '.join(cycle))
+
+    if len(resolver.failures):
+        last_function, exc_info = next(iter(resolver.failures.items()))
+
+        logger.warning('unprocessed Fixture properties: %s', ','.join(resolver.failures.keys()))
+        logger.warning('last exception from %s.%s:', fixture.name, last_function, exc_info = exc_info)
+
+        setattr(fixture, '_last_resolver_exception', ( last_function, exc_info, ))
+
+        for name in resolver.failures.keys():
+            setattr(fixture, name, functions[name])
+
+
+def _rows(path: str) -> Iterable[Tuple[int, Dict[str, Any]]]:
+    '''Stream the rows of a JSON Lines or CSV file (see ``load``).
+
+    **Parameters**
+
+    :``path``: file to read (``.jsonl``, ``.ndjson``, or ``.csv``)
+
+    **Return Value(s)**
+
+    Generator of tuples of line number and row (as a dictionary).
+
+    '''
+
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension not in ( '.jsonl', '.ndjson', '.csv', ):
+        raise ValueError('unsupported fixture file: ' + path)
+
+    with open(path, newline = '', encoding = 'utf-8') as fh:
+        if extension == '.csv':
+            reader = csv.DictReader(fh)
+
+            for row in reader:
+                yield reader.line_num, { key: value if key in ( 'uuid', 'bases', ) else _cell(value) for key, value in row.items() if key is not None and value not in ( None, '', ) }
+        else:
+            for line, text in enumerate(fh, 1):
+                if not text.strip():
+                    continue
+
+                try:
+                    row = json.loads(text)
+                except ValueError as error:
+                    raise ValueError('{0}:{1}: {2}'.format(path, line, error)) from error
+
+                if not isinstance(row, dict):
+                    raise ValueError('{0}:{1}: fixture is not an object'.format(path, line))
+
+                yield line, row
+
+
+def _cell(value: str) -> Any:
+    '''CSV cell decoded as JSON (or the original string if it isn't JSON).'''
+
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    '''This thread's (long-lived) event loop for AsyncFixtures.'''
+
+    owner = getattr(_LOOPS, 'owner', None)
+
+    if owner is None or owner.loop.is_closed():
+        owner = _LOOPS.owner = _LoopOwner()
+
+    return owner.loop
+
+
+def _leaves(base: type) -> Iterable[type]:
+    '''``leaves`` for any class (walking ``__subclasses__`` for unindexed classes).'''
+
+    if base in _LEAVES:
+        yield from leaves(base)
+        return
+
+    classes = [ base ]
+
+    while len(classes):
+        current = classes.pop()
+        subclasses = current.__subclasses__()
+
+        if len(subclasses):
+            classes.extend(subclasses)
+        else:
+            yield current
+
+
+def _shard(shard: Union[None, str, Tuple[int, int]]) -> Union[None, Tuple[int, int]]:
+    '''Parse a shard specification (see ``classes_of``).'''
+
+    if shard is None:
+        shard = os.environ.get('TORMENT_SHARD') or None
+
+        if shard is None:
+            return None
+
+    if isinstance(shard, str):
+        try:
+            shard = tuple(int(_) for _ in shard.split('/'))
+        except ValueError:
+            shard = ()
+
+    if len(shard) != 2 or not 1 <= shard[0] <= shard[1]:
+        raise ValueError('invalid shard (expected k/n with 1 ≤ k ≤ n): {0!r}'.format(shard))
+
+    return tuple(shard)
+
+
+def _unique_class_name(namespace: Dict[str, Any], uuid: uuid.UUID) -> str:
+    '''Generate unique to namespace name for a class using uuid.
+
+    **Parameters**
+
+    :``namespace``: the namespace to verify uniqueness against
+    :``uuid``:      the "unique" portion of the name
+
+    **Return Value(s)**
+
+    A unique string (in namespace) using uuid.
+
+    '''
+
+    return next(_class_names(namespace, uuid))[1]
+
+
+def _class_names(namespace: Dict[str, Any], uuid: uuid.UUID) -> Iterable[Tuple[int, str]]:
+    '''Generate successive unique to namespace names for classes using uuid.
+
+    Names are reserved as they're generated: the counter continues from the
+    last name produced rather than probing from the beginning each time.
+
+    **Parameters**
+
+    :``namespace``: the namespace to verify uniqueness against
+    :``uuid``:      the "unique" portion of the names
+
+    **Return Value(s)**
+
+    Generator of tuples of the counter value and the corresponding name (not
+    yet in namespace).
+
+    '''
+
+    count = 0
+
+    original_name = 'f_' + uuid.hex
+
+    while True:
+        name = original_name if not count else original_name + '_' + str(count)
+
+        if name not in namespace:
+            yield count, name
+
+        count += 1
@@ -12,11 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections.abc
 import copy
+import functools
 import importlib
 import itertools
 import logging
+import operator
 import os
+import reprlib
 import typing  # noqa (use mypy typing)
 
 from typing import Any
@@ -29,6 +33,48 @@ from torment import decorators
 logger = logging.getLogger(__name__)
 
 
+class _Brief(reprlib.Repr):
+    '''``reprlib.Repr`` with limits suited to test descriptions (and snapshots).'''
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.maxlevel = 3
+        self.maxdict = 6
+        self.maxlist = self.maxtuple = self.maxset = self.maxfrozenset = self.maxdeque = self.maxarray = 8
+        self.maxstring = self.maxother = 60
+        self.maxlong = 40
+
+    def repr_MappingSnapshot(self, x, level: int) -> str:
+        return self.repr_dict(x, level)
+
+    def repr_SequenceSnapshot(self, x, level: int) -> str:
+        return self.repr_list(x, level)
+
+
+_BRIEF = _Brief()
+
+
+def brief(value: Any) -> str:
+    '''Length-bounded representation of value.
+
+    Intended for Fixture descriptions: large ``parameters`` or ``expected``
+    structures are abbreviated (with ``...``) rather than formatted in full.
+
+    **Parameters**
+
+    :``value``: value to represent
+
+    **Return Value(s)**
+
+    ``repr(value)`` with deep or long containers and long strings abbreviated.
+
+    '''
+
+    return _BRIEF.repr(value)
+
+
+@decorators.log
 def evert(iterable: Iterable[Dict[str, Tuple]]) -> Iterable[Iterable[Dict[str, Any]]]:
     '''Evert dictionaries with tuples.
 
@@ -63,6 +109,60 @@ def evert(iterable: Iterable[Dict[str, Tuple]]) -> Iterable[Iterable[Dict[str, A
         yield [ dict(( pair, )) for pair in zip(keys, values) ]
 
 
+def evert_count(iterable: Iterable[Dict[str, Tuple]]) -> int:
+    '''Number of combinations ``evert`` produces for iterable.
+
+    **Parameters**
+
+    :``iterable``: list of dictionaries whose values are tuples
+
+    **Return Value(s)**
+
+    The product of the number of choices in each dictionary.
+
+    '''
+
+    return functools.reduce(operator.mul, [ len(*_.values()) for _ in iterable ], 1)
+
+
+def evert_at(iterable: Iterable[Dict[str, Tuple]], index: int) -> Iterable[Dict[str, Any]]:
+    '''The combination at index in ``evert(iterable)``.
+
+    Computes the combination directly (treating index as a mixed radix number
+    whose digits are the choices in each dictionary) rather than generating the
+    combinations before it.
+
+    **Parameters**
+
+    :``iterable``: list of dictionaries whose values are tuples
+    :``index``:    position of the combination (negative counts from the end)
+
+    **Return Value(s)**
+
+    The same list of dictionaries ``evert`` produces at index.
+
+    '''
+
+    iterable = list(iterable)
+    count = evert_count(iterable)
+
+    if index < 0:
+        index += count
+
+    if not 0 <= index < count:
+        raise IndexError('evert index out of range')
+
+    combination = []
+
+    for dictionary in reversed(iterable):
+        ( key, choices, ), = dictionary.items()
+        index, choice = divmod(index, len(choices))
+
+        combination.append({ key: choices[choice], })
+
+    return combination[::-1]
+
+
 def extend(base: Dict[Any, Any], extension: Dict[Any, Any]) -> Dict[Any, Any]:
     '''Extend base by updating with the extension.
 
@@ -75,6 +175,11 @@ def extend(base: Dict[Any, Any], extension: Dict[Any, Any]) -> Dict[Any, Any]:
 
     Resulting dictionary from updating base with extension.
 
+    .. note::
+        base is deep copied but snapshots (see ``torment.snapshots``) in it are
+        copied in constant time (so extending a frozen base shares its
+        structure).
+
     '''
 
     _ = copy.deepcopy(base)
@@ -95,12 +200,17 @@ def merge(base: Dict[Any, Any], extension: Dict[Any, Any]) -> Dict[Any, Any]:
 
     Resulting dictionary from overlaying extension on base.
 
+    .. note::
+        base is deep copied but snapshots (see ``torment.snapshots``) in it are
+        copied in constant time (so merging onto a frozen base shares its
+        structure).
+
     '''
 
     _ = copy.deepcopy(base)
 
     for key, value in extension.items():
-        if isinstance(value, Dict) and key in _:
+        if isinstance(value, collections.abc.Mapping) and key in _:
             _[key] = merge(_[key], value)
         else:
             _[key] = value
@@ -0,0 +1,571 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Test runners that spread a suite's test cases across worker processes.
+
+Every Fixture becomes its own test method (see ``torment.contexts.MetaContext``)
+so a suite of Fixtures is naturally a set of independent test cases.
+``ParallelTestRunner`` sends each test case (identified by its module, context
+class, and method name—which carries the Fixture's UUID) to a worker process.
+The worker imports the context, runs the test case (so its patches and mocks
+only ever exist in that worker), and sends back its outcome, traceback, and
+timing.  The parent replays these into its result which reports the run as
+``unittest.TextTestRunner`` does.
+
+**Examples**
+
+.. code-block:: bash
+
+   python -m torment.runners test_torment
+
+.. code-block:: python
+
+   unittest.main(module = None, argv = [ 'unittest', 'test_torment', ], testRunner = runners.ParallelTestRunner)
+
+'''
+
+import collections
+import concurrent.futures
+import functools
+import importlib
+import logging
+import sys
+import time
+import typing  # noqa (use mypy typing)
+import unittest
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+from typing import Union
+
+from torment import contexts
+
+logger = logging.getLogger(__name__)
+
+
+class ParallelTestRunner(unittest.TextTestRunner):
+    '''``unittest.TextTestRunner`` that runs test cases in worker processes.
+
+    Test cases whose context can't be imported by a worker (i.e. classes defined
+    inside functions) are run in this process after the others.
+
+    **Parameters**
+
+    Same as ``unittest.TextTestRunner`` plus the following keyword arguments:
+
+    :``workers``:   number of worker processes (defaults to the number of CPUs)
+    :``chunksize``: number of test cases (of the same context) sent to a worker
+                    at a time; ``None`` (the default) sends all of a
+                    context's test cases together so its class and module
+                    fixtures run once per worker rather than once per test
+                    case
+
+    **Instance Variables**
+
+    :``timings``: dict mapping test ids to the seconds they took in the last run
+
+    '''
+
+    def __init__(self, *args, workers: Union[None, int] = None, chunksize: Union[None, int] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.workers = workers
+        self.chunksize = chunksize
+
+        self.timings = {}  # type: Dict[str, float]
+
+    def run(self, test: Union[unittest.TestSuite, unittest.TestCase]) -> unittest.TestResult:
+        self.timings.clear()
+
+        return super().run(_PoolSuite(test, self))
+
+    def _executor(self) -> concurrent.futures.Executor:
+        '''Executor the test cases are sent to.'''
+
+        return concurrent.futures.ProcessPoolExecutor(self.workers)
+
+    def _partition(self, tests: Iterable[unittest.TestCase]) -> Tuple[List[unittest.TestCase], List[unittest.TestCase]]:
+        '''Test cases to send to the executor and those to run in this thread.'''
+
+        return _partition(tests, lambda _: _importable(type(_)))
+
+    def _groups(self, tests: List[unittest.TestCase]) -> Iterable[Tuple[Union[None, type], List[unittest.TestCase]]]:
+        '''Test cases sent to the executor together (with their context class
+        if this thread runs its class fixtures).'''
+
+        yield None, tests
+
+    def _submit(self, executor: concurrent.futures.Executor, chunk: List[unittest.TestCase]) -> concurrent.futures.Future:
+        '''Send a chunk of test cases (of the same context) to executor.'''
+
+        return executor.submit(_run, type(chunk[0]).__module__, type(chunk[0]).__qualname__, [ _._testMethodName for _ in chunk ])
+
+
+class ThreadedTestRunner(ParallelTestRunner):
+    '''``ParallelTestRunner`` that runs test cases in threads of this process.
+
+    Intended for I/O-bound Fixtures that spend their time waiting on sockets
+    (i.e. on services started once for the run).  Each test case still has its
+    own context instance.  A context's class fixtures (``setUpClass`` and
+    ``tearDownClass``) run once in this thread around its test cases (and its
+    module's fixtures around consecutive contexts of the module as
+    ``unittest.TestSuite`` runs them) and contexts are run one at a time (their
+    test cases concurrently).
+
+    Only Fixture test cases of ``concurrent`` contexts whose Fixture class is
+    ``concurrent`` and doesn't have ``mocks`` (patches replace module globals
+    for every thread) are run concurrently.  Other test cases (i.e. those of a
+    ``DockerContext``, which start and stop docker-compose's services for each
+    test case) are run in this thread after the others.  Fixtures that
+    ``patch`` directly are run one at a time (see
+    ``torment.contexts.TestContext.patch``).
+
+    **Parameters**
+
+    Same as ``ParallelTestRunner`` (``workers`` is the number of threads) but
+    ``chunksize`` defaults to 1 (class fixtures run once in this thread
+    however the test cases are chunked; smaller chunks let more of them run
+    concurrently).
+
+    '''
+
+    def __init__(self, *args, chunksize: Union[None, int] = 1, **kwargs) -> None:
+        super().__init__(*args, chunksize = chunksize, **kwargs)
+
+    def _executor(self) -> concurrent.futures.Executor:
+        return concurrent.futures.ThreadPoolExecutor(self.workers)
+
+    def _partition(self, tests: Iterable[unittest.TestCase]) -> Tuple[List[unittest.TestCase], List[unittest.TestCase]]:
+        return _partition(tests, _concurrent)
+
+    def _groups(self, tests: List[unittest.TestCase]) -> Iterable[Tuple[Union[None, type], List[unittest.TestCase]]]:
+        groups = collections.OrderedDict()  # type: Dict[type, List[unittest.TestCase]]
+
+        for test in tests:
+            groups.setdefault(type(test), []).append(test)
+
+        yield from groups.items()
+
+    def _submit(self, executor: concurrent.futures.Executor, chunk: List[unittest.TestCase]) -> concurrent.futures.Future:
+        return executor.submit(_run_tests, chunk)
+
+
+class RemoteError(Exception):
+    '''Failure or error (formatted by the worker) replayed in the parent.'''
+
+    def __str__(self) -> str:
+        return self.args[0]
+
+
+class _PoolSuite(object):
+    '''Callable standing in for the suite given to ``ParallelTestRunner.run``.'''
+
+    def __init__(self, test: Union[unittest.TestSuite, unittest.TestCase], runner: ParallelTestRunner) -> None:
+        self.test = test
+        self.runner = runner
+
+    def __call__(self, result: unittest.TestResult) -> unittest.TestResult:
+        remote, local = self.runner._partition(_flatten(self.test))
+
+        tests = { _.id(): _ for _ in remote }
+
+        module, module_set_up = None, False
+
+        with self.runner._executor() as executor:
+            try:
+                for context_class, group in self.runner._groups(remote):
+                    if result.shouldStop:
+                        break
+
+                    if context_class is None:
+                        self._pool(executor, result, tests, group)
+
+                        continue
+
+                    # the class' other test cases run inside the same class fixtures
+                    serial, local = _partition(local, lambda _: type(_) is context_class)
+
+                    # module fixtures bracket consecutive classes of a module (as in unittest.TestSuite)
+                    if context_class.__module__ != module:
+                        if module_set_up:
+                            _module_fixture(result, module, 'tearDownModule')
+
+                        module = context_class.__module__
+                        module_set_up = _module_fixture(result, module, 'setUpModule')
+
+                    if not module_set_up:
+                        continue
+
+                    if _class_fixture(result, context_class, 'setUpClass'):
+                        try:
+                            self._pool(executor, result, tests, group)
+
+                            for test in serial:
+                                if result.shouldStop:
+                                    break
+
+                                test(result)
+                        finally:
+                            _class_fixture(result, context_class, 'tearDownClass')
+            finally:
+                if module_set_up:
+                    _module_fixture(result, module, 'tearDownModule')
+
+        if len(local) and not result.shouldStop:
+            logger.info('running %d test cases locally', len(local))
+
+            unittest.TestSuite(local)(result)
+
+        return result
+
+    def _pool(self, executor: concurrent.futures.Executor, result: unittest.TestResult, tests: Dict[str, unittest.TestCase], group: List[unittest.TestCase]) -> None:
+        '''Run group in executor and replay the outcomes into result.'''
+
+        futures = {}  # type: Dict[concurrent.futures.Future, List[unittest.TestCase]]
+
+        for chunk in _chunks(group, self.runner.chunksize):
+            futures[self.runner._submit(executor, chunk)] = chunk
+
+        for future in concurrent.futures.as_completed(futures):
+            if result.shouldStop:
+                for _ in futures:
+                    _.cancel()
+
+                break
+
+            try:
+                records = future.result()
+            except Exception as error:
+                logger.exception('worker failed running %s', ', '.join(_.id() for _ in futures[future]))
+
+                records = [ ( _.id(), 'error', '{0}: {1}'.format(type(error).__name__, error), None, 0.0, ) for _ in futures[future] ]
+
+            _replay(result, tests, records, self.runner.timings)
+
+
+class _Placeholder(object):
+    '''Stand-in for a test the parent doesn't have (i.e. ``setUpClass``).
+
+    Subtests are also reported through a placeholder (described as the worker
+    described them) so they read the same as they do in a serial run.
+
+    '''
+
+    failureException = None
+
+    def __init__(self, test_id: str, description: Union[None, str] = None) -> None:
+        self.test_id = test_id
+        self.description = description if description is not None else test_id
+
+    def id(self) -> str:
+        return self.test_id
+
+    def shortDescription(self) -> None:
+        return None
+
+    def __str__(self) -> str:
+        return self.description
+
+
+class _RecordingResult(unittest.TestResult):
+    '''``unittest.TestResult`` that records outcomes (picklable) for the parent.
+
+    **Instance Variables**
+
+    :``records``: list of tuples of test id, outcome, formatted exception or
+                  skip reason, subtest description, and seconds taken
+
+    '''
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.records = []  # type: List[Tuple[str, str, Union[None, str], Union[None, str], float]]
+
+        self._started = {}  # type: Dict[str, float]
+
+    def startTest(self, test: unittest.TestCase) -> None:
+        super().startTest(test)
+
+        self._started[test.id()] = time.perf_counter()
+
+    def _record(self, test: Any, outcome: str, detail: Union[None, str] = None, subtest: Union[None, str] = None) -> None:
+        elapsed = time.perf_counter() - self._started.get(test.id(), time.perf_counter())
+
+        self.records.append(( test.id(), outcome, detail, subtest, elapsed, ))
+
+    def addSuccess(self, test: unittest.TestCase) -> None:
+        self._record(test, 'success')
+
+    def addError(self, test: Any, err) -> None:
+        self._record(test, 'error', self._exc_info_to_string(err, test))
+
+    def addFailure(self, test: unittest.TestCase, err) -> None:
+        self._record(test, 'failure', self._exc_info_to_string(err, test))
+
+    def addSkip(self, test: unittest.TestCase, reason: str) -> None:
+        self._record(test, 'skip', reason)
+
+    def addExpectedFailure(self, test: unittest.TestCase, err) -> None:
+        self._record(test, 'expected_failure', self._exc_info_to_string(err, test))
+
+    def addUnexpectedSuccess(self, test: unittest.TestCase) -> None:
+        self._record(test, 'unexpected_success')
+
+    def addSubTest(self, test: unittest.TestCase, subtest: unittest.TestCase, err) -> None:
+        if err is not None:
+            outcome = 'failure' if issubclass(err[0], test.failureException) else 'error'
+
+            self._record(test, outcome, self._exc_info_to_string(err, test), str(subtest))
+
+
+def _chunks(tests: List[unittest.TestCase], size: Union[None, int]) -> Iterable[List[unittest.TestCase]]:
+    '''Consecutive runs of at most size (unlimited if ``None``) test cases of the
+    same context class.'''
+
+    chunk = []  # type: List[unittest.TestCase]
+
+    for test in tests:
+        if len(chunk) and ( ( size is not None and len(chunk) >= size ) or type(chunk[0]) is not type(test) ):
+            yield chunk
+            chunk = []
+
+        chunk.append(test)
+
+    if len(chunk):
+        yield chunk
+
+
+def _class_fixture(result: unittest.TestResult, context_class: type, name: str) -> bool:
+    '''Run a class fixture (``setUpClass`` or ``tearDownClass``) of context_class.
+
+    Reports errors as ``unittest.TestSuite`` does (as errors of a placeholder
+    named after the fixture and class).
+
+    **Return Value(s)**
+
+    Whether the class fixture succeeded (or the class is skipped).
+
+    '''
+
+    if getattr(context_class, '__unittest_skip__', False):
+        return name == 'tearDownClass'
+
+    description = '{0} ({1}.{2})'.format(name, context_class.__module__, context_class.__qualname__)
+
+    try:
+        getattr(context_class, name)()
+    except Exception:
+        result.addError(_Placeholder(description), sys.exc_info())
+
+        succeeded = False
+    else:
+        succeeded = True
+
+    if name == 'tearDownClass' or not succeeded:
+        context_class.doClassCleanups()
+
+        for error in context_class.tearDown_exceptions:
+            result.addError(_Placeholder(description), error)
+
+    return succeeded
+
+
+def _module_fixture(result: unittest.TestResult, module_name: str, name: str) -> bool:
+    '''Run a module fixture (``setUpModule`` or ``tearDownModule``) of module_name.
+
+    Reports errors as ``unittest.TestSuite`` does (as errors of a placeholder
+    named after the fixture and module) and runs the module's cleanups after
+    ``tearDownModule`` (or a failed ``setUpModule``).
+
+    **Return Value(s)**
+
+    Whether the module fixture succeeded.
+
+    '''
+
+    description = '{0} ({1})'.format(name, module_name)
+
+    try:
+        fixture = getattr(sys.modules[module_name], name, None)
+    except KeyError:
+        return True
+
+    succeeded = True
+
+    if fixture is not None:
+        try:
+            fixture()
+        except Exception:
+            result.addError(_Placeholder(description), sys.exc_info())
+
+            succeeded = False
+
+    if name == 'tearDownModule' or not succeeded:
+        try:
+            unittest.case.doModuleCleanups()
+        except Exception:
+            result.addError(_Placeholder(description), sys.exc_info())
+
+    return succeeded
+
+
+def _concurrent(test: unittest.TestCase) -> bool:
+    '''Whether test is a Fixture test case that can run alongside others.'''
+
+    case = contexts._case(test)
+
+    if case is None or not getattr(type(test), 'concurrent', True):
+        return False
+
+    return contexts._concurrent(case.fixture_class)
+
+
+def _flatten(test: Union[unittest.TestSuite, unittest.TestCase]) -> Iterable[unittest.TestCase]:
+    '''Test cases in test (recursively expanding suites).'''
+
+    if isinstance(test, unittest.TestSuite):
+        for _ in test:
+            yield from _flatten(_)
+    else:
+        yield test
+
+
+def _importable(cls: type) -> bool:
+    '''Whether a worker can find cls by its module and qualified name.'''
+
+    if '<locals>' in cls.__qualname__:
+        return False
+
+    try:
+        return functools.reduce(getattr, cls.__qualname__.split('.'), sys.modules[cls.__module__]) is cls
+    except ( AttributeError, KeyError, ):
+        return False
+
+
+def _partition(tests: Iterable[unittest.TestCase], predicate: Callable[[unittest.TestCase], bool]) -> Tuple[List[unittest.TestCase], List[unittest.TestCase]]:
+    '''Test cases that can run in workers (by predicate) and those that must run locally.'''
+
+    remote, local = [], []  # type: Tuple[List[unittest.TestCase], List[unittest.TestCase]]
+
+    for test in tests:
+        if isinstance(test, unittest.TestCase) and predicate(test):
+            remote.append(test)
+        else:
+            local.append(test)
+
+    return remote, local
+
+
+def _replay(result: unittest.TestResult, tests: Dict[str, unittest.TestCase], records: Iterable[Tuple[str, str, Union[None, str], Union[None, str], float]], timings: Dict[str, float]) -> None:
+    '''Report a worker's records to result (in the order they occurred).'''
+
+    started = None
+
+    for test_id, outcome, detail, subtest, elapsed in records:
+        test = tests.get(test_id)
+
+        if test is not started and started is not None:
+            result.stopTest(started)
+            started = None
+
+        if test is None:  # i.e. setUpClass errors (which aren't test runs)
+            test = _Placeholder(test_id)
+        elif test is not started:
+            result.startTest(test)
+            started = test
+
+        timings[test_id] = elapsed
+
+        subject = test if subtest is None else _Placeholder(test_id, subtest)
+
+        if outcome in ( 'error', 'failure', 'expected_failure', ):
+            err = ( RemoteError, RemoteError(detail), None, )
+
+        if outcome == 'success':
+            result.addSuccess(subject)
+        elif outcome == 'error':
+            result.addError(subject, err)
+        elif outcome == 'failure':
+            result.addFailure(subject, err)
+        elif outcome == 'skip':
+            result.addSkip(subject, detail)
+        elif outcome == 'expected_failure':
+            result.addExpectedFailure(subject, err)
+        elif outcome == 'unexpected_success':
+            result.addUnexpectedSuccess(subject)
+
+        if subtest is None and hasattr(result, 'addDuration'):
+            result.addDuration(test, elapsed)
+
+    if started is not None:
+        result.stopTest(started)
+
+
+def _run(module_name: str, qualname: str, method_names: List[str]) -> List[Tuple[str, str, Union[None, str], Union[None, str], float]]:
+    '''Run test cases of a context in this (worker) process.
+
+    **Parameters**
+
+    :``module_name``:  module containing the context
+    :``qualname``:     qualified name of the context in its module
+    :``method_names``: test methods of the context to run
+
+    **Return Value(s)**
+
+    The ``_RecordingResult`` records of the run.
+
+    '''
+
+    context = functools.reduce(getattr, qualname.split('.'), importlib.import_module(module_name))
+
+    recorder = _RecordingResult()
+    unittest.TestSuite([ context(_) for _ in method_names ]).run(recorder)
+
+    return recorder.records
+
+
+def _run_tests(tests: List[unittest.TestCase]) -> List[Tuple[str, str, Union[None, str], Union[None, str], float]]:
+    '''Run test cases (without their class fixtures) in this (worker) thread.
+
+    **Parameters**
+
+    :``tests``: test cases to run
+
+    **Return Value(s)**
+
+    The ``_RecordingResult`` records of the run.
+
+    '''
+
+    recorder = _RecordingResult()
+
+    for test in tests:
+        test.run(recorder)
+
+    return recorder.records
+
+
+def main() -> None:
+    '''``python -m unittest`` with ``ParallelTestRunner``.'''
+
+    unittest.main(module = None, testRunner = ParallelTestRunner)
+
+
+if __name__ == '__main__':
+    main()
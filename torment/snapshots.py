@@ -0,0 +1,335 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Copy-on-write containers for sharing fixture data.
+
+Large ``parameters`` and ``expected`` structures are usually shared by many
+fixtures and rarely modified.  Freezing them once with ``freeze`` produces
+snapshots that share their structure: copying a snapshot (including with
+``copy.deepcopy`` as ``torment.fixtures.register`` and ``torment.helpers``
+do) is constant time, and a level of a snapshot is only copied (shallowly) when
+it's actually modified.
+
+Snapshots behave like the ``dict`` and ``list`` they replace (they compare equal
+to them and have the same ``repr``) with one difference: values stored in a
+snapshot are frozen (so storing a ``dict`` stores a copy of it).
+
+**Examples**
+
+.. code-block:: python
+
+   BASE = snapshots.freeze({
+       'parameters': { … },
+       'expected': { … },
+   })
+
+   for n in range(10000):
+       register(globals(), ( MyFixture, ), helpers.extend(BASE, { 'n': n, }))
+
+'''
+
+import abc
+import collections.abc
+import copy
+import logging
+import typing  # noqa (use mypy typing)
+
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+from typing import Union
+
+logger = logging.getLogger(__name__)
+
+
+class _Snapshot(abc.ABC):
+    '''Common copy-on-write behaviour of ``MappingSnapshot`` and ``SequenceSnapshot``.
+
+    A snapshot's data is either shared (with other snapshots and never modified)
+    or owned (exclusive to this snapshot).  Nested snapshots read from shared
+    data are handed out as snapshots of their own (cached so repeated reads
+    return the same object) while nested snapshots in owned data are handed out
+    directly.
+
+    '''
+
+    __slots__ = ( '_data', '_shared', '_children', )
+
+    @classmethod
+    def _wrap(cls, data: Any) -> '_Snapshot':
+        '''Snapshot sharing data.'''
+
+        _ = cls.__new__(cls)
+
+        _._data = data
+        _._shared = True
+        _._children = {}
+
+        return _
+
+    def snapshot(self) -> '_Snapshot':
+        '''Copy of this snapshot (constant time unless this snapshot was modified).'''
+
+        if self._shared and not len(self._children):
+            return self._wrap(self._data)
+
+        return self._wrap(self._frozen())
+
+    @abc.abstractmethod
+    def _frozen(self) -> Any:
+        '''Shareable copy of the current data.'''
+
+    @abc.abstractmethod
+    def _owned(self) -> Any:
+        '''Exclusive copy of the current (shared) data.'''
+
+    def _current(self, key: Any, value: Any) -> Any:
+        '''Value (from shared data) for key as handed out by this snapshot.'''
+
+        if key in self._children:
+            return self._children[key]
+
+        return _share(value)
+
+    def _own(self) -> None:
+        '''Ensure this snapshot's data isn't shared (prior to modifying it).'''
+
+        if self._shared:
+            self._data = self._owned()
+            self._shared = False
+
+            self._children.clear()
+
+    def _get(self, key: Any) -> Any:
+        '''Value for key (a snapshot of its own if read from shared data).'''
+
+        if not self._shared:
+            return self._data[key]
+
+        if key in self._children:
+            return self._children[key]
+
+        value = self._data[key]
+        shared = _share(value)
+
+        if shared is not value:
+            self._children[key] = shared
+
+        return shared
+
+    def __copy__(self) -> '_Snapshot':
+        return self.snapshot()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> '_Snapshot':
+        return self.snapshot()
+
+    def __reduce__(self) -> Any:
+        return type(self), ( thaw(self), )
+
+
+class MappingSnapshot(_Snapshot, collections.abc.MutableMapping):
+    '''Copy-on-write ``dict``.
+
+    **Parameters**
+
+    Same as ``dict`` (the items are frozen).
+
+    '''
+
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._data = { key: freeze(value) for key, value in dict(*args, **kwargs).items() }
+        self._shared = True
+        self._children = {}
+
+    def _frozen(self) -> Dict[Any, Any]:
+        if self._shared:
+            return { key: _share(self._children[key]) if key in self._children else value for key, value in self._data.items() }
+
+        return { key: _share(value) for key, value in self._data.items() }
+
+    def _owned(self) -> Dict[Any, Any]:
+        return { key: self._current(key, value) for key, value in self._data.items() }
+
+    def __getitem__(self, key: Any) -> Any:
+        return self._get(key)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._own()
+        self._data[key] = _store(value)
+
+    def __delitem__(self, key: Any) -> None:
+        self._own()
+        del self._data[key]
+
+    def __iter__(self) -> Iterable[Any]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class SequenceSnapshot(_Snapshot, collections.abc.MutableSequence):
+    '''Copy-on-write ``list`` (backed by a tuple while shared).
+
+    **Parameters**
+
+    Same as ``list`` (the items are frozen).
+
+    '''
+
+    __slots__ = ()
+
+    def __init__(self, iterable: Iterable[Any] = ()) -> None:
+        self._data = tuple(freeze(value) for value in iterable)
+        self._shared = True
+        self._children = {}
+
+    def _frozen(self) -> Tuple[Any, ...]:
+        if self._shared:
+            return tuple(_share(self._children[index]) if index in self._children else value for index, value in enumerate(self._data))
+
+        return tuple(_share(value) for value in self._data)
+
+    def _owned(self) -> List[Any]:
+        return [ self._current(index, value) for index, value in enumerate(self._data) ]
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return SequenceSnapshot(self._get(_) for _ in range(len(self._data))[index])
+
+        return self._get(range(len(self._data))[index])
+
+    def __setitem__(self, index: Union[int, slice], value: Any) -> None:
+        self._own()
+
+        if isinstance(index, slice):
+            value = [ _store(_) for _ in value ]
+        else:
+            value = _store(value)
+
+        self._data[index] = value
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        self._own()
+        del self._data[index]
+
+    def __iter__(self) -> Iterable[Any]:
+        for index in range(len(self._data)):
+            yield self._get(index)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ( list, SequenceSnapshot, )):
+            return NotImplemented
+
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None
+
+    def insert(self, index: int, value: Any) -> None:
+        self._own()
+        self._data.insert(index, _store(value))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+def freeze(value: Any) -> Any:
+    '''Convert value into snapshots (recursively).
+
+    ``dict`` and ``list`` become ``MappingSnapshot`` and ``SequenceSnapshot``
+    (tuples have their items frozen), existing snapshots are copied (in
+    constant time), and everything else is deep copied.
+
+    **Parameters**
+
+    :``value``: value to freeze
+
+    **Return Value(s)**
+
+    The frozen equivalent of value.
+
+    '''
+
+    if isinstance(value, _Snapshot):
+        return value.snapshot()
+
+    if isinstance(value, dict):
+        return MappingSnapshot._wrap({ key: freeze(_) for key, _ in value.items() })
+
+    if isinstance(value, list):
+        return SequenceSnapshot._wrap(tuple(freeze(_) for _ in value))
+
+    if isinstance(value, tuple) and type(value) is tuple:
+        return tuple(freeze(_) for _ in value)
+
+    return copy.deepcopy(value)
+
+
+def thaw(value: Any) -> Any:
+    '''Convert snapshots in value back into ``dict`` and ``list`` (recursively).
+
+    **Parameters**
+
+    :``value``: value to thaw
+
+    **Return Value(s)**
+
+    The plain equivalent of value (a new object if value contains snapshots).
+
+    '''
+
+    if isinstance(value, MappingSnapshot):
+        return { key: thaw(_) for key, _ in value.items() }
+
+    if isinstance(value, SequenceSnapshot):
+        return [ thaw(_) for _ in value ]
+
+    if isinstance(value, tuple) and type(value) is tuple:
+        return tuple(thaw(_) for _ in value)
+
+    return value
+
+
+def _share(value: Any) -> Any:
+    '''Copy of value that can be handed out without exposing shared snapshots.'''
+
+    if isinstance(value, _Snapshot):
+        return value.snapshot()
+
+    if isinstance(value, tuple) and type(value) is tuple and any(isinstance(_, ( _Snapshot, tuple, )) for _ in value):
+        return tuple(_share(_) for _ in value)
+
+    return value
+
+
+def _store(value: Any) -> Any:
+    '''Value as stored in owned data (snapshots are stored without copying).'''
+
+    if isinstance(value, _Snapshot):
+        return value
+
+    return freeze(value)
@@ -0,0 +1,276 @@
+# Copyright 2015 Alex Brandt
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+'''Timing spans of torment's collection and execution.
+
+Functions decorated with ``torment.decorators.log`` (i.e.
+``torment.helpers.import_directory`` and ``torment.fixtures.of``),
+registration, ``torment.contexts.MetaContext``, and each Fixture's execution
+are recorded as spans (their start, end, thread, nesting depth, and a summary of
+their arguments) when a sink is installed with ``set_sink`` (see ``active``).
+Without a sink, nothing is recorded.
+
+``ChromeTrace`` is a sink that writes the spans in the Chrome trace event format
+(which ``chrome://tracing`` and https://ui.perfetto.dev open as a timeline).
+Setting the ``TORMENT_TRACE`` environment variable to a file name installs one
+when this module is imported and writes it when the process exits (``{pid}``
+in the file name is replaced by the process' ID so worker processes don't
+overwrite each other's traces).
+
+**Examples**
+
+.. code-block:: bash
+
+   TORMENT_TRACE=trace-{pid}.json python -m unittest test_torment
+
+.. code-block:: python
+
+   trace = tracing.ChromeTrace()
+   tracing.set_sink(trace)
+
+   …
+
+   tracing.set_sink(None)
+   trace.write('trace.json')
+
+'''
+
+import atexit
+import collections
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+import typing  # noqa (use mypy typing)
+
+from typing import Any
+from typing import Callable
+from typing import Union
+
+logger = logging.getLogger(__name__)
+
+Span = collections.namedtuple('Span', ( 'name', 'start', 'end', 'thread', 'depth', 'arguments', 'asynchronous', ))
+Span.__new__.__defaults__ = ( False, )
+Span.__doc__ = '''A timed call.
+
+**Fields**
+
+:``name``:         name of the call (i.e. the function's qualified name)
+:``start``:        ``time.perf_counter()`` when the call started
+:``end``:          ``time.perf_counter()`` when the call ended
+:``thread``:       ``threading.get_ident()`` of the calling thread
+:``depth``:        number of spans the call was nested in (in its thread)
+:``arguments``:    summary of the call's arguments
+:``asynchronous``: whether the call can be suspended (i.e. a generator's
+                   iteration or a coroutine); other spans in its thread
+                   don't nest in it (default: ``False``)
+
+'''
+
+_SINK = None  # type: Union[None, Callable[[Span], None]]
+
+_LOCAL = threading.local()
+
+
+def set_sink(sink: Union[None, Callable[[Span], None]]) -> Union[None, Callable[[Span], None]]:
+    '''Send spans to sink (or stop recording spans if sink is ``None``).
+
+    **Parameters**
+
+    :``sink``: callable called (in the span's thread) with each ``Span`` as it
+               ends
+
+    **Return Value(s)**
+
+    The previously installed sink.
+
+    '''
+
+    global _SINK
+
+    previous, _SINK = _SINK, sink
+
+    return previous
+
+
+def active() -> bool:
+    '''Whether a sink is installed (i.e. spans are being recorded).'''
+
+    return _SINK is not None
+
+
+def span(name: str, arguments: str = '', asynchronous: bool = False) -> Any:
+    '''Context manager recording its block as a ``Span``.
+
+    Returns a shared do-nothing context manager when no sink is installed.
+
+    Blocks that can be suspended (i.e. spanning a generator's iteration or a
+    coroutine) must be asynchronous: they don't count towards the depth of the
+    spans started while they're open (which might belong to whatever resumes
+    them or runs while they're suspended).
+
+    **Parameters**
+
+    :``name``:         name of the span
+    :``arguments``:    summary of the span's arguments
+    :``asynchronous``: whether the block can be suspended
+
+    '''
+
+    if _SINK is None:
+        return _NULL
+
+    return _Timer(_SINK, name, arguments, asynchronous)
+
+
+class _Null(object):
+    '''Context manager doing nothing.'''
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL = _Null()
+
+
+class _Timer(object):
+    '''Context manager timing its block for ``span``.'''
+
+    __slots__ = ( 'sink', 'name', 'arguments', 'asynchronous', 'depth', 'start', )
+
+    def __init__(self, sink: Callable[[Span], None], name: str, arguments: str, asynchronous: bool) -> None:
+        self.sink = sink
+        self.name = name
+        self.arguments = arguments
+        self.asynchronous = asynchronous
+
+    def __enter__(self) -> None:
+        self.depth = getattr(_LOCAL, 'depth', 0)
+
+        if not self.asynchronous:
+            _LOCAL.depth = self.depth + 1
+
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        end = time.perf_counter()
+
+        if not self.asynchronous:
+            _LOCAL.depth = self.depth
+
+        self.sink(Span(self.name, self.start, end, threading.get_ident(), self.depth, self.arguments, self.asynchronous))
+
+
+class ChromeTrace(object):
+    '''Sink collecting spans as Chrome trace events.
+
+    Spans become complete (``"ph": "X"``) events of this process (with
+    timestamps in microseconds) and each thread is named by a metadata event.
+    Asynchronous spans (which overlap other spans in their thread rather than
+    nest) become a pair of async begin and end (``"ph": "b"`` and ``"ph": "e"``)
+    events instead.  Safe to share between threads (events are added and
+    dumped under a lock).
+
+    **Instance Variables**
+
+    :``events``: list of the trace events collected
+
+    '''
+
+    def __init__(self) -> None:
+        self.events = []  # type: typing.List[typing.Dict[str, Any]]
+
+        self._threads = set()  # type: typing.Set[int]
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+    def __call__(self, span: Span) -> None:
+        pid = os.getpid()
+
+        with self._lock:
+            if span.thread not in self._threads:
+                self._threads.add(span.thread)
+
+                self.events.append({
+                    'name': 'thread_name',
+                    'ph': 'M',
+                    'pid': pid,
+                    'tid': span.thread,
+                    'args': { 'name': threading.current_thread().name, },
+                })
+
+            if span.asynchronous:
+                identifier = next(self._ids)
+
+                self.events.extend([ {
+                    'name': span.name,
+                    'cat': 'torment',
+                    'ph': phase,
+                    'ts': timestamp * 1e6,
+                    'id': identifier,
+                    'pid': pid,
+                    'tid': span.thread,
+                    'args': { 'arguments': span.arguments, 'depth': span.depth, },
+                } for phase, timestamp in ( ( 'b', span.start, ), ( 'e', span.end, ), ) ])
+
+                return
+
+            self.events.append({
+                'name': span.name,
+                'cat': 'torment',
+                'ph': 'X',
+                'ts': span.start * 1e6,
+                'dur': ( span.end - span.start ) * 1e6,
+                'pid': pid,
+                'tid': span.thread,
+                'args': { 'arguments': span.arguments, 'depth': span.depth, },
+            })
+
+    def dump(self, fp: Any) -> None:
+        '''Write the trace (a JSON object) to the file object fp.'''
+
+        with self._lock:
+            events = list(self.events)
+
+        json.dump({ 'traceEvents': events, 'displayTimeUnit': 'ms', }, fp)
+
+    def write(self, filename: str) -> None:
+        '''Write the trace to filename.'''
+
+        with open(filename, 'w') as fp:
+            self.dump(fp)
+
+
+def _trace_environment() -> None:
+    '''Install a ``ChromeTrace`` written at exit if ``TORMENT_TRACE`` is set.'''
+
+    filename = os.environ.get('TORMENT_TRACE')
+
+    if not filename:
+        return
+
+    trace = ChromeTrace()
+    set_sink(trace)
+
+    atexit.register(lambda: trace.write(filename.replace('{pid}', str(os.getpid()))))
+
+
+_trace_environment()